@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the realtime monitor diff engine.
+
+Builds synthetic asset snapshots, mutates a slice of them and times the
+hash-indexed DiffEngine against the original nested-scan diff.
+
+    python benchmarks/bench_diff.py
+    python benchmarks/bench_diff.py --sizes 10000 50000 100000 --legacy-max 10000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from snipelzy import DiffEngine
+
+
+STATUSES = ['Ready to Deploy', 'Deployed', 'Pending', 'Archived', 'Broken']
+
+
+def make_assets(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [{
+        'id': i,
+        'asset_tag': f"TAG-{i:07d}",
+        'name': f"host-{i}",
+        'model': {'id': i % 40, 'name': f"Model {i % 40}"},
+        'status_label': {'id': 1, 'name': rng.choice(STATUSES)},
+        'location': {'id': i % 25, 'name': f"Site {i % 25}"},
+        'assigned_to': {'id': i % 500, 'name': f"user{i % 500}"} if rng.random() < 0.6 else None,
+        'custom_fields': {'RAM': {'field': '_snipeit_ram_1', 'value': rng.choice(['8GB', '16GB', '32GB'])}},
+    } for i in range(1, count + 1)]
+
+
+def mutate(assets, fraction: float, seed: int = 11):
+    rng = random.Random(seed)
+    current = [dict(a) for a in assets]
+    for asset in rng.sample(current, max(1, int(len(current) * fraction))):
+        asset['status_label'] = {'id': 2, 'name': rng.choice(STATUSES)}
+        asset['custom_fields'] = {'RAM': {'field': '_snipeit_ram_1', 'value': '64GB'}}
+    del current[:len(current) // 200]
+    return current
+
+
+def legacy_diff(previous, current):
+    # The nested next(...) scan realtime_monitor used before DiffEngine
+    changes = []
+    for asset in current:
+        old = next((a for a in previous if a.get('id') == asset.get('id')), None)
+        if old and old.get('status_label', {}).get('name') != asset.get('status_label', {}).get('name'):
+            changes.append(asset.get('id'))
+    return changes
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 50000, 100000])
+    parser.add_argument('--change-fraction', type=float, default=0.01)
+    parser.add_argument('--legacy-max', type=int, default=0,
+                        help="also time the legacy O(n^2) diff for sizes up to this many records")
+    args = parser.parse_args()
+
+    engine = DiffEngine('assets')
+    print(f"{'records':>8} {'snapshot ms':>12} {'diff ms':>9} {'changed':>8} {'removed':>8} {'legacy ms':>10}")
+    for size in args.sizes:
+        previous_rows = make_assets(size)
+        current_rows = mutate(previous_rows, args.change_fraction)
+
+        previous = engine.snapshot(previous_rows)
+        current, snapshot_time = timed(engine.snapshot, current_rows)
+        change_set, diff_time = timed(engine.diff, previous, current)
+
+        legacy = '-'
+        if size <= args.legacy_max:
+            _, legacy_time = timed(legacy_diff, previous_rows, current_rows)
+            legacy = f"{legacy_time * 1000:.0f}"
+
+        print(f"{size:>8} {snapshot_time * 1000:>12.1f} {diff_time * 1000:>9.1f} "
+              f"{len(change_set.changed):>8} {len(change_set.removed):>8} {legacy:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Scenario benchmarks for snipelzy against the local mock Snipe-IT server.
+
+Starts benchmarks/mock_server.py per inventory size, then runs each scenario
+in a fresh Python process so peak memory is its own. Each scenario drives the
+real client and manager code: the statistics dashboard, server and local
+search, monitor ticks, a bulk delete, `assets list` and `export`. Reports wall
+time, client requests, requests the server saw, retries and peak RSS. The list
+and export scenarios keep the default response cache on, so a cache that fills
+up on one-pass reads shows up as memory growth.
+
+    python benchmarks/bench_scenarios.py
+    python benchmarks/bench_scenarios.py --sizes 1000 50000 200000 --latency 0.02
+    python benchmarks/bench_scenarios.py --save baseline.json
+    python benchmarks/bench_scenarios.py --compare baseline.json --tolerance 0.25
+
+With --compare, the exit status is 1 when a scenario got slower, used more
+memory or made more requests than the baseline allows.
+"""
+
+import argparse
+import builtins
+import contextlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import requests
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..'))
+
+import snipelzy
+from snipelzy import (AsyncSnipeITClient, BulkDeleter, ChangeMonitor, InventoryExporter, MONITOR_ENDPOINTS,
+                      ResponseCache, SnipeITClient, SnipeITManager)
+
+
+MONITOR_TICKS = 5
+MONITOR_TOUCHES = 20
+DELETE_COUNT = 100
+DELETE_RATE = 1000
+# Scenarios that run with the default ResponseCache; the rest disable it
+DEFAULT_CACHE_SCENARIOS = {'list', 'export'}
+# Growth below these is noise, not a regression
+COMPARE_SLACK = {'wall_s': 0.25, 'requests': 0, 'peak_rss_mb': 5}
+
+
+@contextlib.contextmanager
+def quiet_manager(answers=()):
+    # Manager views print a dashboard and wait on input(); feed the answers and drop the output
+    answers = iter(answers)
+    original_input = builtins.input
+    builtins.input = lambda prompt='': next(answers, '')
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            yield
+    finally:
+        builtins.input = original_input
+
+
+def touch(url: str, resource: str, count: int):
+    requests.post(f"{url}/_bench/touch/{resource}/{count}").raise_for_status()
+
+
+def scenario_statistics(client: SnipeITClient, url: str, args):
+    with quiet_manager():
+        SnipeITManager(client).show_statistics()
+
+
+def scenario_statistics_async(client: SnipeITClient, url: str, args):
+    async_client = AsyncSnipeITClient.from_client(client)
+    try:
+        with quiet_manager():
+            SnipeITManager(client, async_client=async_client).show_statistics()
+    finally:
+        async_client.close()
+    return async_client
+
+
+def scenario_search(client: SnipeITClient, url: str, args):
+    with quiet_manager(['host-1', 'n']):
+        SnipeITManager(client).search_everything()
+
+
+def scenario_search_local(client: SnipeITClient, url: str, args):
+    # First use mirrors the inventory and builds the index; the second query reuses it
+    manager = SnipeITManager(client)
+    with quiet_manager(['host-1', 'y']):
+        manager.search_everything()
+    with quiet_manager(['user2', 'y']):
+        manager.search_everything()
+
+
+def scenario_monitor(client: SnipeITClient, url: str, args):
+    monitor = ChangeMonitor(client, refresh_interval=0)
+    monitor.start()
+    changes = 0
+    for _ in range(MONITOR_TICKS):
+        for name, endpoint in MONITOR_ENDPOINTS.items():
+            touch(url, endpoint.strip('/'), MONITOR_TOUCHES)
+            change_set = monitor.poll(name)
+            changes += len(change_set.added) + len(change_set.removed) + len(change_set.changed)
+    return {'changes': changes}
+
+
+def scenario_bulk_delete(client: SnipeITClient, url: str, args):
+    with tempfile.TemporaryDirectory() as directory:
+        deleter = BulkDeleter(client, 'assets', os.path.join(directory, 'checkpoint.json'), rate=DELETE_RATE)
+        deleter.plan(list(range(1, DELETE_COUNT + 1)))
+        with quiet_manager():
+            report = deleter.run()
+    return {'deleted': report['deleted'], 'failed': report['failed']}
+
+
+def scenario_list(client: SnipeITClient, url: str, args):
+    with quiet_manager():
+        snipelzy.command_list(client, snipelzy.parse_args(['assets', 'list']))
+    return {'cache_mb': round(client.cache.stats()['bytes'] / 2 ** 20, 1)}
+
+
+def scenario_export(client: SnipeITClient, url: str, args):
+    with tempfile.TemporaryDirectory() as directory:
+        report = InventoryExporter(client, 'assets', os.path.join(directory, 'assets.csv.gz'), 'csv', compress=True).run()
+    return {'exported': report['rows'], 'cache_mb': round(client.cache.stats()['bytes'] / 2 ** 20, 1)}
+
+
+SCENARIOS = {
+    'statistics': scenario_statistics,
+    'statistics-async': scenario_statistics_async,
+    'search': scenario_search,
+    'search-local': scenario_search_local,
+    'monitor': scenario_monitor,
+    'bulk-delete': scenario_bulk_delete,
+    'list': scenario_list,
+    'export': scenario_export,
+}
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / 2 ** 20 if sys.platform == 'darwin' else peak / 1024
+
+
+def run_one(name: str, url: str, args) -> dict:
+    # Runs in the child process; prints one JSON result line
+    requests.post(f"{url}/_bench/reset").raise_for_status()
+    cache = ResponseCache()
+    cache.enabled = name in DEFAULT_CACHE_SCENARIOS
+    client = SnipeITClient(url, 'benchmark', cache=cache, rate_limit=args.client_rate_limit)
+    baseline_rss = peak_rss_mb()
+    started = time.perf_counter()
+    try:
+        extra = SCENARIOS[name](client, url, args)
+    finally:
+        wall = time.perf_counter() - started
+        client.close()
+    server = requests.get(f"{url}/_bench/stats").json()
+    counted = extra if isinstance(extra, AsyncSnipeITClient) else client
+    result = {
+        'scenario': name,
+        'wall_s': round(wall, 3),
+        'requests': counted.request_count,
+        'server_requests': server['requests'],
+        'throttled': server['throttled'],
+        'retries': counted.retry_count,
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'rss_growth_mb': round(peak_rss_mb() - baseline_rss, 1),
+    }
+    if isinstance(extra, dict):
+        result.update(extra)
+    return result
+
+
+def start_server(size: int, args) -> subprocess.Popen:
+    command = [sys.executable, os.path.join(BENCH_DIR, 'mock_server.py'), '--port', '0', '--assets', str(size),
+               '--latency', str(args.latency), '--jitter', str(args.jitter), '--rate-limit', str(args.rate_limit)]
+    server = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    server.url = server.stdout.readline().strip()
+    if not server.url:
+        raise RuntimeError("mock server did not start")
+    return server
+
+
+def child_command(name: str, url: str, args):
+    return [sys.executable, os.path.abspath(__file__), '--run-one', name, '--url', url,
+            '--client-rate-limit', str(args.client_rate_limit)]
+
+
+def compare(results, baseline_path: str, tolerance: float) -> int:
+    with open(baseline_path) as f:
+        baseline = {(row['size'], row['scenario']): row for row in json.load(f)}
+    regressions = 0
+    for row in results:
+        before = baseline.get((row['size'], row['scenario']))
+        if before is None:
+            continue
+        for key, slack in COMPARE_SLACK.items():
+            if row[key] > before[key] * (1 + tolerance) + slack:
+                print(f"REGRESSION {row['scenario']} @ {row['size']}: {key} {before[key]} -> {row[key]}")
+                regressions += 1
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000], help="asset counts to test")
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIOS), default=None)
+    parser.add_argument('--latency', type=float, default=0.01, help="server latency per request in seconds")
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=int, default=0, help="server-side requests per minute, 0 for none")
+    parser.add_argument('--client-rate-limit', type=float, default=0, help="SnipeITClient rate limit per minute")
+    parser.add_argument('--save', metavar='PATH', help="write the results as a baseline")
+    parser.add_argument('--compare', metavar='PATH', help="compare with a saved baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed growth over the baseline")
+    parser.add_argument('--run-one', help=argparse.SUPPRESS)
+    parser.add_argument('--url', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        print(json.dumps(run_one(args.run_one, args.url, args)))
+        return
+
+    scenarios = args.scenarios or [name for name in SCENARIOS
+                                   if name != 'statistics-async' or snipelzy.aiohttp is not None]
+    print(f"{'size':>7}  {'scenario':<17} {'wall s':>8} {'requests':>9} {'server':>7} {'429s':>5} "
+          f"{'retries':>7} {'peak MB':>8} {'+MB':>6}")
+    results = []
+    for size in args.sizes:
+        server = start_server(size, args)
+        try:
+            for name in scenarios:
+                output = subprocess.run(child_command(name, server.url, args), capture_output=True, text=True)
+                if output.returncode:
+                    print(f"{size:>7}  {name:<17} failed:\n{output.stderr}", file=sys.stderr)
+                    continue
+                row = {'size': size, **json.loads(output.stdout.strip().splitlines()[-1])}
+                results.append(row)
+                print(f"{size:>7}  {name:<17} {row['wall_s']:>8.2f} {row['requests']:>9} {row['server_requests']:>7} "
+                      f"{row['throttled']:>5} {row['retries']:>7} {row['peak_rss_mb']:>8.1f} {row['rss_growth_mb']:>6.1f}")
+        finally:
+            server.terminate()
+            server.wait()
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.compare and compare(results, args.compare, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the compact mirror record store.
+
+Builds synthetic assets shaped like Snipe-IT's /hardware payload and
+measures the memory held by a plain dict mirror against a RecordStore,
+plus the cost of writing and reading records back.
+
+    python benchmarks/bench_store.py
+    python benchmarks/bench_store.py --sizes 10000 100000
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from snipelzy import RecordStore
+
+
+STATUSES = ['Ready to Deploy', 'Deployed', 'Pending', 'Archived', 'Broken']
+
+
+def stamp(day: int):
+    value = f"2025-{day % 12 + 1:02d}-{day % 28 + 1:02d} 09:00:00"
+    return {'datetime': value, 'formatted': value}
+
+
+def make_asset(i: int, rng: random.Random):
+    # Field set and nesting follow a real /api/v1/hardware row
+    model = i % 60
+    return {
+        'id': i,
+        'name': f"host-{i}",
+        'asset_tag': f"TAG-{i:07d}",
+        'serial': f"SN{rng.getrandbits(40):010X}",
+        'model': {'id': model, 'name': f"Model {model}"},
+        'byod': False,
+        'model_number': f"MN-{model}",
+        'eol': {'date': None, 'formatted': None},
+        'asset_eol_date': None,
+        'status_label': {'id': 1, 'name': rng.choice(STATUSES), 'status_type': 'deployable', 'status_meta': 'deployable'},
+        'category': {'id': model % 8, 'name': f"Category {model % 8}"},
+        'manufacturer': {'id': model % 12, 'name': f"Vendor {model % 12}"},
+        'supplier': {'id': model % 5, 'name': f"Supplier {model % 5}"},
+        'notes': '',
+        'order_number': f"PO-{i // 50}",
+        'company': {'id': 1, 'name': 'Example Corp'},
+        'location': {'id': i % 40, 'name': f"Site {i % 40}"},
+        'rtd_location': {'id': i % 40, 'name': f"Site {i % 40}"},
+        'image': None,
+        'qr': None,
+        'alt_barcode': None,
+        'assigned_to': {'id': i % 900, 'username': f"user{i % 900}", 'name': f"User {i % 900}", 'type': 'user'}
+        if rng.random() < 0.6 else None,
+        'warranty_months': '36 months',
+        'warranty_expires': {'date': '2027-01-01', 'formatted': '2027-01-01'},
+        'created_at': stamp(i),
+        'updated_at': stamp(i + 3),
+        'last_audit_date': None,
+        'next_audit_date': None,
+        'deleted_at': None,
+        'purchase_date': {'date': '2024-01-01', 'formatted': '2024-01-01'},
+        'age': '2 years',
+        'last_checkout': stamp(i + 1),
+        'expected_checkin': None,
+        'purchase_cost': '1,299.00',
+        'checkin_counter': i % 7,
+        'checkout_counter': i % 9,
+        'requests_counter': 0,
+        'user_can_checkout': False,
+        'custom_fields': {
+            'RAM': {'field': '_snipeit_ram_1', 'value': rng.choice(['8GB', '16GB', '32GB']), 'field_format': 'ANY'},
+            'CPU': {'field': '_snipeit_cpu_2', 'value': rng.choice(['i5', 'i7', 'M2']), 'field_format': 'ANY'},
+        },
+        'available_actions': {'checkout': True, 'checkin': True, 'clone': True, 'restore': False,
+                              'update': True, 'delete': False},
+    }
+
+
+def make_assets(count: int, seed: int = 7):
+    # Round-trip through JSON so every record owns its strings, as a decoded response would
+    rng = random.Random(seed)
+    return json.loads(json.dumps([make_asset(i, rng) for i in range(1, count + 1)]))
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    held = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return held, size
+
+
+def fill(records):
+    store = RecordStore('assets')
+    for record in records:
+        store[record['id']] = record
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 50000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'records':>8}  {'dict MB':>8}  {'store MB':>9}  {'ratio':>6}  {'insert':>7}  {'read all':>8}")
+    for size in args.sizes:
+        mirror, dict_bytes = measure(lambda: {record['id']: record for record in make_assets(size)})
+        del mirror
+        store, store_bytes = measure(lambda: fill(make_assets(size)))
+
+        # Timings run outside tracemalloc, which slows allocation-heavy code several times over
+        records = make_assets(size)
+        started = time.perf_counter()
+        store = fill(records)
+        insert_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        for _ in store.values():
+            pass
+        read_seconds = time.perf_counter() - started
+
+        print(f"{size:>8}  {dict_bytes / 2 ** 20:>8.1f}  {store_bytes / 2 ** 20:>9.1f}  "
+              f"{dict_bytes / store_bytes:>5.1f}x  {insert_seconds:>6.2f}s  {read_seconds:>7.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Snipe-IT API, for benchmarks.
+
+Serves /hardware, /licenses, /users, /categories, /locations and /models
+under /api/v1 with synthetic rows generated on demand from the record ID,
+so 200k assets cost a list of IDs rather than 200k dicts. Supports the
+parts of the API snipelzy uses: offset/limit paging (capped like Snipe-IT's
+max_results), search, sort=updated_at, record detail and DELETE. Latency,
+jitter and Laravel-style per-minute throttling (429 + Retry-After) are
+configurable.
+
+    python benchmarks/mock_server.py --assets 50000 --latency 0.02
+    python benchmarks/mock_server.py --port 8000 --rate-limit 120
+
+Control endpoints for scenario scripts (not part of Snipe-IT):
+
+    GET  /api/v1/_bench/stats            requests served, throttled and per resource
+    POST /api/v1/_bench/touch/<res>/<n>  bump updated_at and status of n records
+    POST /api/v1/_bench/reset            restore the initial data and counters
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import chain, islice
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_store import STATUSES, make_asset
+
+
+API_PREFIX = '/api/v1'
+MAX_RESULTS = 500
+BASE_TIME = datetime(2025, 1, 1)
+
+
+def stamp(moment: datetime):
+    value = moment.strftime('%Y-%m-%d %H:%M:%S')
+    return {'datetime': value, 'formatted': value}
+
+
+def make_license(i: int, rng: random.Random):
+    seats = rng.choice([5, 10, 25, 50, 100])
+    return {
+        'id': i,
+        'name': f"License {i}",
+        'company': {'id': 1, 'name': 'Example Corp'},
+        'manufacturer': {'id': i % 12, 'name': f"Vendor {i % 12}"},
+        'product_key': f"KEY-{rng.getrandbits(48):012X}",
+        'order_number': f"PO-{i // 20}",
+        'purchase_order': None,
+        'purchase_date': {'date': '2024-01-01', 'formatted': '2024-01-01'},
+        'purchase_cost': '99.00',
+        'notes': '',
+        'expiration_date': None,
+        'seats': seats,
+        'free_seats_count': rng.randint(0, seats),
+        'license_name': None,
+        'license_email': None,
+        'reassignable': True,
+        'maintained': False,
+        'supplier': {'id': i % 5, 'name': f"Supplier {i % 5}"},
+        'category': {'id': 100 + i % 4, 'name': f"Software {i % 4}"},
+        'created_at': stamp(BASE_TIME),
+        'deleted_at': None,
+        'user_can_checkout': True,
+        'available_actions': {'checkout': True, 'checkin': True, 'clone': True, 'update': True, 'delete': True},
+    }
+
+
+def make_user(i: int, rng: random.Random):
+    return {
+        'id': i,
+        'avatar': None,
+        'name': f"User {i}",
+        'first_name': 'User',
+        'last_name': str(i),
+        'username': f"user{i}",
+        'remote': False,
+        'locale': 'en-US',
+        'employee_num': f"E{i:06d}",
+        'manager': None,
+        'jobtitle': rng.choice(['Engineer', 'Analyst', 'Manager', None]),
+        'email': f"user{i}@example.com",
+        'department': {'id': i % 9, 'name': f"Department {i % 9}"},
+        'location': {'id': i % 40, 'name': f"Site {i % 40}"},
+        'notes': '',
+        'permissions': None,
+        'activated': rng.random() < 0.9,
+        'ldap_import': False,
+        'two_factor_activated': False,
+        'assets_count': rng.randint(0, 4),
+        'licenses_count': rng.randint(0, 3),
+        'accessories_count': 0,
+        'consumables_count': 0,
+        'company': {'id': 1, 'name': 'Example Corp'},
+        'created_at': stamp(BASE_TIME),
+        'last_login': None,
+        'deleted_at': None,
+        'available_actions': {'update': True, 'delete': True, 'clone': True, 'restore': False},
+    }
+
+
+def make_category(i: int, rng: random.Random):
+    return {'id': i, 'name': f"Category {i}", 'category_type': 'asset', 'assets_count': rng.randint(0, 500),
+            'licenses_count': 0, 'created_at': stamp(BASE_TIME)}
+
+
+def make_location(i: int, rng: random.Random):
+    return {'id': i, 'name': f"Site {i}", 'address': f"{i} Main Street", 'city': f"City {i % 15}",
+            'country': rng.choice(['US', 'DE', 'GB', 'NL']), 'assets_count': rng.randint(0, 2000),
+            'created_at': stamp(BASE_TIME)}
+
+
+def make_model(i: int, rng: random.Random):
+    return {'id': i, 'name': f"Model {i}", 'model_number': f"MN-{i}",
+            'manufacturer': {'id': i % 12, 'name': f"Vendor {i % 12}"},
+            'category': {'id': i % 8, 'name': f"Category {i % 8}"}, 'assets_count': rng.randint(0, 900),
+            'created_at': stamp(BASE_TIME)}
+
+
+# Snipe-IT path -> (row factory, text the server-side search matches)
+RESOURCES = {
+    'hardware': (make_asset, lambda i: f"host-{i} tag-{i:07d} model {(i % 60)}"),
+    'licenses': (make_license, lambda i: f"license {i}"),
+    'users': (make_user, lambda i: f"user{i} user {i} user{i}@example.com"),
+    'categories': (make_category, lambda i: f"category {i}"),
+    'locations': (make_location, lambda i: f"site {i}"),
+    'models': (make_model, lambda i: f"model {i} mn-{i}"),
+}
+
+
+def sizes_for(assets: int):
+    return {
+        'hardware': assets,
+        'licenses': max(10, assets // 10),
+        'users': max(10, assets // 5),
+        'categories': 20,
+        'locations': 40,
+        'models': 60,
+    }
+
+
+class Inventory:
+    # Rows are rebuilt from their ID on every request. updated_at grows with the
+    # ID, so "sort=updated_at&order=desc" is the touched records (newest first)
+    # followed by the rest in descending ID order.
+
+    def __init__(self, assets: int):
+        self.sizes = sizes_for(assets)
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.ids = {name: list(range(1, size + 1)) for name, size in self.sizes.items()}
+            self.live = {name: set(ids) for name, ids in self.ids.items()}
+            self.touched = {name: OrderedDict() for name in self.sizes}
+
+    def row(self, resource: str, record_id: int):
+        make, _ = RESOURCES[resource]
+        record = make(record_id, random.Random(record_id))
+        record['updated_at'] = stamp(BASE_TIME + timedelta(seconds=record_id))
+        if resource == 'hardware':
+            record['status_label']['status_meta'] = 'deployed' if record['assigned_to'] else 'deployable'
+        touched = self.touched[resource].get(record_id)
+        if touched is not None:
+            record['updated_at'] = stamp(touched[0])
+            if resource == 'hardware':
+                record['status_label'] = dict(record['status_label'], name=touched[1])
+            elif resource == 'users':
+                record['assets_count'] = touched[2]
+            elif resource == 'licenses':
+                record['free_seats_count'] = min(record['seats'], touched[2])
+        return record
+
+    def page(self, resource: str, offset: int, limit: int, search: str = '', newest_first: bool = False):
+        with self.lock:
+            ids = self.ids[resource]
+            touched = self.touched[resource]
+            if search:
+                _, text = RESOURCES[resource]
+                ids = [record_id for record_id in ids if search in text(record_id)]
+                total = len(ids)
+                selected = ids[offset:offset + limit]
+            elif newest_first:
+                total = len(ids)
+                order = chain(reversed(touched), (record_id for record_id in reversed(ids) if record_id not in touched))
+                selected = list(islice(order, offset, offset + limit))
+            else:
+                total = len(ids)
+                selected = ids[offset:offset + limit]
+            return total, [self.row(resource, record_id) for record_id in selected]
+
+    def get(self, resource: str, record_id: int):
+        with self.lock:
+            return self.row(resource, record_id) if record_id in self.live[resource] else None
+
+    def delete(self, resource: str, record_id: int) -> bool:
+        with self.lock:
+            if record_id not in self.live[resource]:
+                return False
+            self.live[resource].discard(record_id)
+            self.ids[resource].remove(record_id)
+            self.touched[resource].pop(record_id, None)
+            return True
+
+    def touch(self, resource: str, count: int, rng: random.Random) -> int:
+        with self.lock:
+            ids = self.ids[resource]
+            chosen = rng.sample(ids, min(count, len(ids)))
+            now = datetime.now()
+            for record_id in chosen:
+                self.touched[resource].pop(record_id, None)
+                self.touched[resource][record_id] = (now, rng.choice(STATUSES), rng.randint(0, 9))
+            return len(chosen)
+
+
+class Throttle:
+    # Laravel's throttle middleware: a fixed one-minute window per client
+    def __init__(self, per_minute: int):
+        self.per_minute = per_minute
+        self.window = 0
+        self.used = 0
+        self.lock = threading.Lock()
+
+    def check(self):
+        # Returns (allowed, remaining, retry_after)
+        if self.per_minute <= 0:
+            return True, None, None
+        with self.lock:
+            now = time.time()
+            window = int(now // 60)
+            if window != self.window:
+                self.window, self.used = window, 0
+            if self.used >= self.per_minute:
+                return False, 0, int((window + 1) * 60 - now) + 1
+            self.used += 1
+            return True, self.per_minute - self.used, None
+
+
+class MockSnipeIT(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, assets: int = 1000, latency: float = 0.0, jitter: float = 0.0,
+                 rate_limit: int = 0, max_results: int = MAX_RESULTS, seed: int = 7):
+        super().__init__(address, Handler)
+        self.inventory = Inventory(assets)
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle = Throttle(rate_limit)
+        self.max_results = max_results
+        self.rng = random.Random(seed)
+        self.stats_lock = threading.Lock()
+        self.reset_stats()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def reset_stats(self):
+        with self.stats_lock:
+            self.stats = {'requests': 0, 'throttled': 0, 'rows': 0, 'bytes': 0, 'by_resource': {}}
+
+    def count(self, resource: str, rows: int, size: int):
+        with self.stats_lock:
+            self.stats['requests'] += 1
+            self.stats['rows'] += rows
+            self.stats['bytes'] += size
+            self.stats['by_resource'][resource] = self.stats['by_resource'].get(resource, 0) + 1
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out as separate writes; without TCP_NODELAY every
+    # keep-alive response waits on a delayed ACK (~40 ms)
+    disable_nagle_algorithm = True
+    server: MockSnipeIT
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status: int, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, str(value))
+        self.end_headers()
+        self.wfile.write(body)
+        return len(body)
+
+    def route(self):
+        url = urlparse(self.path)
+        if not url.path.startswith(API_PREFIX + '/'):
+            return None, [], {}
+        parts = url.path[len(API_PREFIX) + 1:].strip('/').split('/')
+        return parts[0], parts[1:], {key: values[0] for key, values in parse_qs(url.query).items()}
+
+    def admit(self, resource: str) -> bool:
+        # Latency and throttling apply to API calls only, not the control endpoints
+        server = self.server
+        if server.latency or server.jitter:
+            time.sleep(server.latency + random.uniform(0, server.jitter))
+        allowed, remaining, retry_after = server.throttle.check()
+        if allowed:
+            self.rate_headers = {} if remaining is None else {
+                'X-RateLimit-Limit': server.throttle.per_minute, 'X-RateLimit-Remaining': remaining}
+            return True
+        with server.stats_lock:
+            server.stats['throttled'] += 1
+        self.send_json(429, {'status': 'error', 'messages': 'Too Many Requests'},
+                       {'Retry-After': retry_after, 'X-RateLimit-Limit': server.throttle.per_minute,
+                        'X-RateLimit-Remaining': 0})
+        return False
+
+    def do_GET(self):
+        resource, rest, query = self.route()
+        if resource == '_bench' and rest == ['stats']:
+            with self.server.stats_lock:
+                self.send_json(200, self.server.stats)
+            return
+        if resource not in RESOURCES:
+            self.send_json(404, {'status': 'error', 'messages': 'Not found'})
+            return
+        if not self.admit(resource):
+            return
+
+        inventory = self.server.inventory
+        if rest:
+            record = inventory.get(resource, int(rest[0])) if rest[0].isdigit() else None
+            if record is None:
+                size = self.send_json(200, {'status': 'error', 'messages': 'Not found', 'payload': None},
+                                      self.rate_headers)
+            else:
+                size = self.send_json(200, record, self.rate_headers)
+            self.server.count(resource, 1 if record else 0, size)
+            return
+
+        offset = max(0, int(query.get('offset', 0)))
+        limit = min(max(1, int(query.get('limit', 50))), self.server.max_results)
+        newest_first = query.get('sort') == 'updated_at' and query.get('order', 'desc') == 'desc'
+        total, rows = inventory.page(resource, offset, limit, query.get('search', '').lower(), newest_first)
+        size = self.send_json(200, {'total': total, 'rows': rows}, self.rate_headers)
+        self.server.count(resource, len(rows), size)
+
+    def do_DELETE(self):
+        resource, rest, _ = self.route()
+        if resource not in RESOURCES or not rest or not rest[0].isdigit():
+            self.send_json(404, {'status': 'error', 'messages': 'Not found'})
+            return
+        if not self.admit(resource):
+            return
+        if self.server.inventory.delete(resource, int(rest[0])):
+            size = self.send_json(200, {'status': 'success', 'messages': 'Deleted', 'payload': None}, self.rate_headers)
+        else:
+            # Snipe-IT answers a missing record with 200 and status=error
+            size = self.send_json(200, {'status': 'error', 'messages': 'Not found', 'payload': None}, self.rate_headers)
+        self.server.count(resource, 0, size)
+
+    def do_POST(self):
+        resource, rest, _ = self.route()
+        server = self.server
+        if resource == '_bench' and rest == ['reset']:
+            server.inventory.reset()
+            server.reset_stats()
+            self.send_json(200, {'status': 'success'})
+        elif resource == '_bench' and len(rest) == 3 and rest[0] == 'touch' and rest[1] in RESOURCES:
+            touched = server.inventory.touch(rest[1], int(rest[2]), server.rng)
+            self.send_json(200, {'status': 'success', 'touched': touched})
+        else:
+            self.send_json(404, {'status': 'error', 'messages': 'Not found'})
+
+
+def start(assets: int = 1000, port: int = 0, **options) -> MockSnipeIT:
+    # Serves from a daemon thread; call shutdown() when done
+    server = MockSnipeIT(('127.0.0.1', port), assets, **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--assets', type=int, default=10000, help="assets; users and licenses scale with it")
+    parser.add_argument('--port', type=int, default=8765, help="0 picks a free port")
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds added to every API request")
+    parser.add_argument('--jitter', type=float, default=0.0, help="up to this many extra seconds, uniformly random")
+    parser.add_argument('--rate-limit', type=int, default=0, help="requests per minute before 429s, 0 for none")
+    parser.add_argument('--max-results', type=int, default=MAX_RESULTS, help="largest page the server returns")
+    args = parser.parse_args()
+
+    server = MockSnipeIT(('127.0.0.1', args.port), args.assets, args.latency, args.jitter, args.rate_limit,
+                         args.max_results)
+    # First line of output is the base URL, for scripts that start the server with --port 0
+    print(server.url, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
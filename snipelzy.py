@@ -8,18 +8,277 @@ Lazy to open the Web UI? Use this CLI to manage a basic operation of your Snipe-
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+import argparse
+import asyncio
+import cProfile
+import csv
+import gzip
+import io
 import json
-from typing import Dict, List, Optional, Any
+import os
+import shutil
+import sqlite3
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypedDict, Any
 from dataclasses import dataclass
 from enum import Enum
 import sys
 import time
+import random
+import threading
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain, islice
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 
+# Optional faster JSON decoders; the stdlib json module is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+# Optional: vectorizes the statistics aggregation
+try:
+    import numpy
+except ImportError:
+    numpy = None
+# Optional: only needed for AsyncSnipeITClient (--async)
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+# Optional: only needed for Parquet export
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
 
 
-SNIPEIT_API_URL = "http://snipe-it-domain/api/v1"
-SNIPEIT_API_TOKEN = "API_KEY"
+SNIPEIT_API_URL = os.environ.get('SNIPEIT_API_URL', "http://snipe-it-domain/api/v1")
+SNIPEIT_API_TOKEN = os.environ.get('SNIPEIT_API_TOKEN', "API_KEY")
+
+HTTP_POOL_SIZE = 10
+HTTP_CONNECT_TIMEOUT = 5
+HTTP_READ_TIMEOUT = 30
+# The async client keeps more connections open and in flight than the thread pools can
+ASYNC_POOL_SIZE = 100
+ASYNC_CONCURRENCY = 50
+# auto picks orjson, then msgspec, then the stdlib json module
+JSON_DECODER = os.environ.get('SNIPEIT_JSON_DECODER', 'auto')
+
+# Retries for transient failures (network errors, 429 and 5xx); delays double from
+# RETRY_BACKOFF with jitter unless the server sends Retry-After
+RETRY_ATTEMPTS = 4
+RETRY_BACKOFF = 0.5
+RETRY_MAX_DELAY = 30
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Consecutive failed requests before the circuit opens, and seconds before it lets a probe through
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 30
+
+# Request latency histogram bucket bounds in seconds (Prometheus `le` labels)
+LATENCY_BUCKETS = (0.005, 0.01, 0.02, 0.035, 0.05, 0.075, 0.1, 0.15, 0.25, 0.4, 0.6, 1, 1.5, 2.5, 4, 6, 10, 30)
+
+# Client-side throttle shared by every request, kept at the server's limit
+# (Snipe-IT's API_THROTTLE_PER_MINUTE, 120 by default); 0 disables it
+API_RATE_LIMIT = float(os.environ.get('SNIPEIT_RATE_LIMIT', 120))
+API_RATE_BURST = 10
+# Tokens a request costs, by resource (default 1), e.g. {'hardware': 2} to ration a heavy endpoint
+API_RATE_WEIGHTS: Dict[str, float] = {}
+
+# Snipe-IT caps a single page at its max_results setting (500 by default)
+PAGE_SIZE = 500
+FETCH_WORKERS = 8
+
+# Table rendering: widths are sized from the first rows, long cells are cut
+TABLE_SAMPLE_ROWS = 200
+TABLE_MAX_CELL_WIDTH = 40
+TABLE_FLUSH_ROWS = 200
+
+# Seconds a cached response stays valid, per resource
+CACHE_TTLS = {
+    'hardware': 60,
+    'licenses': 120,
+    'users': 120,
+    'categories': 600,
+    'locations': 600,
+    'models': 600,
+}
+CACHE_DEFAULT_TTL = 60
+# Budget for decoded responses held in memory; list pages are sized from a few sample rows
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+CACHE_SIZE_SAMPLE_ROWS = 8
+CACHE_DB_PATH = os.path.join(os.path.expanduser('~'), '.snipelzy', 'cache.db')
+
+# Ticks between forced deletion sweeps in incremental sync
+SYNC_SWEEP_EVERY = 20
+# First page size of a sync tick; doubles up to PAGE_SIZE while changes keep coming
+SYNC_PAGE_SIZE = 25
+# Keep long-lived mirrors (monitor, local search) in a RecordStore holding only the
+# fields the views read, instead of the full API payload
+MIRROR_COMPACT = True
+
+# Realtime monitor polling: idle resources back off up to POLL_MAX_INTERVAL seconds
+POLL_MAX_INTERVAL = 120
+POLL_BACKOFF = 2.0
+POLL_JITTER = 0.1
+
+STATISTICS_ENDPOINTS = {
+    'Assets': '/hardware',
+    'Licenses': '/licenses',
+    'Users': '/users',
+    'Categories': '/categories',
+    'Locations': '/locations',
+    'Models': '/models',
+}
+
+MONITOR_ENDPOINTS = {
+    'assets': '/hardware',
+    'licenses': '/licenses',
+    'users': '/users',
+}
+
+# Every listable resource, for commands that take any of them
+RESOURCE_ENDPOINTS = {
+    **MONITOR_ENDPOINTS,
+    'categories': '/categories',
+    'locations': '/locations',
+    'models': '/models',
+}
+
+# Fields the monitor compares between snapshots: (label, path into the record).
+# Asset custom fields are compared on top of these.
+TRACKED_FIELDS = {
+    'assets': [
+        ('Status', ('status_label', 'name')),
+        ('Assignment', ('assigned_to', 'name')),
+        ('Location', ('location', 'name')),
+        ('Name', ('name',)),
+        ('Asset Tag', ('asset_tag',)),
+        ('Model', ('model', 'name')),
+    ],
+    'licenses': [
+        ('Name', ('name',)),
+        ('Seats', ('seats',)),
+        ('Available', ('free_seats_count',)),
+        ('Category', ('category', 'name')),
+    ],
+    'users': [
+        ('Username', ('username',)),
+        ('Email', ('email',)),
+        ('Location', ('location', 'name')),
+        ('Activated', ('activated',)),
+        ('Assets', ('assets_count',)),
+    ],
+}
+# Who an asset is assigned to, kept next to the tracked fields so assignment
+# events identify the user by username and ID (display names are not unique)
+ASSIGNEE_FIELDS = [('assigned_to', 'id'), ('assigned_to', 'username'), ('assigned_to', 'type')]
+
+# Bulk delete: deletes in flight and sustained deletes per second (Snipe-IT throttles at 120/min by default)
+BULK_DELETE_WORKERS = 4
+BULK_DELETE_RATE = 1.5
+BULK_DELETE_BURST = 5
+BULK_CHECKPOINT_EVERY = 25
+BULK_CHECKPOINT_DIR = os.path.join(os.path.expanduser('~'), '.snipelzy')
+BULK_PLAN_SAMPLE = 10
+
+DELETE_METHODS = {
+    'assets': 'delete_asset',
+    'licenses': 'delete_license',
+    'users': 'delete_user',
+}
+
+DETAIL_METHODS = {
+    'assets': 'get_asset',
+    'licenses': 'get_license',
+    'users': 'get_user',
+}
+
+# Export: rows per checkpoint (also the Parquet row group), rows per Parquet part
+# file, and rows re-read before the checkpoint on resume in case earlier records
+# were deleted in the meantime
+EXPORT_FORMATS = ('csv', 'jsonl', 'parquet')
+EXPORT_CHECKPOINT_ROWS = 5000
+EXPORT_PARQUET_ROWS = 50000
+EXPORT_RESUME_OVERLAP = 500
+EXPORT_SKIP_FIELDS = {'available_actions'}
+
+# Fields the local search index covers
+SEARCH_FIELDS = {
+    'assets': [('asset_tag',), ('name',), ('serial',), ('model', 'name')],
+    'licenses': [('name',), ('product_key',)],
+    'users': [('username',), ('email',), ('first_name',), ('last_name',)],
+}
+SEARCH_RESULT_LIMIT = 500
+# Rebuild the index once this share of its documents has been superseded
+SEARCH_INDEX_COMPACT_RATIO = 0.25
+
+# Paginated browser: pages kept in memory around the current one, pages fetched
+# ahead of the reader, and the threads fetching them
+BROWSE_WINDOW_PAGES = 12
+BROWSE_PREFETCH_PAGES = 2
+BROWSE_WORKERS = 2
+
+# Columns the list views and batch CSV output show: (header, path into the record)
+LIST_COLUMNS = {
+    'assets': [('ID', ('id',)), ('Asset Tag', ('asset_tag',)), ('Name', ('name',)), ('Model', ('model', 'name')),
+               ('Status', ('status_label', 'name')), ('Location', ('location', 'name'))],
+    'licenses': [('ID', ('id',)), ('Name', ('name',)), ('Product Key', ('product_key',)), ('Seats', ('seats',)),
+                 ('Available', ('free_seats_count',)), ('Category', ('category', 'name'))],
+    'users': [('ID', ('id',)), ('Username', ('username',)), ('First Name', ('first_name',)), ('Last Name', ('last_name',)),
+              ('Email', ('email',)), ('Assets', ('assets_count',))],
+    'categories': [('ID', ('id',)), ('Name', ('name',)), ('Type', ('category_type',)), ('Assets Count', ('assets_count',))],
+    'locations': [('ID', ('id',)), ('Name', ('name',)), ('Address', ('address',)), ('City', ('city',)),
+                  ('Country', ('country',)), ('Assets', ('assets_count',))],
+    'models': [('ID', ('id',)), ('Name', ('name',)), ('Model Number', ('model_number',)),
+               ('Manufacturer', ('manufacturer', 'name')), ('Category', ('category', 'name')), ('Assets', ('assets_count',))],
+}
+
+# Asset breakdowns on the statistics screen: (label, path of the group name)
+STATS_GROUP_BY = [('Category', ('category', 'name')), ('Location', ('location', 'name')), ('Model', ('model', 'name'))]
+# Fields the statistics aggregation reads from every row
+STATS_FIELDS = {
+    'assets': [('status_label', 'status_meta')] + [path for _, path in STATS_GROUP_BY],
+    'licenses': [('seats',), ('free_seats_count',)],
+    'users': [('activated',), ('assets_count',)],
+}
+# Rows aggregated per batch, and groups listed per breakdown
+STATS_BATCH_ROWS = 5000
+STATS_TOP_GROUPS = 5
+
+# Statistics history: every snapshot is kept raw for a week, then as hourly and
+# daily averages. Tiers are (name, bucket seconds, retention seconds).
+METRICS_DB_PATH = os.path.join(os.path.expanduser('~'), '.snipelzy', 'metrics.db')
+METRICS_TIERS = [
+    ('raw', 1, 7 * 86400),
+    ('hour', 3600, 90 * 86400),
+    ('day', 86400, 5 * 365 * 86400),
+]
+TREND_DAYS = 30
+TREND_WIDTH = 40
+
+# Monitor change events: append-only JSON Lines, rotated by size, fsynced in batches
+EVENT_LOG_PATH = os.path.join(os.path.expanduser('~'), '.snipelzy', 'events.jsonl')
+EVENT_LOG_MAX_BYTES = 10 * 1024 * 1024
+EVENT_LOG_KEEP = 5
+EVENT_LOG_SYNC_EVENTS = 100
+EVENT_LOG_SYNC_SECONDS = 2.0
+
+# Fields printed when a record is reported as new or deleted
+SUMMARY_FIELDS = {
+    'assets': [('Tag', ('asset_tag',)), ('Name', ('name',)), ('Model', ('model', 'name'))],
+    'licenses': [('Name', ('name',)), ('Seats', ('seats',))],
+    'users': [('Username', ('username',)), ('Name', ('first_name',)), ('Email', ('email',))],
+}
 
 
 
@@ -61,7 +320,80 @@ class Colors:
 
 
 
+def pluck(record: Dict, path: Tuple[str, ...], default: Any = None) -> Any:
+    value = record
+    for key in path:
+        if not isinstance(value, dict):
+            return default
+        value = value.get(key)
+    return default if value is None else value
+
+def project(record: Dict, paths: Iterable[Tuple[str, ...]]) -> Dict:
+    # Copies only the given paths out of a nested record; null parents stay null
+    projected: Dict[str, Any] = {}
+    for path in paths:
+        source, target = record, projected
+        for key in path[:-1]:
+            source = source.get(key)
+            if not isinstance(source, dict):
+                target[key] = source
+                break
+            target = target.setdefault(key, {})
+        else:
+            if path[-1] in source:
+                target[path[-1]] = source[path[-1]]
+    return projected
+
+def describe(record: Dict) -> List[str]:
+    # One line per populated field of a full record; nested objects show their name
+    lines = []
+    for key, value in record.items():
+        if key == 'available_actions':
+            continue
+        if key == 'custom_fields' and isinstance(value, dict):
+            lines += [f"{name}: {field.get('value') if isinstance(field, dict) else field}" for name, field in value.items()]
+            continue
+        if isinstance(value, dict):
+            value = next((value[k] for k in ('name', 'formatted', 'datetime', 'date') if value.get(k)), None)
+        elif isinstance(value, list):
+            value = ', '.join(str(item.get('name', item) if isinstance(item, dict) else item) for item in value)
+        if value is None or value == '':
+            continue
+        lines.append(f"{key.replace('_', ' ').title()}: {value}")
+    return lines
+
+def flatten(record: Dict, prefix: str = '') -> Dict[str, Any]:
+    # Nested objects become dotted columns (model.name, assigned_to.username),
+    # Snipe-IT's {datetime|date, formatted} pairs collapse to the machine-readable
+    # value, custom fields become custom.<name> and lists are kept as JSON
+    flat: Dict[str, Any] = {}
+    for key, value in record.items():
+        if key in EXPORT_SKIP_FIELDS:
+            continue
+        name = prefix + key
+        if key == 'custom_fields' and not prefix and isinstance(value, dict):
+            for field, entry in value.items():
+                flat[f"custom.{field}"] = entry.get('value') if isinstance(entry, dict) else entry
+        elif isinstance(value, dict):
+            if set(value) <= {'datetime', 'date', 'formatted'} and ('datetime' in value or 'date' in value):
+                flat[name] = value.get('datetime') or value.get('date')
+            else:
+                flat.update(flatten(value, name + '.'))
+        elif isinstance(value, list):
+            flat[name] = json.dumps(value, default=str)
+        else:
+            flat[name] = value
+    return flat
+
+def view_fields(resource: str) -> List[Tuple[str, ...]]:
+    # What the list views, CSV output and search results render
+    return [path for _, path in LIST_COLUMNS[resource]]
+
+
+
 class UI:
+    # Where status messages go; batch commands point this at stderr so stdout stays machine-readable
+    message_stream = None
     
     @staticmethod
     def clear_screen():
@@ -101,6 +433,9 @@ class UI:
             ("10", "📊 Show Statistics", Colors.BRIGHT_CYAN),
             ("11", "🔍 Search Everything", Colors.BRIGHT_MAGENTA),
             ("12", "📡 Real-Time Monitor", Colors.BRIGHT_GREEN),
+            ("13", "🗑️  Bulk Delete", Colors.BRIGHT_RED),
+            ("14", "📈 Statistics Trends", Colors.BRIGHT_CYAN),
+            ("15", "🧾 Change Log", Colors.BRIGHT_YELLOW),
             ("", "───────────────────────────────", Colors.DIM),
             ("0", "🚪 Exit", Colors.BRIGHT_RED),
         ]
@@ -128,54 +463,84 @@ class UI:
         print()
     
     @staticmethod
-    def print_table(headers: List[str], rows: List[List[str]], title: str = ""):
-
-        if not rows:
+    def print_table(headers: List[str], rows: Iterable[List[Any]], title: str = "",
+                    widths: Optional[List[int]] = None, page_size: Optional[int] = None,
+                    max_cell_width: int = TABLE_MAX_CELL_WIDTH) -> int:
+        # Streams rows: column widths come from `widths` or from the first
+        # TABLE_SAMPLE_ROWS rows, output is written in chunks, and with page_size
+        # the user is asked to continue after every page
+        rows = iter(rows)
+        sample = list(islice(rows, TABLE_SAMPLE_ROWS))
+        if not sample:
             UI.print_box("No Data", ["No items found."], Colors.YELLOW)
-            return
+            return 0
         
-        col_widths = [len(h) for h in headers]
-        for row in rows:
-            for i, cell in enumerate(row):
-                col_widths[i] = max(col_widths[i], len(str(cell)))
+        if widths is None:
+            widths = [len(h) for h in headers]
+            for row in sample:
+                for i, cell in enumerate(row):
+                    widths[i] = max(widths[i], len(str(cell)))
+        col_widths = [min(width, max(max_cell_width, len(header))) for width, header in zip(widths, headers)]
+        
+        def fit(cell: Any, width: int) -> str:
+            text = str(cell)
+            return text.ljust(width) if len(text) <= width else text[:width - 1] + '…'
         
+        # Inner width of a row: "┃ " + cells joined by " ┃ " + " ┃"
+        border = '━' * (sum(col_widths) + len(col_widths) * 3 - 1)
+        out = []
         if title:
             total_width = sum(col_widths) + len(headers) * 3 + 1
-            print(f"\n{Colors.BRIGHT_CYAN}{'═' * total_width}{Colors.RESET}")
-            print(f"{Colors.BOLD}{title.center(total_width)}{Colors.RESET}")
-            print(f"{Colors.BRIGHT_CYAN}{'═' * total_width}{Colors.RESET}\n")
+            out.append(f"\n{Colors.BRIGHT_CYAN}{'═' * total_width}{Colors.RESET}\n")
+            out.append(f"{Colors.BOLD}{title.center(total_width)}{Colors.RESET}\n")
+            out.append(f"{Colors.BRIGHT_CYAN}{'═' * total_width}{Colors.RESET}\n\n")
         
-
-        header_line = "┃ "
-        for i, header in enumerate(headers):
-            header_line += f"{Colors.BOLD}{Colors.BRIGHT_YELLOW}{header.ljust(col_widths[i])}{Colors.RESET} ┃ "
-        print(f"{Colors.BRIGHT_CYAN}┏{'━' * (len(header_line) - len(Colors.BOLD) - len(Colors.BRIGHT_YELLOW) - len(Colors.RESET) * 2 - 4)}┓{Colors.RESET}")
-        print(header_line[:-3] + f"{Colors.BRIGHT_CYAN}┃{Colors.RESET}")
-        print(f"{Colors.BRIGHT_CYAN}┣{'━' * (len(header_line) - len(Colors.BOLD) - len(Colors.BRIGHT_YELLOW) - len(Colors.RESET) * 2 - 4)}┫{Colors.RESET}")
-
-        for row in rows:
-            row_line = "┃ "
-            for i, cell in enumerate(row):
-                row_line += f"{str(cell).ljust(col_widths[i])} ┃ "
-            print(row_line[:-3] + f"{Colors.BRIGHT_CYAN}┃{Colors.RESET}")
+        header_cells = ' ┃ '.join(f"{Colors.BOLD}{Colors.BRIGHT_YELLOW}{fit(h, w)}{Colors.RESET}" for h, w in zip(headers, col_widths))
+        out.append(f"{Colors.BRIGHT_CYAN}┏{border}┓{Colors.RESET}\n")
+        out.append(f"┃ {header_cells} {Colors.BRIGHT_CYAN}┃{Colors.RESET}\n")
+        out.append(f"{Colors.BRIGHT_CYAN}┣{border}┫{Colors.RESET}\n")
+        
+        count = 0
+        for row in chain(sample, rows):
+            cells = ' ┃ '.join(fit(cell, w) for cell, w in zip(row, col_widths))
+            out.append(f"┃ {cells} {Colors.BRIGHT_CYAN}┃{Colors.RESET}\n")
+            count += 1
+            
+            if len(out) >= TABLE_FLUSH_ROWS:
+                sys.stdout.write(''.join(out))
+                out = []
+            if page_size and count % page_size == 0:
+                sys.stdout.write(''.join(out))
+                out = []
+                sys.stdout.flush()
+                answer = UI.get_input(f"{Colors.DIM}-- {count} rows shown: Enter for more, q to stop --{Colors.RESET}", Colors.BRIGHT_BLACK)
+                if answer.strip().lower() == 'q':
+                    break
         
-        print(f"{Colors.BRIGHT_CYAN}┗{'━' * (len(header_line) - len(Colors.BOLD) - len(Colors.BRIGHT_YELLOW) - len(Colors.RESET) * 2 - 4)}┛{Colors.RESET}\n")
+        out.append(f"{Colors.BRIGHT_CYAN}┗{border}┛{Colors.RESET}\n\n")
+        sys.stdout.write(''.join(out))
+        sys.stdout.flush()
+        return count
+    
+    @staticmethod
+    def page_rows() -> int:
+        return max(10, shutil.get_terminal_size().lines - 6)
     
     @staticmethod
     def print_success(message: str):
-        print(f"{Colors.BRIGHT_GREEN}✓ {message}{Colors.RESET}")
+        print(f"{Colors.BRIGHT_GREEN}✓ {message}{Colors.RESET}", file=UI.message_stream)
     
     @staticmethod
     def print_error(message: str):
-        print(f"{Colors.BRIGHT_RED}✗ {message}{Colors.RESET}")
+        print(f"{Colors.BRIGHT_RED}✗ {message}{Colors.RESET}", file=UI.message_stream)
     
     @staticmethod
     def print_info(message: str):
-        print(f"{Colors.BRIGHT_BLUE}ℹ {message}{Colors.RESET}")
+        print(f"{Colors.BRIGHT_BLUE}ℹ {message}{Colors.RESET}", file=UI.message_stream)
     
     @staticmethod
     def print_warning(message: str):
-        print(f"{Colors.BRIGHT_YELLOW}⚠ {message}{Colors.RESET}")
+        print(f"{Colors.BRIGHT_YELLOW}⚠ {message}{Colors.RESET}", file=UI.message_stream)
     
     @staticmethod
     def get_input(prompt: str, color=Colors.BRIGHT_CYAN) -> str:
@@ -189,40 +554,868 @@ class UI:
     @staticmethod
     def pause():
         UI.get_input(f"{Colors.DIM}Press Enter to continue...{Colors.RESET}", Colors.BRIGHT_BLACK)
+    
+    @staticmethod
+    def sparkline(values: List[float], width: int = TREND_WIDTH) -> str:
+        if not values:
+            return ''
+        if len(values) > width:
+            # Average consecutive points down to one character each
+            step = len(values) / width
+            values = [
+                sum(chunk) / len(chunk)
+                for chunk in (values[int(i * step):int((i + 1) * step)] for i in range(width))
+                if chunk
+            ]
+        ticks = '▁▂▃▄▅▆▇█'
+        low, high = min(values), max(values)
+        if high == low:
+            return ticks[len(ticks) // 2] * len(values)
+        return ''.join(ticks[int((value - low) / (high - low) * (len(ticks) - 1))] for value in values)
+
+
+
+class ResponseCache:
+    
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_bytes: int = CACHE_MAX_BYTES,
+                 db_path: Optional[str] = None):
+        self.ttls = {**CACHE_TTLS, **(ttls or {})}
+        self.max_bytes = max_bytes
+        self.enabled = True
+        self.refresh = False
+        self.entries: 'OrderedDict[str, Tuple[str, float, int, Any]]' = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self.db = None
+        if db_path:
+            self._open_db(db_path)
+    
+    def _open_db(self, db_path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.db = sqlite3.connect(db_path, check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, resource TEXT NOT NULL, expires REAL NOT NULL, payload TEXT NOT NULL)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS responses_resource ON responses (resource)")
+        self.db.execute("DELETE FROM responses WHERE expires < ?", (time.time(),))
+        self.db.commit()
+    
+    @staticmethod
+    def resource_of(endpoint: str) -> str:
+        return endpoint.strip('/').split('/', 1)[0].split('?', 1)[0]
+    
+    @staticmethod
+    def sizeof(payload: Any) -> int:
+        # Approximate memory a decoded payload holds. Rows of a page share one
+        # shape, so a few are measured and the rest extrapolated.
+        def deep(value: Any) -> int:
+            size = sys.getsizeof(value)
+            if isinstance(value, dict):
+                # Decoders share key strings between rows, so only values are counted
+                size += sum(deep(v) for v in value.values())
+            elif isinstance(value, list):
+                size += sum(deep(item) for item in value)
+            return size
+        
+        rows = payload.get('rows') if isinstance(payload, dict) else None
+        if not isinstance(rows, list) or not rows:
+            return deep(payload)
+        sample = rows[:CACHE_SIZE_SAMPLE_ROWS]
+        per_row = sum(deep(row) for row in sample) / len(sample)
+        envelope = deep({k: v for k, v in payload.items() if k != 'rows'})
+        return envelope + sys.getsizeof(rows) + int(per_row * len(rows))
+    
+    @staticmethod
+    def key_for(endpoint: str, params: Optional[Dict] = None) -> str:
+        query = '&'.join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        return f"/{endpoint.strip('/')}?{query}"
+    
+    def get(self, key: str) -> Optional[Any]:
+        if not self.enabled or self.refresh:
+            return None
+        
+        now = time.time()
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                resource, expires, size, payload = entry
+                if expires > now:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return payload
+                self._drop(key)
+            
+            if self.db is not None:
+                row = self.db.execute(
+                    "SELECT resource, expires, payload FROM responses WHERE key = ? AND expires > ?", (key, now)
+                ).fetchone()
+                if row:
+                    payload = json.loads(row[2])
+                    self._store(key, row[0], row[1], self.sizeof(payload), payload)
+                    self.hits += 1
+                    return payload
+            
+            self.misses += 1
+            return None
+    
+    def put(self, key: str, payload: Any, size: Optional[int] = None):
+        if not self.enabled:
+            return
+        
+        if size is None:
+            size = self.sizeof(payload)
+        resource = self.resource_of(key)
+        expires = time.time() + self.ttls.get(resource, CACHE_DEFAULT_TTL)
+        with self._lock:
+            self._store(key, resource, expires, size, payload)
+            if self.db is not None:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO responses (key, resource, expires, payload) VALUES (?, ?, ?, ?)",
+                    (key, resource, expires, json.dumps(payload)),
+                )
+                self.db.commit()
+    
+    def invalidate(self, resource: str):
+        with self._lock:
+            for key in [k for k, entry in self.entries.items() if entry[0] == resource]:
+                self._drop(key)
+            if self.db is not None:
+                self.db.execute("DELETE FROM responses WHERE resource = ?", (resource,))
+                self.db.commit()
+    
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.size = 0
+            if self.db is not None:
+                self.db.execute("DELETE FROM responses")
+                self.db.commit()
+    
+    def _store(self, key: str, resource: str, expires: float, size: int, payload: Any):
+        if key in self.entries:
+            self._drop(key)
+        if size > self.max_bytes:
+            return
+        
+        self.entries[key] = (resource, expires, size, payload)
+        self.size += size
+        while self.size > self.max_bytes:
+            oldest = next(iter(self.entries))
+            self._drop(oldest)
+            self.evictions += 1
+    
+    def _drop(self, key: str):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[2]
+    
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self.entries),
+                'bytes': self.size,
+            }
+    
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+
+
+class SnipeITError(Exception):
+    
+    def __init__(self, message: str, status: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+# The server answered and refused the request (4xx or a Snipe-IT "status: error" payload)
+class SnipeITAPIError(SnipeITError):
+    pass
+
+
+# Still throttled (429) after every retry
+class SnipeITRateLimited(SnipeITError):
+    pass
+
+
+# Network failure or 5xx after every retry
+class SnipeITUnavailable(SnipeITError):
+    pass
+
+
+# Too many consecutive failures; requests are refused locally until the reset timeout passes
+class SnipeITCircuitOpen(SnipeITUnavailable):
+    pass
+
+
+class CircuitBreaker:
+    # closed -> open after `threshold` consecutive failures; once reset_timeout
+    # passes, half-open admits one probe request and its outcome closes or
+    # re-opens the circuit. Everyone else is refused while the probe runs.
+    
+    def __init__(self, threshold: int = CIRCUIT_FAILURE_THRESHOLD, reset_timeout: float = CIRCUIT_RESET_TIMEOUT):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        # When the half-open probe was admitted; a probe that never reports back
+        # (cancelled, or out of 429 retries) frees the slot after reset_timeout
+        self.probe_started: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return 'half-open'
+        return 'open'
+    
+    def before_call(self):
+        with self._lock:
+            state = self.state
+            if state == 'closed':
+                return
+            now = time.monotonic()
+            if state == 'half-open':
+                if self.probe_started is None or now - self.probe_started >= self.reset_timeout:
+                    self.probe_started = now
+                    return
+                raise SnipeITCircuitOpen("Snipe-IT API unavailable, waiting on a probe request",
+                                         retry_after=RETRY_BACKOFF)
+            remaining = self.reset_timeout - (now - self.opened_at)
+            raise SnipeITCircuitOpen(f"Snipe-IT API unavailable, retrying in {remaining:.0f}s", retry_after=remaining)
+    
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probe_started = None
+    
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.threshold or self.opened_at is not None:
+                # A failed half-open probe re-opens the circuit for another timeout
+                self.opened_at = time.monotonic()
+                self.probe_started = None
 
 
 
+class TokenBucket:
+    
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self, tokens: float = 1.0) -> float:
+        # Takes `tokens` now, going into debt if needed, and returns how long the
+        # caller must wait before using them; callers queue up in reservation order
+        tokens = min(tokens, self.capacity)
+        with self._lock:
+            self._refill()
+            self.tokens -= tokens
+            return max(0.0, -self.tokens / self.rate)
+    
+    def acquire(self, tokens: float = 1.0) -> float:
+        # Blocks until `tokens` are available and returns the seconds spent waiting
+        delay = self.reserve(tokens)
+        if delay:
+            time.sleep(delay)
+        return delay
+    
+    def penalize(self, seconds: float):
+        # Empties the bucket so every caller holds off for `seconds` (e.g. after a 429)
+        with self._lock:
+            # Refill first, or debt that has since been paid off would swallow the penalty
+            self._refill()
+            self.tokens = min(self.tokens, -seconds * self.rate)
+    
+    def _refill(self):
+        # Caller holds the lock
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+
+class JSONDecoder:
+    # Decodes response bodies with the fastest JSON library installed. Given field
+    # paths, list pages keep only those fields of each row; msgspec does that during
+    # parsing, the others project the rows right after.
+    
+    BACKENDS = ('orjson', 'msgspec', 'json')
+    
+    def __init__(self, backend: str = JSON_DECODER):
+        available = {'orjson': orjson is not None, 'msgspec': msgspec is not None, 'json': True}
+        if backend == 'auto':
+            backend = next(name for name in self.BACKENDS if available[name])
+        if backend not in available:
+            raise ValueError(f"Unknown JSON decoder: {backend}")
+        if not available[backend]:
+            raise ValueError(f"JSON decoder {backend} is not installed")
+        self.backend = backend
+        self._typed: Dict[Tuple[Tuple[str, ...], ...], Any] = {}
+    
+    def decode(self, content: bytes, fields: Optional[Tuple[Tuple[str, ...], ...]] = None) -> Any:
+        if self.backend == 'msgspec':
+            try:
+                if fields:
+                    decoder, tree = self._typed_decoder(fields)
+                    try:
+                        data = decoder.decode(content)
+                    except msgspec.ValidationError:
+                        # Valid JSON of an unexpected shape (a list where an object was
+                        # expected, say); decode it untyped and project it like the others
+                        data = msgspec.json.decode(content)
+                    else:
+                        if isinstance(data.get('rows'), list):
+                            for row in data['rows']:
+                                self._fill_parents(row, tree)
+                        return data
+                else:
+                    data = msgspec.json.decode(content)
+            except msgspec.DecodeError as e:
+                # Unlike the other two, msgspec's error is not a ValueError
+                raise ValueError(str(e)) from e
+        elif self.backend == 'orjson':
+            data = orjson.loads(content)
+        else:
+            data = json.loads(content)
+        
+        if fields and isinstance(data, dict) and isinstance(data.get('rows'), list):
+            data['rows'] = [project(row, fields) for row in data['rows']]
+        return data
+    
+    def _typed_decoder(self, fields: Tuple[Tuple[str, ...], ...]) -> Any:
+        # A TypedDict per nesting level; msgspec skips every key it does not name
+        decoder = self._typed.get(fields)
+        if decoder is None:
+            tree: Dict[str, Any] = {}
+            for path in fields:
+                node = tree
+                for key in path[:-1]:
+                    if key in node and node[key] is None:
+                        break
+                    node = node.setdefault(key, {})
+                else:
+                    node[path[-1]] = None
+            
+            def typed(name: str, node: Dict[str, Any]) -> Any:
+                return TypedDict(name, {
+                    key: Any if child is None else Optional[typed(f"{name}_{key}", child)]
+                    for key, child in node.items()
+                }, total=False)
+            
+            page = TypedDict('Page', {'total': int, 'rows': List[typed('Row', tree)],
+                                      'status': str, 'messages': Any}, total=False)
+            decoder = self._typed[fields] = (msgspec.json.Decoder(page), tree)
+        return decoder
+    
+    @classmethod
+    def _fill_parents(cls, row: Dict, tree: Dict[str, Any]):
+        # project() sets a missing parent object to None; msgspec leaves it out
+        for key, child in tree.items():
+            if child is None:
+                continue
+            value = row.get(key)
+            if value is None:
+                row[key] = None
+            elif isinstance(value, dict):
+                cls._fill_parents(value, child)
+
+
+
+class RequestMetrics:
+    # Per-endpoint latency histograms and request, byte, retry, cache and decode
+    # counters. Percentiles are estimated from the buckets the way Prometheus'
+    # histogram_quantile does. Keys are (method, resource), e.g. ('GET', 'hardware').
+    
+    def __init__(self, buckets: Iterable[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.latency: Dict[Tuple[str, str], List[int]] = {}
+        self.latency_sum: Dict[Tuple[str, str], float] = {}
+        self.statuses: Dict[Tuple[str, str, str], int] = {}
+        self.bytes: Dict[Tuple[str, str], int] = {}
+        self.retries: Dict[Tuple[str, str], int] = {}
+        self.cache: Dict[Tuple[str, str], int] = {}
+        self.decode_seconds: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def observe(self, method: str, endpoint: str, status: Any, seconds: float, size: int):
+        # status is the HTTP code, or 'error' when no response came back
+        key = (method, ResponseCache.resource_of(endpoint))
+        slot = bisect_left(self.buckets, seconds)
+        with self._lock:
+            counts = self.latency.get(key)
+            if counts is None:
+                counts = self.latency[key] = [0] * (len(self.buckets) + 1)
+            counts[slot] += 1
+            self.latency_sum[key] = self.latency_sum.get(key, 0.0) + seconds
+            status_key = key + (str(status),)
+            self.statuses[status_key] = self.statuses.get(status_key, 0) + 1
+            self.bytes[key] = self.bytes.get(key, 0) + size
+    
+    def retry(self, method: str, endpoint: str):
+        key = (method, ResponseCache.resource_of(endpoint))
+        with self._lock:
+            self.retries[key] = self.retries.get(key, 0) + 1
+    
+    def cache_lookup(self, endpoint: str, hit: bool):
+        key = (ResponseCache.resource_of(endpoint), 'hit' if hit else 'miss')
+        with self._lock:
+            self.cache[key] = self.cache.get(key, 0) + 1
+    
+    def decoded(self, endpoint: str, seconds: float):
+        resource = ResponseCache.resource_of(endpoint)
+        with self._lock:
+            self.decode_seconds[resource] = self.decode_seconds.get(resource, 0.0) + seconds
+    
+    def quantile(self, q: float, key: Optional[Tuple[str, str]] = None) -> Optional[float]:
+        # key=None merges every endpoint
+        with self._lock:
+            histograms = [self.latency[key]] if key is not None else list(self.latency.values())
+            counts = [sum(column) for column in zip(*histograms)]
+        return self._estimate(q, counts)
+    
+    def _estimate(self, q: float, counts: List[int]) -> Optional[float]:
+        total = sum(counts)
+        if not total:
+            return None
+        rank = q * total
+        seen = 0
+        for slot, count in enumerate(counts):
+            if seen + count >= rank and count:
+                if slot == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[slot - 1] if slot else 0.0
+                return lower + (self.buckets[slot] - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+    
+    def summary(self) -> Dict[str, Any]:
+        # Copy everything under the lock so counts, sums and statuses agree with each other
+        with self._lock:
+            latency = {key: list(counts) for key, counts in self.latency.items()}
+            latency_sum = dict(self.latency_sum)
+            statuses = dict(self.statuses)
+            retries = dict(self.retries)
+            sizes = dict(self.bytes)
+            lookups = dict(self.cache)
+            decode_seconds = dict(self.decode_seconds)
+        
+        endpoints = {}
+        for method, resource in sorted(latency):
+            key = (method, resource)
+            count = sum(latency[key])
+            endpoints[f"{method} {resource}"] = {
+                'requests': count,
+                'statuses': {status: n for (m, r, status), n in sorted(statuses.items()) if (m, r) == key},
+                'retries': retries.get(key, 0),
+                'bytes': sizes.get(key, 0),
+                'mean_ms': round(latency_sum[key] * 1000 / count, 1),
+                **{f"p{int(q * 100)}_ms": round(self._estimate(q, latency[key]) * 1000, 1) for q in (0.5, 0.95, 0.99)},
+            }
+        cache = {}
+        for (resource, result), n in sorted(lookups.items()):
+            cache.setdefault(resource, {'hit': 0, 'miss': 0})[result] = n
+        return {
+            'endpoints': endpoints,
+            'cache': cache,
+            'decode_ms': {resource: round(seconds * 1000, 1) for resource, seconds in sorted(decode_seconds.items())},
+        }
+    
+    def prometheus(self) -> str:
+        def labels(**values) -> str:
+            return '{' + ','.join(f'{name}="{value}"' for name, value in values.items()) + '}'
+        
+        lines = ['# HELP snipelzy_request_duration_seconds Snipe-IT API request latency.',
+                 '# TYPE snipelzy_request_duration_seconds histogram']
+        with self._lock:
+            for (method, resource), counts in sorted(self.latency.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float('inf'),), counts):
+                    cumulative += count
+                    le = '+Inf' if bound == float('inf') else repr(float(bound))
+                    lines.append(f"snipelzy_request_duration_seconds_bucket{labels(method=method, endpoint=resource, le=le)} {cumulative}")
+                lines.append(f"snipelzy_request_duration_seconds_sum{labels(method=method, endpoint=resource)} {self.latency_sum[(method, resource)]:.6f}")
+                lines.append(f"snipelzy_request_duration_seconds_count{labels(method=method, endpoint=resource)} {cumulative}")
+            
+            lines += ['# HELP snipelzy_requests_total Snipe-IT API responses by status.',
+                      '# TYPE snipelzy_requests_total counter']
+            lines += [f"snipelzy_requests_total{labels(method=m, endpoint=r, status=status)} {n}"
+                      for (m, r, status), n in sorted(self.statuses.items())]
+            lines += ['# HELP snipelzy_response_bytes_total Decompressed response body bytes.',
+                      '# TYPE snipelzy_response_bytes_total counter']
+            lines += [f"snipelzy_response_bytes_total{labels(method=m, endpoint=r)} {n}" for (m, r), n in sorted(self.bytes.items())]
+            lines += ['# HELP snipelzy_retries_total Requests sent again after a retryable failure.',
+                      '# TYPE snipelzy_retries_total counter']
+            lines += [f"snipelzy_retries_total{labels(method=m, endpoint=r)} {n}" for (m, r), n in sorted(self.retries.items())]
+            lines += ['# HELP snipelzy_cache_lookups_total Response cache lookups.',
+                      '# TYPE snipelzy_cache_lookups_total counter']
+            lines += [f"snipelzy_cache_lookups_total{labels(endpoint=r, result=result)} {n}" for (r, result), n in sorted(self.cache.items())]
+            lines += ['# HELP snipelzy_decode_seconds_total Time spent decoding JSON responses.',
+                      '# TYPE snipelzy_decode_seconds_total counter']
+            lines += [f"snipelzy_decode_seconds_total{labels(endpoint=r)} {seconds:.6f}" for r, seconds in sorted(self.decode_seconds.items())]
+        return '\n'.join(lines) + '\n'
+    
+    def write_prometheus(self, path: str):
+        # Written whole and renamed, so a node_exporter textfile collector never reads half a file
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as handle:
+            handle.write(self.prometheus())
+        os.replace(temp_path, path)
+
+
 class SnipeITClient:
-    def __init__(self, api_url: str, api_token: str):
+    def __init__(self, api_url: str, api_token: str, pool_size: int = HTTP_POOL_SIZE,
+                 timeout: Any = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT),
+                 cache: Optional[ResponseCache] = None, rate_limit: float = API_RATE_LIMIT,
+                 rate_burst: float = API_RATE_BURST, rate_weights: Optional[Dict[str, float]] = None,
+                 decoder: Optional[JSONDecoder] = None):
+        self._configure(api_url, api_token, timeout, cache, rate_limit, rate_burst, rate_weights, decoder)
+        # One keep-alive pool per host, shared by every call this client makes
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, pool_block=True)
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
+    
+    def _configure(self, api_url: str, api_token: str, timeout: Any, cache: Optional[ResponseCache],
+                   rate_limit: float, rate_burst: float, rate_weights: Optional[Dict[str, float]],
+                   decoder: Optional[JSONDecoder]):
+        # Everything but the HTTP transport, which AsyncSnipeITClient brings its own of
         self.api_url = api_url.rstrip('/')
         self.api_token = api_token
+        self.timeout = timeout
+        self.cache = cache if cache is not None else ResponseCache()
         self.headers = {
             'Authorization': f'Bearer {api_token}',
             'Accept': 'application/json',
-            'Content-Type': 'application/json'
+            'Accept-Encoding': 'gzip, deflate',
+            'Content-Type': 'application/json',
+            'Connection': 'keep-alive',
         }
+        self.request_count = 0
+        self.retry_count = 0
+        self.retries = RETRY_ATTEMPTS
+        self.breaker = CircuitBreaker()
+        # rate_limit is per minute; the bucket refills per second
+        self.limiter = TokenBucket(rate_limit / 60, rate_burst) if rate_limit > 0 else None
+        self.rate_weights = {**API_RATE_WEIGHTS, **(rate_weights or {})}
+        self.throttle_waits: Dict[str, float] = {}
+        self.throttled_count = 0
+        self.decoder = decoder if decoder is not None else JSONDecoder()
+        self.decode_count = 0
+        self.decode_seconds = 0.0
+        self.decode_max = 0.0
+        self.decode_bytes = 0
+        self.last_timings: Dict[str, float] = {}
+        self.metrics = RequestMetrics()
+        self._stats_lock = threading.Lock()
     
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> Optional[Dict]:
-
+    def close(self):
+        self.session.close()
+        self.cache.close()
+    
+    def _connection_counts(self) -> Tuple[int, int]:
+        # (new, reused) connections across the keep-alive pools
+        pools = self.adapter.poolmanager.pools
+        pooled_requests = 0
+        new_connections = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                pooled_requests += pool.num_requests
+                new_connections += pool.num_connections
+        return new_connections, max(0, pooled_requests - new_connections)
+    
+    def connection_stats(self) -> Dict[str, int]:
+        new_connections, reused_connections = self._connection_counts()
+        return {
+            'requests': self.request_count,
+            'retries': self.retry_count,
+            'new_connections': new_connections,
+            'reused_connections': reused_connections,
+            'circuit': self.breaker.state,
+            'throttled': self.throttled_count,
+            'throttle_wait': round(sum(self.throttle_waits.values()), 2),
+            'decoder': self.decoder.backend,
+            'decoded_pages': self.decode_count,
+            'decode_ms_per_page': round(self.decode_seconds * 1000 / self.decode_count, 2) if self.decode_count else 0.0,
+            'decode_ms_max': round(self.decode_max * 1000, 2),
+            'decoded_mb': round(self.decode_bytes / 2 ** 20, 2),
+        }
+    
+    def _make_request(self, method: str, endpoint: str, use_cache: bool = True, **kwargs) -> Optional[Dict]:
+        # Interactive single-record calls: report the failure and return None
+        try:
+            return self._request(method, endpoint, use_cache, **kwargs)
+        except SnipeITError as e:
+            UI.print_error(f"API Error: {str(e)}")
+            return None
+    
+    def _request(self, method: str, endpoint: str, use_cache: bool = True,
+                 fields: Optional[Iterable[Tuple[str, ...]]] = None, store: Optional[bool] = None, **kwargs) -> Dict:
+        # `fields` limits list-page rows to those paths (see JSONDecoder); `store`
+        # (default: use_cache) keeps the response in the cache
         url = f"{self.api_url}/{endpoint.lstrip('/')}"
+        kwargs.setdefault('timeout', self.timeout)
+        fields = tuple(fields) if fields else None
+        
+        cache_key = self._cache_key(method, endpoint, kwargs.get('params'), fields)
+        if cache_key is not None and use_cache:
+            cached = self.cache.get(cache_key)
+            self.metrics.cache_lookup(endpoint, cached is not None)
+            if cached is not None:
+                return cached
+        if not (use_cache if store is None else store):
+            cache_key = None
+        
+        self.breaker.before_call()
+        attempt = 0
+        while True:
+            attempt += 1
+            self._throttle(endpoint)
+            with self._stats_lock:
+                self.request_count += 1
+            
+            started = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.exceptions.RequestException as e:
+                self.metrics.observe(method, endpoint, 'error', time.perf_counter() - started, 0)
+                error = SnipeITUnavailable(f"{method} {endpoint}: {e}")
+                retryable = method == 'GET' or self._never_sent(e)
+            else:
+                self.metrics.observe(method, endpoint, response.status_code, time.perf_counter() - started,
+                                     len(response.content))
+                if response.status_code < 400:
+                    self.breaker.record_success()
+                    return self._handle_body(method, endpoint, response.status_code, response.content, cache_key, fields)
+                error = self._http_error(method, endpoint, response.status_code, response.content, response.headers)
+                retryable = self._retryable(method, response.status_code)
+            
+            delay = self._after_failure(method, endpoint, error, retryable, attempt)
+            time.sleep(delay)
+    
+    # The helpers below hold everything about a request except the I/O, so
+    # AsyncSnipeITClient shares them
+    
+    @staticmethod
+    def _cache_key(method: str, endpoint: str, params: Optional[Dict],
+                   fields: Optional[Tuple[Tuple[str, ...], ...]]) -> Optional[str]:
+        if method != 'GET':
+            return None
+        if fields:
+            params = {**(params or {}), 'fields': ','.join('.'.join(path) for path in fields)}
+        return ResponseCache.key_for(endpoint, params)
+    
+    @staticmethod
+    def _never_sent(error: requests.exceptions.RequestException) -> bool:
+        # Only a failure while connecting proves the server never saw the request,
+        # so only then is a DELETE/POST/PATCH safe to resend. A reset or read
+        # timeout may come after the server already applied it.
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if not isinstance(error, requests.exceptions.ConnectionError) or not error.args:
+            return False
+        return isinstance(getattr(error.args[0], 'reason', None), NewConnectionError)
+    
+    @staticmethod
+    def _retryable(method: str, status: int) -> bool:
+        return status == 429 or (method == 'GET' and status in RETRY_STATUSES)
+    
+    def _after_failure(self, method: str, endpoint: str, error: SnipeITError, retryable: bool, attempt: int) -> float:
+        # Raises when the request is out of attempts, otherwise returns the backoff delay
+        if isinstance(error, SnipeITAPIError):
+            # The server is healthy, it just said no
+            self.breaker.record_success()
+        if not retryable or attempt >= self.retries:
+            if isinstance(error, SnipeITUnavailable):
+                self.breaker.record_failure()
+            raise error
         
+        with self._stats_lock:
+            self.retry_count += 1
+        self.metrics.retry(method, endpoint)
+        if isinstance(error, SnipeITRateLimited) and self.limiter:
+            # Hold back every caller, not just this one, until the server's window resets
+            self.limiter.penalize(error.retry_after or RETRY_BACKOFF)
+        return self._retry_delay(attempt, error.retry_after)
+    
+    def _reserve(self, endpoint: str) -> float:
+        # Takes rate-limit tokens for one request and returns the wait they require
+        if self.limiter is None:
+            return 0.0
+        resource = ResponseCache.resource_of(endpoint)
+        delay = self.limiter.reserve(self.rate_weights.get(resource, 1.0))
+        if delay:
+            with self._stats_lock:
+                self.throttled_count += 1
+                self.throttle_waits[resource] = self.throttle_waits.get(resource, 0.0) + delay
+        return delay
+    
+    def _throttle(self, endpoint: str):
+        delay = self._reserve(endpoint)
+        if delay:
+            time.sleep(delay)
+    
+    def _handle_body(self, method: str, endpoint: str, status: int, content: bytes, cache_key: Optional[str],
+                     fields: Optional[Tuple[Tuple[str, ...], ...]] = None) -> Dict:
+        started = time.perf_counter()
         try:
-            response = requests.request(method, url, headers=self.headers, **kwargs)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            UI.print_error(f"API Error: {str(e)}")
-            if hasattr(e.response, 'text'):
-                UI.print_error(f"Details: {e.response.text}")
+            data = self.decoder.decode(content, fields)
+        except ValueError:
+            raise SnipeITAPIError(f"{method} {endpoint}: response is not JSON", status)
+        elapsed = time.perf_counter() - started
+        with self._stats_lock:
+            self.decode_count += 1
+            self.decode_seconds += elapsed
+            self.decode_max = max(self.decode_max, elapsed)
+            self.decode_bytes += len(content)
+        self.metrics.decoded(endpoint, elapsed)
+        
+        # Snipe-IT reports some failures (e.g. deleting a missing record) as 200 + status=error
+        if isinstance(data, dict) and data.get('status') == 'error':
+            raise SnipeITAPIError(f"{method} {endpoint}: {data.get('messages')}", status)
+        
+        if cache_key is not None:
+            self.cache.put(cache_key, data)
+        elif method != 'GET':
+            self.cache.invalidate(ResponseCache.resource_of(endpoint))
+        return data
+    
+    def _http_error(self, method: str, endpoint: str, status: int, content: bytes, headers: Any) -> SnipeITError:
+        text = content[:200].decode('utf-8', 'replace')
+        message = f"{method} {endpoint}: HTTP {status} {text}".rstrip()
+        if status == 429:
+            return SnipeITRateLimited(message, 429, self._parse_retry_after(headers.get('Retry-After')))
+        if status >= 500:
+            return SnipeITUnavailable(message, status)
+        return SnipeITAPIError(message, status)
+    
+    @staticmethod
+    def _retry_delay(attempt: int, retry_after: Optional[float]) -> float:
+        if retry_after is not None:
+            return min(retry_after, RETRY_MAX_DELAY) + random.uniform(0, RETRY_BACKOFF)
+        delay = min(RETRY_BACKOFF * 2 ** (attempt - 1), RETRY_MAX_DELAY)
+        return delay / 2 + random.uniform(0, delay / 2)
+    
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
             return None
     
-
+    def _iter_rows(self, endpoint: str, limit: Optional[int] = None, page_size: int = PAGE_SIZE,
+                   params: Optional[Dict] = None, workers: int = 1, fresh: bool = False,
+                   fields: Optional[Iterable[Tuple[str, ...]]] = None, start: int = 0,
+                   store: bool = True) -> Iterator[Dict]:
+        # Walks offset/limit pages lazily from row `start`; limit=None means the rest of the collection.
+        # fresh=True skips the cache both ways; store=False still reads it but keeps nothing,
+        # for one-pass readers of whole collections
+        params = dict(params or {})
+        store = store and not fresh
+        first_size = page_size if limit is None else min(page_size, limit)
+        if first_size <= 0:
+            return
+        
+        data = self._request('GET', endpoint, use_cache=not fresh, store=store, fields=fields,
+                             params={**params, 'offset': start, 'limit': first_size})
+        rows = data.get('rows', [])
+        yield from rows
+        
+        total = data.get('total', 0)
+        end = total if limit is None else min(start + limit, total)
+        if not rows or start + len(rows) >= end:
+            return
+        
+        # The server may cap the page below what we asked for; follow its page size
+        page_size = min(page_size, len(rows))
+        if workers > 1:
+            yield from self._iter_pages_parallel(endpoint, params, start + len(rows), end, page_size, workers, fresh, fields,
+                                                 store)
+            return
+        
+        offset = start + len(rows)
+        while offset < end:
+            data = self._request('GET', endpoint, use_cache=not fresh, store=store, fields=fields,
+                                 params={**params, 'offset': offset, 'limit': min(page_size, end - offset)})
+            rows = data.get('rows', [])
+            yield from rows[:end - offset]
+            offset += len(rows)
+            if not rows:
+                return
     
-    def list_assets(self, limit: int = 50, silent: bool = False) -> Optional[List[Dict]]:
+    def _iter_pages_parallel(self, endpoint: str, params: Dict, start: int, end: int,
+                             page_size: int, workers: int, fresh: bool = False,
+                             fields: Optional[Iterable[Tuple[str, ...]]] = None, store: bool = True) -> Iterator[Dict]:
+        # Every remaining offset is known once the first page reports its total,
+        # so fetch them through a bounded pool and release pages in offset order
+        def fetch(offset: int) -> List[Dict]:
+            data = self._request('GET', endpoint, use_cache=not fresh, store=store, fields=fields,
+                                 params={**params, 'offset': offset, 'limit': min(page_size, end - offset)})
+            return data.get('rows', [])
+        
+        offsets = iter(range(start, end, page_size))
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            for offset in islice(offsets, workers * 2):
+                pending.append(executor.submit(fetch, offset))
+            
+            while pending:
+                rows = pending.popleft().result()
+                for offset in islice(offsets, 1):
+                    pending.append(executor.submit(fetch, offset))
+                yield from rows
+        finally:
+            # A consumer that stops early (e.g. 'q' in a list view) must not wait
+            # for, or pay rate-limit tokens on, pages nobody will read
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def iter_rows(self, resource: str, limit: Optional[int] = None, page_size: int = PAGE_SIZE,
+                  params: Optional[Dict] = None, workers: int = 1, fresh: bool = False,
+                  fields: Optional[Iterable[Tuple[str, ...]]] = None, start: int = 0,
+                  store: bool = True) -> Iterator[Dict]:
+        # Any resource by name ('assets', 'users', ...), with every paging option of _iter_rows
+        return self._iter_rows(RESOURCE_ENDPOINTS[resource], limit, page_size, params=params, workers=workers,
+                               fresh=fresh, fields=fields, start=start, store=store)
+    
+    def iter_assets(self, limit: Optional[int] = None, page_size: int = PAGE_SIZE, workers: int = 1,
+                    fresh: bool = False, fields: Optional[Iterable[Tuple[str, ...]]] = None) -> Iterator[Dict]:
+        return self._iter_rows('/hardware', limit, page_size, workers=workers, fresh=fresh, fields=fields)
+    
+    def list_assets(self, limit: Optional[int] = 50, silent: bool = False, page_size: int = PAGE_SIZE,
+                    workers: int = FETCH_WORKERS, fresh: bool = False,
+                    fields: Optional[Iterable[Tuple[str, ...]]] = None) -> List[Dict]:
         if not silent:
             UI.print_info(f"Fetching assets...")
-        data = self._make_request('GET', f'/hardware?limit={limit}')
-        return data.get('rows', []) if data else []
+        return list(self.iter_assets(limit, page_size, workers, fresh, fields))
     
     def get_asset(self, asset_id: int) -> Optional[Dict]:
         return self._make_request('GET', f'/hardware/{asset_id}')
@@ -232,11 +1425,16 @@ class SnipeITClient:
         return result is not None
     
 
-    def list_licenses(self, limit: int = 50, silent: bool = False) -> Optional[List[Dict]]:
+    def iter_licenses(self, limit: Optional[int] = None, page_size: int = PAGE_SIZE, workers: int = 1,
+                      fresh: bool = False, fields: Optional[Iterable[Tuple[str, ...]]] = None) -> Iterator[Dict]:
+        return self._iter_rows('/licenses', limit, page_size, workers=workers, fresh=fresh, fields=fields)
+    
+    def list_licenses(self, limit: Optional[int] = 50, silent: bool = False, page_size: int = PAGE_SIZE,
+                      workers: int = FETCH_WORKERS, fresh: bool = False,
+                      fields: Optional[Iterable[Tuple[str, ...]]] = None) -> List[Dict]:
         if not silent:
             UI.print_info(f"Fetching licenses...")
-        data = self._make_request('GET', f'/licenses?limit={limit}')
-        return data.get('rows', []) if data else []
+        return list(self.iter_licenses(limit, page_size, workers, fresh, fields))
     
     def get_license(self, license_id: int) -> Optional[Dict]:
         return self._make_request('GET', f'/licenses/{license_id}')
@@ -247,264 +1445,2121 @@ class SnipeITClient:
     
 
     
-    def list_users(self, limit: int = 50, silent: bool = False) -> Optional[List[Dict]]:
+    def iter_users(self, limit: Optional[int] = None, page_size: int = PAGE_SIZE, workers: int = 1,
+                   fresh: bool = False, fields: Optional[Iterable[Tuple[str, ...]]] = None) -> Iterator[Dict]:
+        return self._iter_rows('/users', limit, page_size, workers=workers, fresh=fresh, fields=fields)
+    
+    def list_users(self, limit: Optional[int] = 50, silent: bool = False, page_size: int = PAGE_SIZE,
+                   workers: int = FETCH_WORKERS, fresh: bool = False,
+                   fields: Optional[Iterable[Tuple[str, ...]]] = None) -> List[Dict]:
         if not silent:
             UI.print_info(f"Fetching users...")
-        data = self._make_request('GET', f'/users?limit={limit}')
-        return data.get('rows', []) if data else []
+        return list(self.iter_users(limit, page_size, workers, fresh, fields))
     
     def get_user(self, user_id: int) -> Optional[Dict]:
         return self._make_request('GET', f'/users/{user_id}')
     
-    def delete_user(self, user_id: int) -> bool:
-        result = self._make_request('DELETE', f'/users/{user_id}')
-        return result is not None
+    def delete_user(self, user_id: int) -> bool:
+        result = self._make_request('DELETE', f'/users/{user_id}')
+        return result is not None
+    
+
+    
+    def iter_categories(self, limit: Optional[int] = None, page_size: int = PAGE_SIZE, workers: int = 1,
+                        fields: Optional[Iterable[Tuple[str, ...]]] = None) -> Iterator[Dict]:
+        return self._iter_rows('/categories', limit, page_size, workers=workers, fields=fields)
+    
+    def list_categories(self, limit: Optional[int] = 50, page_size: int = PAGE_SIZE,
+                        workers: int = FETCH_WORKERS, fields: Optional[Iterable[Tuple[str, ...]]] = None) -> List[Dict]:
+        UI.print_info(f"Fetching categories...")
+        return list(self.iter_categories(limit, page_size, workers, fields=fields))
+    
+
+    def iter_locations(self, limit: Optional[int] = None, page_size: int = PAGE_SIZE, workers: int = 1,
+                       fields: Optional[Iterable[Tuple[str, ...]]] = None) -> Iterator[Dict]:
+        return self._iter_rows('/locations', limit, page_size, workers=workers, fields=fields)
+    
+    def list_locations(self, limit: Optional[int] = 50, page_size: int = PAGE_SIZE,
+                       workers: int = FETCH_WORKERS, fields: Optional[Iterable[Tuple[str, ...]]] = None) -> List[Dict]:
+        UI.print_info(f"Fetching locations...")
+        return list(self.iter_locations(limit, page_size, workers, fields=fields))
+
+    def iter_models(self, limit: Optional[int] = None, page_size: int = PAGE_SIZE, workers: int = 1,
+                    fields: Optional[Iterable[Tuple[str, ...]]] = None) -> Iterator[Dict]:
+        return self._iter_rows('/models', limit, page_size, workers=workers, fields=fields)
+    
+    def list_models(self, limit: Optional[int] = 50, page_size: int = PAGE_SIZE,
+                    workers: int = FETCH_WORKERS, fields: Optional[Iterable[Tuple[str, ...]]] = None) -> List[Dict]:
+        UI.print_info(f"Fetching models...")
+        return list(self.iter_models(limit, page_size, workers, fields=fields))
+    
+
+    def search(self, endpoint: str, search_term: str, limit: Optional[int] = None,
+               fields: Optional[Iterable[Tuple[str, ...]]] = None) -> List[Dict]:
+        return list(self._iter_rows(endpoint, limit, params={'search': search_term}, workers=FETCH_WORKERS,
+                                    fields=fields))
+    
+    def search_everything(self, search_term: str, limit: Optional[int] = 100,
+                          fields: Optional[Dict[str, Iterable[Tuple[str, ...]]]] = None) -> Dict[str, List[Dict]]:
+        # Snipe-IT filters server-side, so nothing past the first page is missed.
+        # `fields` maps a resource to the paths to keep from its rows.
+        fields = fields or {}
+        calls = {
+            resource: (lambda resource=resource, endpoint=endpoint:
+                       self.search(endpoint, search_term, limit, fields.get(resource)))
+            for resource, endpoint in MONITOR_ENDPOINTS.items()
+        }
+        results, self.last_timings = self.fan_out(calls)
+        return results
+    
+    def fan_out(self, calls: Dict[str, Callable[[], Any]],
+                workers: int = FETCH_WORKERS) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        # Runs independent calls concurrently and times each one
+        timings = {}
+        
+        def timed(name: str, call: Callable[[], Any]) -> Any:
+            started = time.perf_counter()
+            try:
+                return call()
+            finally:
+                timings[name] = time.perf_counter() - started
+        
+        if not calls:
+            return {}, timings
+        with ThreadPoolExecutor(max_workers=min(workers, len(calls))) as executor:
+            futures = {name: executor.submit(timed, name, call) for name, call in calls.items()}
+            results = {name: future.result() for name, future in futures.items()}
+        
+        return results, timings
+    
+    def get_many(self, resource: str, ids: Iterable[int], workers: int = FETCH_WORKERS) -> Dict[int, Optional[Dict]]:
+        # Full records for several IDs in one concurrent batch; failures come back as None
+        get_detail = getattr(self, DETAIL_METHODS[resource])
+        details, _ = self.fan_out({record_id: (lambda record_id=record_id: get_detail(record_id))
+                                   for record_id in dict.fromkeys(ids)}, workers)
+        return details
+    
+    def statistics_calls(self) -> Dict[str, Callable[[], int]]:
+        def total(endpoint: str) -> int:
+            return self._request('GET', endpoint, params={'limit': 1}).get('total', 0)
+        
+        return {name: (lambda endpoint=endpoint: total(endpoint)) for name, endpoint in STATISTICS_ENDPOINTS.items()}
+    
+    def get_statistics(self) -> Dict[str, int]:
+        stats, self.last_timings = self.fan_out(self.statistics_calls())
+        return stats
+
+
+class AsyncSnipeITClient(SnipeITClient):
+    # Same API as SnipeITClient on one asyncio loop: list_*, get_*, delete_*, search*
+    # and get_statistics are coroutines, iter_* are async iterators. Cache, decoder,
+    # retry, circuit breaker and rate limiter logic are shared with the sync client.
+    # iter_* and get_* are inherited: they call _iter_rows/_make_request, which are
+    # coroutines here.
+    
+    def __init__(self, api_url: str, api_token: str, pool_size: int = ASYNC_POOL_SIZE,
+                 concurrency: int = ASYNC_CONCURRENCY, timeout: Any = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT),
+                 cache: Optional[ResponseCache] = None, rate_limit: float = API_RATE_LIMIT,
+                 rate_burst: float = API_RATE_BURST, rate_weights: Optional[Dict[str, float]] = None,
+                 decoder: Optional[JSONDecoder] = None):
+        if aiohttp is None:
+            raise RuntimeError("the async client needs aiohttp (pip install aiohttp)")
+        # No requests session: the aiohttp one is opened on first use
+        self._configure(api_url, api_token, timeout, cache, rate_limit, rate_burst, rate_weights, decoder)
+        self.pool_size = pool_size
+        self.concurrency = concurrency
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.owns_cache = True
+        self.loop = asyncio.new_event_loop()
+        self._http: Optional['aiohttp.ClientSession'] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+    
+    @classmethod
+    def from_client(cls, client: SnipeITClient, pool_size: int = ASYNC_POOL_SIZE,
+                    concurrency: int = ASYNC_CONCURRENCY) -> 'AsyncSnipeITClient':
+        # Shares the cache, decoder, breaker and rate limiter, so both clients
+        # count against the same server budget
+        async_client = cls(client.api_url, client.api_token, pool_size, concurrency, timeout=client.timeout,
+                           cache=client.cache, decoder=client.decoder, rate_limit=0)
+        async_client.limiter = client.limiter
+        async_client.rate_weights = client.rate_weights
+        async_client.breaker = client.breaker
+        async_client.retries = client.retries
+        async_client.metrics = client.metrics
+        async_client.owns_cache = False
+        return async_client
+    
+    def run(self, coroutine: Awaitable) -> Any:
+        # Entry point from synchronous code
+        return self.loop.run_until_complete(coroutine)
+    
+    async def _open(self) -> 'aiohttp.ClientSession':
+        if self._http is None:
+            trace = aiohttp.TraceConfig()
+            trace.on_connection_create_end.append(self._on_connection_created)
+            trace.on_connection_reuseconn.append(self._on_connection_reused)
+            connect, read = self.timeout if isinstance(self.timeout, tuple) else (None, self.timeout)
+            self._http = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=self.pool_size, limit_per_host=self.pool_size),
+                timeout=aiohttp.ClientTimeout(sock_connect=connect, sock_read=read),
+                trace_configs=[trace],
+            )
+            self._slots = asyncio.Semaphore(self.concurrency)
+        return self._http
+    
+    async def _on_connection_created(self, session, context, params):
+        self.new_connections += 1
+    
+    async def _on_connection_reused(self, session, context, params):
+        self.reused_connections += 1
+    
+    def close(self):
+        if self._http is not None:
+            self.run(self._http.close())
+            self._http = None
+        self.loop.close()
+        if self.owns_cache:
+            self.cache.close()
+    
+    def _connection_counts(self) -> Tuple[int, int]:
+        return self.new_connections, self.reused_connections
+    
+    async def _make_request(self, method: str, endpoint: str, use_cache: bool = True, **kwargs) -> Optional[Dict]:
+        try:
+            return await self._request(method, endpoint, use_cache, **kwargs)
+        except SnipeITError as e:
+            UI.print_error(f"API Error: {str(e)}")
+            return None
+    
+    async def _request(self, method: str, endpoint: str, use_cache: bool = True,
+                       fields: Optional[Iterable[Tuple[str, ...]]] = None, store: Optional[bool] = None,
+                       **kwargs) -> Dict:
+        url = f"{self.api_url}/{endpoint.lstrip('/')}"
+        kwargs.pop('timeout', None)
+        fields = tuple(fields) if fields else None
+        
+        cache_key = self._cache_key(method, endpoint, kwargs.get('params'), fields)
+        if cache_key is not None and use_cache:
+            cached = self.cache.get(cache_key)
+            self.metrics.cache_lookup(endpoint, cached is not None)
+            if cached is not None:
+                return cached
+        if not (use_cache if store is None else store):
+            cache_key = None
+        
+        self.breaker.before_call()
+        http = await self._open()
+        attempt = 0
+        while True:
+            attempt += 1
+            delay = self._reserve(endpoint)
+            if delay:
+                await asyncio.sleep(delay)
+            with self._stats_lock:
+                self.request_count += 1
+            
+            try:
+                async with self._slots:
+                    started = time.perf_counter()
+                    async with http.request(method, url, **kwargs) as response:
+                        status, content, headers = response.status, await response.read(), response.headers
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.metrics.observe(method, endpoint, 'error', time.perf_counter() - started, 0)
+                error = SnipeITUnavailable(f"{method} {endpoint}: {e or type(e).__name__}")
+                # ClientConnectorError is raised before anything is sent (see _never_sent)
+                retryable = method == 'GET' or isinstance(e, aiohttp.ClientConnectorError)
+            else:
+                self.metrics.observe(method, endpoint, status, time.perf_counter() - started, len(content))
+                if status < 400:
+                    self.breaker.record_success()
+                    return self._handle_body(method, endpoint, status, content, cache_key, fields)
+                error = self._http_error(method, endpoint, status, content, headers)
+                retryable = self._retryable(method, status)
+            
+            await asyncio.sleep(self._after_failure(method, endpoint, error, retryable, attempt))
+    
+    async def _iter_rows(self, endpoint: str, limit: Optional[int] = None, page_size: int = PAGE_SIZE,
+                         params: Optional[Dict] = None, workers: int = 1, fresh: bool = False,
+                         fields: Optional[Iterable[Tuple[str, ...]]] = None, start: int = 0,
+                         store: bool = True) -> AsyncIterator[Dict]:
+        # Same paging as SnipeITClient._iter_rows; `workers` pages are requested at once
+        params = dict(params or {})
+        store = store and not fresh
+        first_size = page_size if limit is None else min(page_size, limit)
+        if first_size <= 0:
+            return
+        
+        data = await self._request('GET', endpoint, use_cache=not fresh, store=store, fields=fields,
+                                   params={**params, 'offset': start, 'limit': first_size})
+        rows = data.get('rows', [])
+        for row in rows:
+            yield row
+        
+        total = data.get('total', 0)
+        end = total if limit is None else min(start + limit, total)
+        if not rows or start + len(rows) >= end:
+            return
+        
+        page_size = min(page_size, len(rows))
+        
+        async def fetch(offset: int) -> List[Dict]:
+            data = await self._request('GET', endpoint, use_cache=not fresh, store=store, fields=fields,
+                                       params={**params, 'offset': offset, 'limit': min(page_size, end - offset)})
+            return data.get('rows', [])
+        
+        # A window of page tasks in flight, released in offset order
+        offsets = iter(range(start + len(rows), end, page_size))
+        pending = deque(asyncio.ensure_future(fetch(offset)) for offset in islice(offsets, max(1, workers)))
+        try:
+            while pending:
+                rows = await pending.popleft()
+                for offset in islice(offsets, 1):
+                    pending.append(asyncio.ensure_future(fetch(offset)))
+                for row in rows:
+                    yield row
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    async def _list(self, rows: AsyncIterator[Dict], label: Optional[str] = None) -> List[Dict]:
+        if label:
+            UI.print_info(f"Fetching {label}...")
+        return [row async for row in rows]
+    
+    async def list_assets(self, limit: Optional[int] = 50, silent: bool = False, page_size: int = PAGE_SIZE,
+                          workers: int = FETCH_WORKERS, fresh: bool = False,
+                          fields: Optional[Iterable[Tuple[str, ...]]] = None) -> List[Dict]:
+        return await self._list(self.iter_assets(limit, page_size, workers, fresh, fields), None if silent else 'assets')
+    
+    async def list_licenses(self, limit: Optional[int] = 50, silent: bool = False, page_size: int = PAGE_SIZE,
+                            workers: int = FETCH_WORKERS, fresh: bool = False,
+                            fields: Optional[Iterable[Tuple[str, ...]]] = None) -> List[Dict]:
+        return await self._list(self.iter_licenses(limit, page_size, workers, fresh, fields), None if silent else 'licenses')
+    
+    async def list_users(self, limit: Optional[int] = 50, silent: bool = False, page_size: int = PAGE_SIZE,
+                         workers: int = FETCH_WORKERS, fresh: bool = False,
+                         fields: Optional[Iterable[Tuple[str, ...]]] = None) -> List[Dict]:
+        return await self._list(self.iter_users(limit, page_size, workers, fresh, fields), None if silent else 'users')
+    
+    async def list_categories(self, limit: Optional[int] = 50, page_size: int = PAGE_SIZE,
+                              workers: int = FETCH_WORKERS, fields: Optional[Iterable[Tuple[str, ...]]] = None) -> List[Dict]:
+        return await self._list(self.iter_categories(limit, page_size, workers, fields=fields), 'categories')
+    
+    async def list_locations(self, limit: Optional[int] = 50, page_size: int = PAGE_SIZE,
+                             workers: int = FETCH_WORKERS, fields: Optional[Iterable[Tuple[str, ...]]] = None) -> List[Dict]:
+        return await self._list(self.iter_locations(limit, page_size, workers, fields=fields), 'locations')
+    
+    async def list_models(self, limit: Optional[int] = 50, page_size: int = PAGE_SIZE,
+                          workers: int = FETCH_WORKERS, fields: Optional[Iterable[Tuple[str, ...]]] = None) -> List[Dict]:
+        return await self._list(self.iter_models(limit, page_size, workers, fields=fields), 'models')
+    
+    async def delete_asset(self, asset_id: int) -> bool:
+        return await self._make_request('DELETE', f'/hardware/{asset_id}') is not None
+    
+    async def delete_license(self, license_id: int) -> bool:
+        return await self._make_request('DELETE', f'/licenses/{license_id}') is not None
+    
+    async def delete_user(self, user_id: int) -> bool:
+        return await self._make_request('DELETE', f'/users/{user_id}') is not None
+    
+    async def search(self, endpoint: str, search_term: str, limit: Optional[int] = None,
+                     fields: Optional[Iterable[Tuple[str, ...]]] = None) -> List[Dict]:
+        return await self._list(self._iter_rows(endpoint, limit, params={'search': search_term}, workers=FETCH_WORKERS,
+                                                fields=fields))
+    
+    async def search_everything(self, search_term: str, limit: Optional[int] = 100,
+                                fields: Optional[Dict[str, Iterable[Tuple[str, ...]]]] = None) -> Dict[str, List[Dict]]:
+        fields = fields or {}
+        calls = {
+            resource: (lambda resource=resource, endpoint=endpoint:
+                       self.search(endpoint, search_term, limit, fields.get(resource)))
+            for resource, endpoint in MONITOR_ENDPOINTS.items()
+        }
+        results, self.last_timings = await self.gather(calls)
+        return results
+    
+    async def gather(self, calls: Dict[str, Callable[[], Awaitable]],
+                     limit: int = ASYNC_CONCURRENCY) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        # The async fan_out: at most `limit` calls run at once, each one timed
+        timings = {}
+        gate = asyncio.Semaphore(limit)
+        
+        async def timed(name: str, call: Callable[[], Awaitable]) -> Any:
+            async with gate:
+                started = time.perf_counter()
+                try:
+                    return await call()
+                finally:
+                    timings[name] = time.perf_counter() - started
+        
+        values = await asyncio.gather(*(timed(name, call) for name, call in calls.items()))
+        return dict(zip(calls, values)), timings
+    
+    def fan_out(self, calls: Dict[str, Callable[[], Awaitable]],
+                workers: int = ASYNC_CONCURRENCY) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        # Runs coroutine factories from synchronous code, e.g. the manager's views
+        return self.run(self.gather(calls, limit=workers))
+    
+    async def get_many(self, resource: str, ids: Iterable[int],
+                       workers: int = ASYNC_CONCURRENCY) -> Dict[int, Optional[Dict]]:
+        get_detail = getattr(self, DETAIL_METHODS[resource])
+        details, _ = await self.gather({record_id: (lambda record_id=record_id: get_detail(record_id))
+                                        for record_id in dict.fromkeys(ids)}, workers)
+        return details
+    
+    def statistics_calls(self) -> Dict[str, Callable[[], Awaitable]]:
+        async def total(endpoint: str) -> int:
+            data = await self._request('GET', endpoint, params={'limit': 1})
+            return data.get('total', 0)
+        
+        return {name: (lambda endpoint=endpoint: total(endpoint)) for name, endpoint in STATISTICS_ENDPOINTS.items()}
+    
+    async def get_statistics(self) -> Dict[str, int]:
+        stats, self.last_timings = await self.gather(self.statistics_calls())
+        return stats
+
+
+
+class RecordStore:
+    # Column-per-field storage for mirrored records. Only the fields the list, diff,
+    # search and summary views read are kept, and values that repeat across records
+    # (model, status and location names, timestamps, custom field sets) are stored once.
+    # Reads rebuild a small nested dict, so pluck() and DiffEngine work unchanged.
+    
+    def __init__(self, resource: str):
+        self.resource = resource
+        self.paths = self.fields_for(resource)
+        self.shared = [len(path) > 1 for path in self.paths]
+        self.columns: List[List[Any]] = [[] for _ in self.paths]
+        self.custom: List[Optional[Tuple]] = []
+        self.rows: Dict[Any, int] = {}
+        self.free: List[int] = []
+        self.pool: Dict[Any, Any] = {}
+    
+    @staticmethod
+    def fields_for(resource: str) -> List[Tuple[str, ...]]:
+        paths = [('id',), ('updated_at', 'datetime')]
+        for columns in (LIST_COLUMNS, TRACKED_FIELDS, SUMMARY_FIELDS):
+            paths += [path for _, path in columns.get(resource, [])]
+        if resource == 'assets':
+            paths += ASSIGNEE_FIELDS
+        paths += SEARCH_FIELDS.get(resource, [])
+        return list(dict.fromkeys(paths))
+    
+    @classmethod
+    def fetch_fields(cls, resource: str) -> List[Tuple[str, ...]]:
+        # What to decode from API rows that will be stored: the columns plus custom fields
+        return cls.fields_for(resource) + [('custom_fields',)]
+    
+    def _intern(self, value: Any) -> Any:
+        return self.pool.setdefault(value, value)
+    
+    def _encode(self, record: Dict) -> Tuple[List[Any], Optional[Tuple]]:
+        values = []
+        for path, shared in zip(self.paths, self.shared):
+            value = pluck(record, path)
+            values.append(self._intern(value) if shared and isinstance(value, str) else value)
+        
+        custom = None
+        custom_fields = record.get('custom_fields')
+        if isinstance(custom_fields, dict):
+            custom = self._intern(tuple(sorted(
+                (name, field.get('value') if isinstance(field, dict) else field)
+                for name, field in custom_fields.items()
+            )))
+        return values, custom
+    
+    def _decode(self, values: Iterable[Any], custom: Optional[Tuple]) -> Dict:
+        record: Dict[str, Any] = {}
+        for path, value in zip(self.paths, values):
+            target = record
+            for key in path[:-1]:
+                target = target.setdefault(key, {})
+            target[path[-1]] = value
+        if custom is not None:
+            record['custom_fields'] = dict(custom)
+        return record
+    
+    def project(self, record: Dict) -> Dict:
+        return self._decode(*self._encode(record))
+    
+    def _row(self, row: int) -> Dict:
+        return self._decode((column[row] for column in self.columns), self.custom[row])
+    
+    def __setitem__(self, record_id: Any, record: Dict):
+        values, custom = self._encode(record)
+        row = self.rows.get(record_id)
+        if row is None:
+            if self.free:
+                row = self.free.pop()
+            else:
+                row = len(self.custom)
+                for column in self.columns:
+                    column.append(None)
+                self.custom.append(None)
+            self.rows[record_id] = row
+        for column, value in zip(self.columns, values):
+            column[row] = value
+        self.custom[row] = custom
+    
+    def get(self, record_id: Any, default: Optional[Dict] = None) -> Optional[Dict]:
+        row = self.rows.get(record_id)
+        return default if row is None else self._row(row)
+    
+    def pop(self, record_id: Any) -> Dict:
+        row = self.rows.pop(record_id)
+        record = self._row(row)
+        for column in self.columns:
+            column[row] = None
+        self.custom[row] = None
+        self.free.append(row)
+        return record
+    
+    def clear(self):
+        self.columns = [[] for _ in self.paths]
+        self.custom = []
+        self.rows = {}
+        self.free = []
+    
+    def values(self) -> Iterator[Dict]:
+        return (self._row(row) for row in self.rows.values())
+    
+    def items(self) -> Iterator[Tuple[Any, Dict]]:
+        return ((record_id, self._row(row)) for record_id, row in self.rows.items())
+    
+    def __contains__(self, record_id: Any) -> bool:
+        return record_id in self.rows
+    
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.rows)
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+class InventoryMirror:
+    
+    def __init__(self, client: SnipeITClient, endpoint: str, page_size: int = PAGE_SIZE,
+                 sweep_every: int = SYNC_SWEEP_EVERY, store: Optional[RecordStore] = None):
+        self.client = client
+        self.endpoint = endpoint
+        self.page_size = page_size
+        self.sweep_every = sweep_every
+        self.store = store
+        self.records: Any = store if store is not None else {}
+        # A compact store keeps a fixed set of fields, so only those need decoding
+        self.fields = RecordStore.fetch_fields(store.resource) if store is not None else None
+        self.watermark = ''
+        self.ticks = 0
+        self.rows_fetched = 0
+        self.sweeps = 0
+    
+    @staticmethod
+    def updated_at(record: Dict) -> str:
+        value = record.get('updated_at')
+        if isinstance(value, dict):
+            value = value.get('datetime')
+        return value or ''
+    
+    def load(self) -> int:
+        self.records.clear()
+        watermark = ''
+        for record in self.client._iter_rows(self.endpoint, workers=FETCH_WORKERS, fresh=True, fields=self.fields):
+            if record.get('id'):
+                self.records[record['id']] = record
+                watermark = max(watermark, self.updated_at(record))
+        self.rows_fetched += len(self.records)
+        self.watermark = watermark
+        return len(self.records)
+    
+    def project(self, record: Dict) -> Dict:
+        # The form records are kept in, so fetched rows compare equal to stored ones
+        return self.store.project(record) if self.store is not None else record
+    
+    def sync(self) -> Tuple[List[Dict], List[Dict]]:
+        # Returns (previous, current) versions of every record that changed since
+        # the last tick; deleted records only appear in previous, new ones only in current.
+        # Nothing is applied unless every request of the tick succeeds, so a failed
+        # tick is simply retried next time.
+        self.ticks += 1
+        updates: Dict[Any, Dict] = {}
+        watermark = self.watermark
+        total = None
+        offset = 0
+        size = SYNC_PAGE_SIZE
+        params = {'sort': 'updated_at', 'order': 'desc'}
+        
+        while True:
+            data = self.client._request('GET', self.endpoint, use_cache=False, fields=self.fields,
+                                        params={**params, 'offset': offset, 'limit': size})
+            rows = data.get('rows', [])
+            if total is None:
+                total = data.get('total', 0)
+            self.rows_fetched += len(rows)
+            
+            reached_watermark = False
+            for record in rows:
+                stamp = self.updated_at(record)
+                # Records stamped in the watermark second are re-read, so ties are never missed
+                if stamp < self.watermark:
+                    reached_watermark = True
+                    break
+                record_id = record.get('id')
+                if record_id and record_id not in updates:
+                    record = self.project(record)
+                    if self.records.get(record_id) != record:
+                        updates[record_id] = record
+                watermark = max(watermark, stamp)
+            
+            offset += len(rows)
+            if reached_watermark or not rows or offset >= total:
+                break
+            size = min(size * 2, self.page_size)
+        
+        expected = len(self.records) + sum(1 for record_id in updates if record_id not in self.records)
+        live_ids = None
+        if total != expected or self.ticks % self.sweep_every == 0:
+            live_ids = self._live_ids()
+        
+        previous, current = [], []
+        for record_id, record in updates.items():
+            old = self.records.get(record_id)
+            if old is not None:
+                previous.append(old)
+            current.append(record)
+            self.records[record_id] = record
+        self.watermark = watermark
+        
+        if live_ids is not None:
+            previous.extend(self.records.pop(record_id) for record_id in list(self.records) if record_id not in live_ids)
+        
+        return previous, current
+    
+    def _live_ids(self) -> set:
+        # Snipe-IT has no ID-only listing, so walk the pages but keep nothing but IDs
+        self.sweeps += 1
+        live_ids = set()
+        for record in self.client._iter_rows(self.endpoint, workers=FETCH_WORKERS, fresh=True, fields=[('id',)]):
+            live_ids.add(record.get('id'))
+            self.rows_fetched += 1
+        return live_ids
+
+
+
+@dataclass
+class ChangeSet:
+    added: List[Dict]
+    removed: List[Dict]
+    changed: List[Dict]
+    
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+    
+    @staticmethod
+    def assignee(record: Optional[Dict]) -> Optional[Dict]:
+        # The user an asset is checked out to; assets and locations can be assignees too
+        target = (record or {}).get('assigned_to')
+        if not isinstance(target, dict) or target.get('type', 'user') != 'user' or target.get('id') is None:
+            return None
+        return {'id': target['id'], 'username': target.get('username')}
+    
+    def events(self, resource: str, timestamp: str) -> Iterator[Dict]:
+        def event(kind: str, record: Dict, field: Optional[str] = None, before: Any = None, after: Any = None) -> Dict:
+            return {
+                'time': timestamp,
+                'resource': resource,
+                'event': kind,
+                'id': record.get('id'),
+                # Users by username: their full name is not kept when mirroring compactly
+                'name': record.get('username') if resource == 'users' else record.get('name'),
+                'field': field,
+                'from': before,
+                'to': after,
+            }
+        
+        for record in self.added:
+            yield event('added', record)
+        for record in self.removed:
+            yield event('removed', record)
+        for change in self.changed:
+            for field, before, after in change['fields']:
+                entry = event('changed', change['record'], field, before, after)
+                if field == 'Assignment':
+                    entry['from_user'] = self.assignee(change.get('previous'))
+                    entry['to_user'] = self.assignee(change['record'])
+                yield entry
+
+
+class Snapshot:
+    # Records indexed by ID, each with a fingerprint of the fields the diff looks at
+    
+    def __init__(self, engine: 'DiffEngine', records: Iterable[Dict]):
+        self.records: Dict[Any, Dict] = {}
+        self.fingerprints: Dict[Any, int] = {}
+        for record in records:
+            record_id = record.get('id')
+            if record_id:
+                self.records[record_id] = record
+                self.fingerprints[record_id] = engine.fingerprint(record)
+    
+    def __len__(self) -> int:
+        return len(self.records)
+
+
+class DiffEngine:
+    
+    def __init__(self, resource: str):
+        self.resource = resource
+        self.fields = TRACKED_FIELDS[resource]
+    
+    def values(self, record: Dict) -> Tuple:
+        values = tuple(pluck(record, path) for _, path in self.fields)
+        if self.resource == 'assets':
+            # A move between two users with the same display name is still a new assignment
+            values += (pluck(record, ('assigned_to', 'id')),)
+        custom_fields = record.get('custom_fields')
+        if isinstance(custom_fields, dict):
+            values += tuple(sorted(
+                (name, field.get('value') if isinstance(field, dict) else field)
+                for name, field in custom_fields.items()
+            ))
+        return values
+    
+    def fingerprint(self, record: Dict) -> int:
+        return hash(self.values(record))
+    
+    def snapshot(self, records: Iterable[Dict]) -> Snapshot:
+        return Snapshot(self, records)
+    
+    def diff(self, previous: Snapshot, current: Snapshot) -> ChangeSet:
+        added = [record for record_id, record in current.records.items() if record_id not in previous.records]
+        removed = [record for record_id, record in previous.records.items() if record_id not in current.records]
+        
+        changed = []
+        previous_fingerprints = previous.fingerprints
+        for record_id, fingerprint in current.fingerprints.items():
+            old_fingerprint = previous_fingerprints.get(record_id)
+            if old_fingerprint is None or old_fingerprint == fingerprint:
+                continue
+            fields = self.changed_fields(previous.records[record_id], current.records[record_id])
+            if fields:
+                changed.append({'id': record_id, 'record': current.records[record_id],
+                                'previous': previous.records[record_id], 'fields': fields})
+        
+        return ChangeSet(added, removed, changed)
+    
+    def changed_fields(self, old: Dict, new: Dict) -> List[Tuple[str, Any, Any]]:
+        fields = []
+        for label, path in self.fields:
+            before, after = pluck(old, path), pluck(new, path)
+            if before != after or (label == 'Assignment' and
+                                   pluck(old, ('assigned_to', 'id')) != pluck(new, ('assigned_to', 'id'))):
+                fields.append((label, before, after))
+        
+        old_custom = self._custom_values(old)
+        new_custom = self._custom_values(new)
+        for name in sorted(set(old_custom) | set(new_custom)):
+            if old_custom.get(name) != new_custom.get(name):
+                fields.append((name, old_custom.get(name), new_custom.get(name)))
+        return fields
+    
+    @staticmethod
+    def _custom_values(record: Dict) -> Dict[str, Any]:
+        custom_fields = record.get('custom_fields')
+        if not isinstance(custom_fields, dict):
+            return {}
+        return {name: field.get('value') if isinstance(field, dict) else field for name, field in custom_fields.items()}
+
+
+
+class SearchIndex:
+    # Trigram index over locally mirrored records for substring queries.
+    # Documents are append-only; updated or deleted records are tombstoned
+    # and the index is rebuilt once too many of them pile up.
+    
+    def __init__(self, resolve: Optional[Callable[[str, Any], Optional[Dict]]] = None):
+        # With `resolve`, matches are looked up by (resource, id) at query time
+        # instead of the index holding its own reference to every record
+        self.resolve = resolve
+        self.postings: Dict[str, List[int]] = {}
+        self.texts: List[str] = []
+        self.refs: List[Tuple[str, Any]] = []
+        self.live: Dict[Tuple[str, Any], int] = {}
+        self.records: Dict[Tuple[str, Any], Dict] = {}
+    
+    @staticmethod
+    def trigrams(text: str) -> set:
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+    
+    @staticmethod
+    def document(resource: str, record: Dict) -> str:
+        return '\x00'.join(str(pluck(record, path, '')).lower() for path in SEARCH_FIELDS[resource])
+    
+    def add(self, resource: str, record: Dict):
+        ref = (resource, record.get('id'))
+        if self.resolve is None:
+            self.records[ref] = record
+        self._add_text(ref, self.document(resource, record))
+    
+    def _add_text(self, ref: Tuple[str, Any], text: str):
+        doc = len(self.texts)
+        self.texts.append(text)
+        self.refs.append(ref)
+        self.live[ref] = doc
+        for gram in self.trigrams(text):
+            self.postings.setdefault(gram, []).append(doc)
+    
+    def remove(self, resource: str, record_id: Any):
+        ref = (resource, record_id)
+        self.live.pop(ref, None)
+        self.records.pop(ref, None)
+    
+    def update(self, resource: str, changed: List[Dict], removed: List[Dict]):
+        for record in removed:
+            self.remove(resource, record.get('id'))
+        for record in changed:
+            self.add(resource, record)
+        if len(self.texts) - len(self.live) > len(self.texts) * SEARCH_INDEX_COMPACT_RATIO:
+            self.rebuild()
+    
+    def rebuild(self):
+        # Live documents keep their text, so nothing has to be re-read
+        live = [(ref, self.texts[doc]) for ref, doc in self.live.items()]
+        records = self.records
+        self.__init__(self.resolve)
+        self.records = records
+        for ref, text in live:
+            self._add_text(ref, text)
+    
+    def search(self, search_term: str, limit: Optional[int] = None) -> Dict[str, List[Dict]]:
+        term = search_term.lower()
+        grams = self.trigrams(term)
+        if grams:
+            postings = sorted((self.postings.get(gram, []) for gram in grams), key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                if not candidates:
+                    break
+                candidates.intersection_update(posting)
+        else:
+            candidates = range(len(self.texts))
+        
+        results = {resource: [] for resource in SEARCH_FIELDS}
+        for doc in sorted(candidates):
+            ref = self.refs[doc]
+            if self.live.get(ref) != doc or term not in self.texts[doc]:
+                continue
+            matches = results[ref[0]]
+            if limit is None or len(matches) < limit:
+                matches.append(self.records[ref] if self.resolve is None else self.resolve(*ref))
+        return results
+    
+    def __len__(self) -> int:
+        return len(self.live)
+
+
+class LocalSearch:
+    # Keeps incremental mirrors of assets, licenses and users and a SearchIndex over them
+    
+    def __init__(self, client: SnipeITClient, compact: bool = MIRROR_COMPACT):
+        self.client = client
+        self.mirrors = {
+            name: InventoryMirror(client, endpoint, store=RecordStore(name) if compact else None)
+            for name, endpoint in MONITOR_ENDPOINTS.items()
+        }
+        self.index = SearchIndex(self._resolve if compact else None)
+        self.loaded = False
+    
+    def _resolve(self, resource: str, record_id: Any) -> Optional[Dict]:
+        return self.mirrors[resource].records.get(record_id)
+    
+    def refresh(self):
+        if not self.loaded:
+            self.client.fan_out({name: mirror.load for name, mirror in self.mirrors.items()})
+            for name, mirror in self.mirrors.items():
+                for record in mirror.records.values():
+                    self.index.add(name, record)
+            self.loaded = True
+            return
+        
+        for name, mirror in self.mirrors.items():
+            previous, current = mirror.sync()
+            current_ids = {record.get('id') for record in current}
+            removed = [record for record in previous if record.get('id') not in current_ids]
+            self.index.update(name, current, removed)
+    
+    def search(self, search_term: str, limit: Optional[int] = None) -> Dict[str, List[Dict]]:
+        return self.index.search(search_term, limit)
+
+
+
+class PageBrowser:
+    # Serves one screen-sized page per request. The pages after (and one before)
+    # the current one are fetched on background threads while it is being read,
+    # and only a window of pages around it is kept, so browsing a 40k-row
+    # inventory never loads it whole. Filter and sort are done by the server.
+    
+    def __init__(self, client: SnipeITClient, resource: str, page_rows: int,
+                 fields: Optional[Iterable[Tuple[str, ...]]] = None, window: int = BROWSE_WINDOW_PAGES,
+                 prefetch: int = BROWSE_PREFETCH_PAGES):
+        self.client = client
+        self.endpoint = MONITOR_ENDPOINTS[resource]
+        self.page_rows = page_rows
+        self.fields = list(fields) if fields else None
+        self.prefetch = prefetch
+        self.window = max(window, prefetch + 2)
+        self.search = ''
+        self.sort: Optional[str] = None
+        self.descending = False
+        self.total: Optional[int] = None
+        self.current = 0
+        self.pages: Dict[int, List[Dict]] = {}
+        self.pending: Dict[int, Future] = {}
+        self.generation = 0
+        self.instant = 0
+        self.loads = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=BROWSE_WORKERS)
+    
+    @property
+    def page_count(self) -> int:
+        if not self.total:
+            return 1
+        return (self.total + self.page_rows - 1) // self.page_rows
+    
+    def _params(self, index: int) -> Dict[str, Any]:
+        params: Dict[str, Any] = {'offset': index * self.page_rows, 'limit': self.page_rows}
+        if self.search:
+            params['search'] = self.search
+        if self.sort:
+            params['sort'] = self.sort
+            params['order'] = 'desc' if self.descending else 'asc'
+        return params
+    
+    def _fetch(self, index: int, generation: int, params: Dict[str, Any]) -> List[Dict]:
+        try:
+            data = self.client._request('GET', self.endpoint, fields=self.fields, params=params)
+        except Exception:
+            with self._lock:
+                if generation == self.generation:
+                    self.pending.pop(index, None)
+            raise
+        rows = data.get('rows', [])
+        with self._lock:
+            # A page fetched before the filter or sort changed belongs to another listing
+            if generation == self.generation:
+                self.pending.pop(index, None)
+                self.total = data.get('total', 0)
+                self.pages[index] = rows
+                self._evict()
+        return rows
+    
+    def _evict(self):
+        while len(self.pages) > self.window:
+            del self.pages[max(self.pages, key=lambda index: abs(index - self.current))]
+    
+    def page(self, index: int) -> List[Dict]:
+        # Clamped to the listing; the first call also learns the total
+        index = max(0, min(index, self.page_count - 1))
+        with self._lock:
+            self.current = index
+            rows = self.pages.get(index)
+            future = self.pending.get(index)
+            generation = self.generation
+        
+        if rows is not None:
+            self.instant += 1
+        else:
+            self.loads += 1
+            rows = future.result() if future is not None else self._fetch(index, generation, self._params(index))
+        self._schedule(index)
+        return rows
+    
+    def _schedule(self, index: int):
+        with self._lock:
+            for neighbour in list(range(index + 1, index + 1 + self.prefetch)) + [index - 1]:
+                if (0 <= neighbour < self.page_count and neighbour not in self.pages
+                        and neighbour not in self.pending):
+                    self.pending[neighbour] = self._executor.submit(
+                        self._fetch, neighbour, self.generation, self._params(neighbour))
+    
+    def set_filter(self, search: str):
+        self.search = search
+        self._reset()
+    
+    def set_sort(self, column: Optional[str], descending: bool = False):
+        self.sort = column
+        self.descending = descending
+        self._reset()
+    
+    def _reset(self):
+        with self._lock:
+            self.generation += 1
+            for future in self.pending.values():
+                future.cancel()
+            self.pending = {}
+            self.pages = {}
+            self.total = None
+            self.current = 0
+    
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+
+class PollScheduler:
+    # Per-resource poll timing: back off while a resource is quiet, snap back to
+    # the base interval after a change and honour server Retry-After hints
+    
+    def __init__(self, resources: List[str], base_interval: float, max_interval: float = POLL_MAX_INTERVAL,
+                 backoff: float = POLL_BACKOFF, jitter: float = POLL_JITTER):
+        self.base_interval = base_interval
+        self.max_interval = max(max_interval, base_interval)
+        self.backoff = backoff
+        self.jitter = jitter
+        self.intervals = {resource: float(base_interval) for resource in resources}
+        self.polls = {resource: 0 for resource in resources}
+        now = time.monotonic()
+        # Stagger the first round so the resources do not hit the server together
+        self.next_due = {
+            resource: now + base_interval * i / len(resources)
+            for i, resource in enumerate(resources)
+        }
+    
+    def wait(self) -> List[str]:
+        while True:
+            now = time.monotonic()
+            due = [resource for resource, at in self.next_due.items() if at <= now]
+            if due:
+                return due
+            time.sleep(min(self.next_due.values()) - now)
+    
+    def record(self, resource: str, changed: bool, retry_after: Optional[float] = None):
+        self.polls[resource] += 1
+        if changed:
+            interval = self.base_interval
+        else:
+            interval = min(self.intervals[resource] * self.backoff, self.max_interval)
+        self.intervals[resource] = interval
+        
+        delay = interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+        if retry_after:
+            delay = max(delay, retry_after * random.uniform(1, 1 + self.jitter))
+        self.next_due[resource] = time.monotonic() + delay
+
+
+
+class EventLog:
+    # Durable record of monitor change events. Lines are buffered and written with a
+    # single flush + fsync once EVENT_LOG_SYNC_EVENTS are pending or EVENT_LOG_SYNC_SECONDS
+    # have passed, so a crash loses at most one batch. The active file rotates to
+    # events.jsonl.1 ... .N when it reaches max_bytes.
+    
+    def __init__(self, path: str = EVENT_LOG_PATH, max_bytes: int = EVENT_LOG_MAX_BYTES, keep: int = EVENT_LOG_KEEP,
+                 sync_events: int = EVENT_LOG_SYNC_EVENTS, sync_seconds: float = EVENT_LOG_SYNC_SECONDS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.keep = keep
+        self.sync_events = sync_events
+        self.sync_seconds = sync_seconds
+        self.pending: List[str] = []
+        self.last_sync = time.monotonic()
+        self.written = 0
+        self.file = None
+    
+    def _open(self):
+        if self.file is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self.file = open(self.path, 'a+', encoding='utf-8')
+            if self.file.tell():
+                # Terminate a line torn by a crash so the next event starts cleanly
+                self.file.seek(self.file.tell() - 1)
+                if self.file.read(1) != '\n':
+                    self.file.write('\n')
+    
+    def write(self, event: Dict):
+        self.pending.append(json.dumps(event, default=str, ensure_ascii=False) + '\n')
+        self.sync_if_due()
+    
+    def sync_if_due(self):
+        if len(self.pending) >= self.sync_events or time.monotonic() - self.last_sync >= self.sync_seconds:
+            self.flush()
+    
+    def write_all(self, events: Iterable[Dict]):
+        for event in events:
+            self.write(event)
+    
+    def flush(self):
+        if not self.pending:
+            return
+        self._open()
+        data = ''.join(self.pending)
+        if self.file.tell() and self.file.tell() + len(data.encode('utf-8')) > self.max_bytes:
+            self._rotate()
+        self.file.write(data)
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.written += len(self.pending)
+        self.pending = []
+        self.last_sync = time.monotonic()
+    
+    def _rotate(self):
+        self.file.close()
+        self.file = None
+        for index in range(self.keep - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{index}"):
+                os.replace(f"{self.path}.{index}", f"{self.path}.{index + 1}")
+        if self.keep > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._open()
+    
+    def close(self):
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+    
+    def files(self) -> List[str]:
+        # Oldest first, so events come back in the order they were written
+        rotated = [f"{self.path}.{index}" for index in range(self.keep, 0, -1)]
+        return [path for path in rotated + [self.path] if os.path.exists(path)]
+    
+    def query(self, since: Optional[str] = None, until: Optional[str] = None, resource: Optional[str] = None,
+              record_id: Optional[int] = None, user: Optional[str] = None) -> Iterator[Dict]:
+        # `since`/`until` are ISO timestamps (any prefix, e.g. 2024-05); `user` (username
+        # or ID) matches events on that user and asset assignments to or from them
+        self.flush()
+        user = user.lower() if user else None
+        for path in self.files():
+            with open(path, encoding='utf-8') as lines:
+                for line in lines:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        # A torn final line from a crash; skip it
+                        continue
+                    stamp = event.get('time') or ''
+                    if since and stamp < since:
+                        continue
+                    if until and stamp[:len(until)] > until:
+                        continue
+                    if resource and event.get('resource') != resource:
+                        continue
+                    if record_id is not None and event.get('id') != record_id:
+                        continue
+                    if user and not self._involves(event, user):
+                        continue
+                    yield event
+    
+    @staticmethod
+    def _involves(event: Dict, user: str) -> bool:
+        # `user` is a username or user ID; display names are ambiguous and not matched
+        def matches(user_id: Any, username: Any) -> bool:
+            return (user_id is not None and str(user_id) == user) or (bool(username) and str(username).lower() == user)
+        
+        if event.get('resource') == 'users':
+            return matches(event.get('id'), event.get('name'))
+        if event.get('field') != 'Assignment':
+            return False
+        return any(matches(who.get('id'), who.get('username'))
+                   for who in (event.get('from_user'), event.get('to_user')) if who)
+
+
+
+class ChangeMonitor:
+    
+    def __init__(self, client: SnipeITClient, refresh_interval: float, incremental: bool = True,
+                 compact: bool = MIRROR_COMPACT, event_log: Optional[EventLog] = None):
+        self.client = client
+        self.event_log = event_log
+        self.refresh_interval = refresh_interval
+        self.incremental = incremental
+        self.compact = compact
+        self.engines = {name: DiffEngine(name) for name in MONITOR_ENDPOINTS}
+        self.stores = {name: RecordStore(name) for name in MONITOR_ENDPOINTS}
+        fields = {name: RecordStore.fetch_fields(name) if compact else None for name in MONITOR_ENDPOINTS}
+        # Full mode snapshots every page of a resource, projecting rows as they stream in
+        self.fetchers = {
+            'assets': lambda: self._snapshot('assets', client.iter_assets(
+                workers=FETCH_WORKERS, fresh=True, fields=fields['assets'])),
+            'licenses': lambda: self._snapshot('licenses', client.iter_licenses(
+                workers=FETCH_WORKERS, fresh=True, fields=fields['licenses'])),
+            'users': lambda: self._snapshot('users', client.iter_users(
+                workers=FETCH_WORKERS, fresh=True, fields=fields['users'])),
+        }
+        self.mirrors: Dict[str, InventoryMirror] = {}
+        self.previous: Dict[str, Snapshot] = {}
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, str] = {}
+        self.scheduler = PollScheduler(list(MONITOR_ENDPOINTS), refresh_interval)
+    
+    def start(self) -> Dict[str, int]:
+        if self.incremental:
+            self.mirrors = {
+                name: InventoryMirror(self.client, endpoint, store=self.stores[name] if self.compact else None)
+                for name, endpoint in MONITOR_ENDPOINTS.items()
+            }
+            self.counts, _ = self.client.fan_out({name: mirror.load for name, mirror in self.mirrors.items()})
+        else:
+            self.previous, _ = self.client.fan_out(self.fetchers)
+            self.counts = {name: len(snapshot) for name, snapshot in self.previous.items()}
+        self.scheduler = PollScheduler(list(MONITOR_ENDPOINTS), self.refresh_interval)
+        return self.counts
+    
+    def poll(self, name: str) -> ChangeSet:
+        engine = self.engines[name]
+        if self.incremental:
+            # Only records touched since the last watermark come back, so the
+            # diff runs over the changed subset instead of the inventory
+            previous_rows, current_rows = self.mirrors[name].sync()
+            self.counts[name] = len(self.mirrors[name].records)
+            return engine.diff(engine.snapshot(previous_rows), engine.snapshot(current_rows))
+        
+        current = self.fetchers[name]()
+        previous, self.previous[name] = self.previous[name], current
+        self.counts[name] = len(current)
+        return engine.diff(previous, current)
+    
+    def _snapshot(self, name: str, rows: Iterable[Dict]) -> Snapshot:
+        # Full mode holds two snapshots per resource; keep them as compact projections
+        if self.compact:
+            rows = (self.stores[name].project(row) for row in rows)
+        return self.engines[name].snapshot(rows)
+    
+    def ticks(self) -> Iterator[Dict[str, ChangeSet]]:
+        # A failed poll keeps the previous snapshot, so an outage never looks like mass deletion;
+        # the reason is left in self.errors for the tick
+        while True:
+            changes = {}
+            self.errors = {}
+            for name in self.scheduler.wait():
+                try:
+                    changes[name] = self.poll(name)
+                except SnipeITError as e:
+                    self.errors[name] = str(e)
+                    self.scheduler.record(name, False, e.retry_after)
+                    continue
+                self.scheduler.record(name, bool(changes[name]))
+                if self.event_log is not None and changes[name]:
+                    self.event_log.write_all(changes[name].events(name, datetime.now().isoformat(timespec='seconds')))
+            if self.event_log is not None:
+                # A quiet spell must not hold a partial batch back for long
+                self.event_log.sync_if_due()
+            yield changes
+    
+    @property
+    def rows_fetched(self) -> int:
+        return sum(mirror.rows_fetched for mirror in self.mirrors.values())
+    
+    @property
+    def sweeps(self) -> int:
+        return sum(mirror.sweeps for mirror in self.mirrors.values())
+
+
+
+class BulkDeleter:
+    # Deletes many records through a bounded, rate-limited worker pool. Progress
+    # is checkpointed to a JSON file so an interrupted run can be resumed.
+    
+    def __init__(self, client: SnipeITClient, resource: str, checkpoint_path: Optional[str] = None,
+                 workers: int = BULK_DELETE_WORKERS, rate: float = BULK_DELETE_RATE):
+        self.client = client
+        self.resource = resource
+        self.workers = workers
+        self.limiter = TokenBucket(rate, BULK_DELETE_BURST)
+        self.checkpoint_path = checkpoint_path or os.path.join(
+            BULK_CHECKPOINT_DIR, f"bulk-delete-{resource}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+        self.ids: List[int] = []
+        self.done: List[int] = []
+        self.missing: List[int] = []
+        self.failed: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._since_checkpoint = 0
+    
+    @classmethod
+    def resume(cls, client: SnipeITClient, checkpoint_path: str, **kwargs) -> 'BulkDeleter':
+        with open(checkpoint_path) as f:
+            state = json.load(f)
+        deleter = cls(client, state['resource'], checkpoint_path, **kwargs)
+        deleter.ids = state['ids']
+        deleter.done = state['done']
+        deleter.missing = state.get('missing', [])
+        # Failed deletes are retried on resume
+        return deleter
+    
+    @property
+    def pending(self) -> List[int]:
+        skip = set(self.done) | set(self.missing)
+        return [record_id for record_id in self.ids if record_id not in skip]
+    
+    def plan(self, ids: List[int]) -> Dict[str, Any]:
+        # IDs the server does not have are reported as missing and left out of the run
+        if not self.ids:
+            self.ids = list(dict.fromkeys(ids))
+        missing, sample = self._check(self.pending)
+        self.missing = list(dict.fromkeys(self.missing + missing))
+        pending = self.pending
+        return {
+            'resource': self.resource,
+            'total': len(self.ids),
+            'already_done': len(self.done),
+            'missing': len(self.missing),
+            'pending': len(pending),
+            'sample': sample,
+            'checkpoint': self.checkpoint_path,
+        }
+    
+    def _check(self, ids: List[int]) -> Tuple[List[int], List[Dict]]:
+        # Returns (IDs that do not exist, full records for a sample of the rest).
+        # Small batches are looked up one by one; when paging through every ID
+        # takes fewer requests, the listing is walked instead.
+        endpoint = MONITOR_ENDPOINTS[self.resource]
+        if not ids:
+            return [], []
+        missing: List[int] = []
+        lookup = ids
+        if len(ids) > BULK_PLAN_SAMPLE:
+            total = self.client._request('GET', endpoint, use_cache=False, params={'limit': 1}).get('total', 0)
+            if -(-total // PAGE_SIZE) < len(ids):
+                live = {row.get('id') for row in self.client.iter_rows(self.resource, workers=FETCH_WORKERS,
+                                                                       fresh=True, fields=[('id',)])}
+                missing = [record_id for record_id in ids if record_id not in live]
+                lookup = [record_id for record_id in ids if record_id in live][:BULK_PLAN_SAMPLE]
+        
+        def get(record_id: int) -> Any:
+            try:
+                return self.client._request('GET', f"{endpoint}/{record_id}", use_cache=False)
+            except SnipeITAPIError as e:
+                # 404, or Snipe-IT's 200 + status=error for a record that does not exist
+                if e.status is not None and (e.status == 404 or e.status < 400):
+                    return 'missing'
+                return None
+            except SnipeITError:
+                # Unknown; the delete itself will tell
+                return None
+        
+        found, _ = self.client.fan_out({record_id: (lambda record_id=record_id: get(record_id)) for record_id in lookup})
+        missing += [record_id for record_id, record in found.items() if record == 'missing']
+        sample = [record for record in found.values() if isinstance(record, dict)][:BULK_PLAN_SAMPLE]
+        return missing, sample
+    
+    def run(self, on_result: Optional[Callable[[int, bool], None]] = None) -> Dict[str, Any]:
+        endpoint = MONITOR_ENDPOINTS[self.resource]
+        self.failed = {}
+        started = time.monotonic()
+        
+        def work(record_id: int) -> bool:
+            self.limiter.acquire()
+            try:
+                self.client._request('DELETE', f"{endpoint}/{record_id}")
+                ok, reason = True, None
+            except SnipeITCircuitOpen:
+                # Not attempted; stays pending for --resume
+                return False
+            except SnipeITError as e:
+                ok, reason = False, str(e)
+            with self._lock:
+                if ok:
+                    self.done.append(record_id)
+                else:
+                    self.failed[record_id] = reason
+                self._since_checkpoint += 1
+                if self._since_checkpoint >= BULK_CHECKPOINT_EVERY:
+                    self._write_checkpoint()
+            if on_result:
+                on_result(record_id, ok)
+            return ok
+        
+        pending = self.pending
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                list(executor.map(work, pending))
+        finally:
+            with self._lock:
+                self._write_checkpoint()
+        
+        return self.report(time.monotonic() - started)
+    
+    def report(self, elapsed: float = 0.0) -> Dict[str, Any]:
+        return {
+            'resource': self.resource,
+            'total': len(self.ids),
+            'deleted': len(self.done),
+            'failed': len(self.failed),
+            'failures': {str(record_id): reason for record_id, reason in self.failed.items()},
+            'missing': len(self.missing),
+            'remaining': len(self.pending),
+            'seconds': round(elapsed, 1),
+            'checkpoint': self.checkpoint_path,
+        }
+    
+    def _write_checkpoint(self):
+        self._since_checkpoint = 0
+        os.makedirs(os.path.dirname(os.path.abspath(self.checkpoint_path)), exist_ok=True)
+        state = {
+            'resource': self.resource,
+            'ids': self.ids,
+            'done': self.done,
+            'missing': self.missing,
+            'failed': {str(record_id): reason for record_id, reason in self.failed.items()},
+            'updated': datetime.now().isoformat(timespec='seconds'),
+        }
+        tmp_path = self.checkpoint_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+
+class InventoryExporter:
+    # Streams a whole resource to CSV, JSON Lines or Parquet in id order, a page
+    # at a time, with nested fields flattened (see flatten). Progress is
+    # checkpointed to <path>.progress.json every EXPORT_CHECKPOINT_ROWS rows, so
+    # a failed export resumes from there instead of starting over. Text output
+    # is truncated back to the checkpoint (gzip output is a new gzip member per
+    # checkpoint, which every gzip reader concatenates); Parquet output is a
+    # directory of part files.
+    
+    def __init__(self, client: SnipeITClient, resource: str, path: str, output_format: str,
+                 compress: bool = False, columns: Optional[List[str]] = None, page_size: int = PAGE_SIZE,
+                 workers: int = FETCH_WORKERS):
+        if output_format == 'parquet':
+            if pyarrow is None:
+                raise ValueError("Parquet export needs pyarrow (pip install pyarrow)")
+            if compress:
+                raise ValueError("Parquet files are compressed already; drop --gzip")
+            if path == '-':
+                raise ValueError("Parquet cannot be written to stdout")
+        self.client = client
+        self.resource = resource
+        self.endpoint = RESOURCE_ENDPOINTS[resource]
+        self.path = path
+        self.output_format = output_format
+        self.compress = compress
+        self.columns = list(columns) if columns else None
+        self.chosen_columns = bool(columns)
+        self.page_size = page_size
+        self.workers = workers
+        self.progress_path = None if path == '-' else f"{path}.progress.json"
+        self.schema: Optional[List[Tuple[str, str]]] = None
+        self.rows = 0
+        self.last_id = 0
+        self.size = 0
+        self.parts = 0
+        self.late_columns: set = set()
+        self.coerced = 0
+    
+    def resume(self):
+        with open(self.progress_path) as f:
+            state = json.load(f)
+        expected = {'resource': self.resource, 'format': self.output_format, 'compress': self.compress}
+        for key, value in expected.items():
+            if state[key] != value:
+                raise ValueError(f"{self.progress_path} is a {key} {state[key]!r} export, not {value!r}")
+        self.columns = state['columns']
+        self.chosen_columns = state['chosen_columns']
+        self.schema = [tuple(column) for column in state['schema']] if state['schema'] else None
+        self.rows = state['rows']
+        self.last_id = state['last_id']
+        self.size = state['size']
+        self.parts = state['parts']
+    
+    def run(self, on_progress: Optional[Callable[[int], None]] = None) -> Dict[str, Any]:
+        started = time.monotonic()
+        resumed_at = self.rows
+        batches = self._batches(self._unwritten_rows())
+        if self.output_format == 'parquet':
+            self._write_parquet(batches, on_progress)
+        else:
+            self._write_text(batches, on_progress)
+        if self.progress_path and os.path.exists(self.progress_path):
+            os.remove(self.progress_path)
+        
+        return {
+            'resource': self.resource,
+            'format': self.output_format + ('.gz' if self.compress else ''),
+            'path': self.path,
+            'rows': self.rows,
+            'resumed_at': resumed_at,
+            'parts': self.parts,
+            'bytes': self.size,
+            'seconds': round(time.monotonic() - started, 2),
+            'late_columns': sorted(self.late_columns),
+            'coerced': self.coerced,
+        }
+    
+    def _unwritten_rows(self) -> Iterator[Dict]:
+        # Re-read a little before the checkpoint: deletions since then shift offsets down.
+        # If more than the overlap was deleted, the first row read is already past
+        # last_id and the rows in between would be skipped, so read from the start
+        # instead and let the last_id filter drop what is written already
+        start = max(0, self.rows - EXPORT_RESUME_OVERLAP)
+        while True:
+            rows = self.client.iter_rows(self.resource, page_size=self.page_size,
+                                         params={'sort': 'id', 'order': 'asc'}, workers=self.workers, fresh=True,
+                                         start=start)
+            first = next(rows, None)
+            if start and (first is None or (first.get('id') or 0) > self.last_id):
+                rows.close()
+                start = 0
+                continue
+            break
+        if first is None:
+            return
+        yield from (row for row in chain([first], rows) if (row.get('id') or 0) > self.last_id)
+    
+    def _batches(self, rows: Iterable[Dict]) -> Iterator[List[Dict]]:
+        while True:
+            batch = [flatten(row) for row in islice(rows, EXPORT_CHECKPOINT_ROWS)]
+            if not batch:
+                return
+            yield batch
+    
+    @staticmethod
+    def header_for(rows: List[Dict]) -> List[str]:
+        # Union of the batch's keys; a null object's own column is dropped when
+        # other rows have its dotted sub-columns (assigned_to vs assigned_to.name)
+        keys = list(dict.fromkeys(key for row in rows for key in row))
+        prefixes = {key.rsplit('.', 1)[0] for key in keys if '.' in key}
+        return [key for key in keys if key not in prefixes]
+    
+    def _note_late_columns(self, batch: List[Dict]):
+        if self.chosen_columns:
+            return
+        known = set(self.columns)
+        for row in batch:
+            self.late_columns.update(key for key in row if key not in known and row[key] is not None)
+    
+    def _write_text(self, batches: Iterator[List[Dict]], on_progress: Optional[Callable[[int], None]]):
+        if self.path == '-':
+            raw = sys.stdout.buffer
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            raw = open(self.path, 'r+b' if self.rows else 'wb')
+            raw.truncate(self.size)
+            raw.seek(self.size)
+        member = None
+        try:
+            for batch in batches:
+                fresh_file = self.rows == 0
+                if self.output_format == 'csv' and self.columns is None:
+                    self.columns = self.header_for(batch)
+                if self.output_format == 'csv':
+                    self._note_late_columns(batch)
+                
+                buffer = io.StringIO()
+                if self.output_format == 'csv':
+                    writer = csv.DictWriter(buffer, self.columns, restval='', extrasaction='ignore')
+                    if fresh_file:
+                        writer.writeheader()
+                    writer.writerows(batch)
+                elif self.columns is not None:
+                    for row in batch:
+                        buffer.write(json.dumps({column: row.get(column) for column in self.columns}, default=str) + '\n')
+                else:
+                    for row in batch:
+                        buffer.write(json.dumps(row, default=str) + '\n')
+                
+                if member is None:
+                    member = gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=6) if self.compress else raw
+                member.write(buffer.getvalue().encode('utf-8'))
+                self.rows += len(batch)
+                self.last_id = max(self.last_id, batch[-1].get('id') or 0)
+                if self.compress:
+                    member.close()
+                    member = None
+                self._checkpoint(raw)
+                if on_progress:
+                    on_progress(self.rows)
+        finally:
+            if member is not None and member is not raw:
+                member.close()
+            if raw is not sys.stdout.buffer:
+                raw.close()
+            else:
+                raw.flush()
+    
+    def _write_parquet(self, batches: Iterator[List[Dict]], on_progress: Optional[Callable[[int], None]]):
+        os.makedirs(self.path, exist_ok=True)
+        # Parts past the checkpoint are incomplete leftovers of the failed run
+        for name in os.listdir(self.path):
+            if name.startswith('part-') and int(name[5:10]) >= self.parts:
+                os.remove(os.path.join(self.path, name))
+        
+        writer = None
+        part_rows = 0
+        try:
+            for batch in batches:
+                if self.schema is None:
+                    self.columns = self.columns or self.header_for(batch)
+                    self.schema = [(column, self._arrow_type(row.get(column) for row in batch)) for column in self.columns]
+                self._note_late_columns(batch)
+                schema = pyarrow.schema([(column, getattr(pyarrow, kind)()) for column, kind in self.schema])
+                table = pyarrow.Table.from_pydict(
+                    {column: [self._coerce(row.get(column), kind) for row in batch] for column, kind in self.schema},
+                    schema=schema)
+                
+                if writer is None:
+                    part_path = os.path.join(self.path, f"part-{self.parts:05d}.parquet")
+                    writer = pyarrow.parquet.ParquetWriter(part_path + '.tmp', schema)
+                writer.write_table(table)
+                part_rows += len(batch)
+                self.last_id = max(self.last_id, batch[-1].get('id') or 0)
+                
+                if part_rows >= EXPORT_PARQUET_ROWS:
+                    self._close_part(writer, part_path, part_rows, on_progress)
+                    writer = None
+                    part_rows = 0
+            if writer is not None:
+                self._close_part(writer, part_path, part_rows, on_progress)
+        except BaseException:
+            if writer is not None:
+                writer.close()
+            raise
+    
+    def _close_part(self, writer: Any, part_path: str, part_rows: int,
+                    on_progress: Optional[Callable[[int], None]]):
+        # A part only counts once it is complete and renamed into place
+        writer.close()
+        os.replace(part_path + '.tmp', part_path)
+        self.parts += 1
+        self.rows += part_rows
+        self.size += os.path.getsize(part_path)
+        self._checkpoint()
+        if on_progress:
+            on_progress(self.rows)
+    
+    @staticmethod
+    def _arrow_type(values: Iterable[Any]) -> str:
+        kinds = {type(value) for value in values if value is not None}
+        if kinds == {bool}:
+            return 'bool_'
+        if kinds == {int}:
+            return 'int64'
+        if kinds and kinds <= {int, float}:
+            return 'float64'
+        return 'string'
+    
+    def _coerce(self, value: Any, kind: str) -> Any:
+        # Later batches must fit the schema fixed by the first one
+        if value is None:
+            return None
+        if kind == 'string':
+            return value if isinstance(value, str) else json.dumps(value, default=str)
+        if kind == 'bool_':
+            if isinstance(value, bool):
+                return value
+        elif not isinstance(value, bool):
+            try:
+                return int(value) if kind == 'int64' else float(value)
+            except (TypeError, ValueError):
+                pass
+        self.coerced += 1
+        return None
+    
+    def _checkpoint(self, raw: Any = None):
+        if self.progress_path is None:
+            return
+        if raw is not None:
+            raw.flush()
+            os.fsync(raw.fileno())
+            self.size = raw.tell()
+        state = {
+            'resource': self.resource,
+            'format': self.output_format,
+            'compress': self.compress,
+            'columns': self.columns,
+            'chosen_columns': self.chosen_columns,
+            'schema': self.schema,
+            'rows': self.rows,
+            'last_id': self.last_id,
+            'size': self.size,
+            'parts': self.parts,
+            'updated': datetime.now().isoformat(timespec='seconds'),
+        }
+        tmp_path = self.progress_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.progress_path)
+
+
+def read_ids(lines: Iterable[str]) -> List[int]:
+    # One ID per line; blank lines, '#' comments and a CSV header are skipped
+    ids = []
+    for line in lines:
+        value = line.split('#', 1)[0].split(',', 1)[0].strip()
+        if value.isdigit():
+            ids.append(int(value))
+    return ids
+
+@contextmanager
+def profiled(directory: Optional[str], name: str):
+    # cProfile around one action; the stats file opens with `python -m pstats` or snakeviz
+    if not directory:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{name}-{datetime.now():%Y%m%d-%H%M%S}.prof")
+        profiler.dump_stats(path)
+        UI.print_info(f"Profile written to {path}")
+
+def export_metrics(client: SnipeITClient, metrics_out: Optional[str], metrics_json: bool):
+    if metrics_out:
+        client.metrics.write_prometheus(metrics_out)
+    if metrics_json:
+        print(json.dumps(client.metrics.summary(), indent=2), file=sys.stderr)
+
+
+
+class StatsAggregator:
+    # Streams every asset, license and user row once and keeps only running counts,
+    # so the statistics cover the whole inventory in constant memory (plus one entry
+    # per distinct category, location and model). Rows are folded in batches, with
+    # NumPy when it is installed.
+    
+    def __init__(self, vectorized: Optional[bool] = None):
+        self.vectorized = numpy is not None if vectorized is None else vectorized and numpy is not None
+        self.assets = 0
+        self.deployed = 0
+        self.deployable = 0
+        self.groups: Dict[str, Dict[str, List[int]]] = {label: {} for label, _ in STATS_GROUP_BY}
+        self.licenses = 0
+        self.seats = 0
+        self.used_seats = 0
+        self.users = 0
+        self.active_users = 0
+        self.users_with_assets = 0
+        self._lock = threading.Lock()
+    
+    def _folder(self, resource: str) -> Callable[[List[Dict]], None]:
+        return {'assets': self._fold_assets, 'licenses': self._fold_licenses, 'users': self._fold_users}[resource]
+    
+    def consume(self, resource: str, rows: Iterable[Dict]) -> int:
+        fold = self._folder(resource)
+        rows = iter(rows)
+        count = 0
+        while True:
+            batch = list(islice(rows, STATS_BATCH_ROWS))
+            if not batch:
+                return count
+            fold(batch)
+            count += len(batch)
+    
+    async def consume_async(self, resource: str, rows: AsyncIterator[Dict]) -> int:
+        fold = self._folder(resource)
+        batch = []
+        count = 0
+        async for row in rows:
+            batch.append(row)
+            if len(batch) >= STATS_BATCH_ROWS:
+                fold(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            fold(batch)
+            count += len(batch)
+        return count
+    
+    def _fold_assets(self, rows: List[Dict]):
+        metas = [pluck(row, ('status_label', 'status_meta')) for row in rows]
+        names = {label: [pluck(row, path, 'Unknown') for row in rows] for label, path in STATS_GROUP_BY}
+        if self.vectorized:
+            metas = numpy.array(metas, dtype=object)
+            deployed_mask = metas == 'deployed'
+            deployed = int(deployed_mask.sum())
+            deployable = int((metas == 'deployable').sum())
+            group_counts = {}
+            for label, values in names.items():
+                keys, inverse = numpy.unique(numpy.array(values, dtype=str), return_inverse=True)
+                totals = numpy.bincount(inverse, minlength=len(keys))
+                in_use = numpy.bincount(inverse, weights=deployed_mask, minlength=len(keys))
+                group_counts[label] = zip(keys.tolist(), totals.tolist(), in_use.astype(int).tolist())
+        else:
+            deployed = metas.count('deployed')
+            deployable = metas.count('deployable')
+            group_counts = {}
+            for label, values in names.items():
+                counts: Dict[str, List[int]] = {}
+                for name, meta in zip(values, metas):
+                    entry = counts.setdefault(str(name), [0, 0])
+                    entry[0] += 1
+                    entry[1] += meta == 'deployed'
+                group_counts[label] = ((name, total, in_use) for name, (total, in_use) in counts.items())
+        
+        with self._lock:
+            self.assets += len(rows)
+            self.deployed += deployed
+            self.deployable += deployable
+            for label, counts in group_counts.items():
+                groups = self.groups[label]
+                for name, total, in_use in counts:
+                    entry = groups.setdefault(name, [0, 0])
+                    entry[0] += total
+                    entry[1] += in_use
+    
+    def _fold_licenses(self, rows: List[Dict]):
+        seats = [self._number(row.get('seats')) for row in rows]
+        free = [self._number(row.get('free_seats_count')) for row in rows]
+        if self.vectorized:
+            seats_total = int(numpy.sum(seats))
+            used_total = int(seats_total - numpy.sum(free))
+        else:
+            seats_total = sum(seats)
+            used_total = seats_total - sum(free)
+        with self._lock:
+            self.licenses += len(rows)
+            self.seats += seats_total
+            self.used_seats += used_total
+    
+    def _fold_users(self, rows: List[Dict]):
+        active = sum(1 for row in rows if row.get('activated'))
+        with_assets = sum(1 for row in rows if self._number(row.get('assets_count')) > 0)
+        with self._lock:
+            self.users += len(rows)
+            self.active_users += active
+            self.users_with_assets += with_assets
+    
+    @staticmethod
+    def _number(value: Any) -> int:
+        try:
+            return int(value or 0)
+        except (TypeError, ValueError):
+            return 0
+    
+    @staticmethod
+    def percent(part: int, whole: int) -> float:
+        return part / whole * 100 if whole else 0.0
+    
+    def metrics(self) -> Dict[str, float]:
+        return {
+            'deployed_pct': self.percent(self.deployed, self.assets),
+            'deployable_pct': self.percent(self.deployable, self.assets),
+            'used_seats_pct': self.percent(self.used_seats, self.seats),
+            'active_users_pct': self.percent(self.active_users, self.users),
+            'users_with_assets_pct': self.percent(self.users_with_assets, self.users),
+        }
+    
+    def top_groups(self, label: str, limit: Optional[int] = STATS_TOP_GROUPS) -> List[Tuple[str, int, int]]:
+        groups = sorted(self.groups[label].items(), key=lambda item: (-item[1][0], item[0]))
+        return [(name, total, in_use) for name, (total, in_use) in groups[:limit]]
+    
+    def values(self) -> Dict[str, float]:
+        # Flat metric name -> value, as stored in MetricsHistory
+        return {
+            'assets.total': self.assets,
+            'assets.deployed': self.deployed,
+            'assets.deployable': self.deployable,
+            'licenses.total': self.licenses,
+            'licenses.seats': self.seats,
+            'licenses.used_seats': self.used_seats,
+            'users.total': self.users,
+            'users.active': self.active_users,
+            'users.with_assets': self.users_with_assets,
+            **{f"pct.{name[:-4]}": round(value, 2) for name, value in self.metrics().items()},
+        }
+
+
+class MetricsHistory:
+    # Time series of statistics snapshots in SQLite. Each snapshot is written to
+    # every tier at once: raw as-is, coarser tiers as a running average of their
+    # bucket, so downsampling needs no background job. Rows older than a tier's
+    # retention are pruned on write.
+    
+    def __init__(self, db_path: str = METRICS_DB_PATH, tiers: Optional[List[Tuple[str, int, int]]] = None):
+        self.db_path = db_path
+        self.tiers = tiers or METRICS_TIERS
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.db = sqlite3.connect(db_path)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS samples ("
+            "tier TEXT NOT NULL, bucket INTEGER NOT NULL, metric TEXT NOT NULL, "
+            "value REAL NOT NULL, count INTEGER NOT NULL, PRIMARY KEY (tier, metric, bucket))"
+        )
+        self.db.commit()
+    
+    def record(self, values: Dict[str, float], timestamp: Optional[float] = None):
+        now = time.time() if timestamp is None else timestamp
+        rows = []
+        for tier, width, _ in self.tiers:
+            bucket = int(now // width * width)
+            rows += [(tier, bucket, metric, float(value)) for metric, value in values.items()]
+        with self.db:
+            self.db.executemany(
+                "INSERT INTO samples (tier, bucket, metric, value, count) VALUES (?, ?, ?, ?, 1) "
+                "ON CONFLICT (tier, metric, bucket) DO UPDATE SET "
+                "value = (value * count + excluded.value) / (count + 1), count = count + 1",
+                rows,
+            )
+            for tier, _, retention in self.tiers:
+                self.db.execute("DELETE FROM samples WHERE tier = ? AND bucket < ?", (tier, now - retention))
+    
+    def tier_for(self, since: float) -> str:
+        # The finest tier that still holds data back to `since`
+        age = time.time() - since
+        for tier, _, retention in self.tiers:
+            if retention >= age:
+                return tier
+        return self.tiers[-1][0]
     
-
+    def series(self, metric: str, since: float, tier: Optional[str] = None) -> List[Tuple[int, float]]:
+        return self.db.execute(
+            "SELECT bucket, value FROM samples WHERE tier = ? AND metric = ? AND bucket >= ? ORDER BY bucket",
+            (tier or self.tier_for(since), metric, since),
+        ).fetchall()
     
-    def list_categories(self, limit: int = 50) -> Optional[List[Dict]]:
-        UI.print_info(f"Fetching categories...")
-        data = self._make_request('GET', f'/categories?limit={limit}')
-        return data.get('rows', []) if data else []
+    def metrics(self) -> List[str]:
+        return [row[0] for row in self.db.execute("SELECT DISTINCT metric FROM samples ORDER BY metric")]
     
-
-    def list_locations(self, limit: int = 50) -> Optional[List[Dict]]:
-        UI.print_info(f"Fetching locations...")
-        data = self._make_request('GET', f'/locations?limit={limit}')
-        return data.get('rows', []) if data else []
-
-    def list_models(self, limit: int = 50) -> Optional[List[Dict]]:
-        UI.print_info(f"Fetching models...")
-        data = self._make_request('GET', f'/models?limit={limit}')
-        return data.get('rows', []) if data else []
+    def trends(self, since: float, metrics: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        tier = self.tier_for(since)
+        trends = []
+        for metric in metrics or self.metrics():
+            points = self.series(metric, since, tier)
+            if not points:
+                continue
+            values = [value for _, value in points]
+            trends.append({
+                'metric': metric,
+                'first': values[0],
+                'last': values[-1],
+                'delta': values[-1] - values[0],
+                'min': min(values),
+                'max': max(values),
+                'points': len(values),
+                'since': datetime.fromtimestamp(points[0][0]).isoformat(timespec='minutes'),
+                'tier': tier,
+                'sparkline': UI.sparkline(values),
+            })
+        return trends
     
-
-    def get_statistics(self) -> Dict[str, int]:
-        stats = {}
-        
-
-        endpoints = {
-            'Assets': '/hardware',
-            'Licenses': '/licenses',
-            'Users': '/users',
-            'Categories': '/categories',
-            'Locations': '/locations',
-            'Models': '/models',
-        }
-        
-        for name, endpoint in endpoints.items():
-            data = self._make_request('GET', f'{endpoint}?limit=1')
-            stats[name] = data.get('total', 0) if data else 0
-        
-        return stats
+    def close(self):
+        self.db.close()
 
 
 
 class SnipeITManager:
     
-    def __init__(self):
-        self.client = SnipeITClient(SNIPEIT_API_URL, SNIPEIT_API_TOKEN)
+    def __init__(self, client: Optional[SnipeITClient] = None, history: Optional[MetricsHistory] = None,
+                 event_log: Optional[EventLog] = None, async_client: Optional[AsyncSnipeITClient] = None,
+                 profile_dir: Optional[str] = None):
+        self.client = client or SnipeITClient(SNIPEIT_API_URL, SNIPEIT_API_TOKEN)
+        self.history = history
+        self.event_log = event_log
+        # When set, statistics and server search overlap their requests on its event loop
+        self.async_client = async_client
+        # When set, every menu action runs under cProfile and leaves a .prof file here
+        self.profile_dir = profile_dir
+        self.local_search: Optional[LocalSearch] = None
     
     def run(self):
         while True:
             UI.print_header()
             UI.print_menu()
+            self._print_cache_stats()
             
             choice = UI.get_input("Select an option")
             
-            if choice == '1':
-                self.show_assets()
-            elif choice == '2':
-                self.show_licenses()
-            elif choice == '3':
-                self.show_users()
-            elif choice == '4':
-                self.show_categories()
-            elif choice == '5':
-                self.show_locations()
-            elif choice == '6':
-                self.show_models()
-            elif choice == '7':
-                self.delete_asset()
-            elif choice == '8':
-                self.delete_license()
-            elif choice == '9':
-                self.delete_user()
-            elif choice == '10':
-                self.show_statistics()
-            elif choice == '11':
-                self.search_everything()
-            elif choice == '12':
-                self.realtime_monitor()
-            elif choice == '0':
-                self.exit_application()
-            else:
-                UI.print_error("Invalid option! Please try again.")
+            try:
+                with profiled(self.profile_dir if choice.isdigit() else None, f"menu-{choice}"):
+                    if choice == '1':
+                        self.show_assets()
+                    elif choice == '2':
+                        self.show_licenses()
+                    elif choice == '3':
+                        self.show_users()
+                    elif choice == '4':
+                        self.show_categories()
+                    elif choice == '5':
+                        self.show_locations()
+                    elif choice == '6':
+                        self.show_models()
+                    elif choice == '7':
+                        self.delete_asset()
+                    elif choice == '8':
+                        self.delete_license()
+                    elif choice == '9':
+                        self.delete_user()
+                    elif choice == '10':
+                        self.show_statistics()
+                    elif choice == '11':
+                        self.search_everything()
+                    elif choice == '12':
+                        self.realtime_monitor()
+                    elif choice == '13':
+                        self.bulk_delete()
+                    elif choice == '14':
+                        self.show_trends()
+                    elif choice == '15':
+                        self.show_change_log()
+                    elif choice == '0':
+                        self.exit_application()
+                    else:
+                        UI.print_error("Invalid option! Please try again.")
+                        UI.pause()
+    
+            except SnipeITError as e:
+                # Listings and searches fail loudly instead of showing a partial or empty result
+                UI.print_error(f"API Error: {str(e)}")
                 UI.pause()
     
-    def show_assets(self):
-        UI.clear_screen()
-        UI.print_header()
-        assets = self.client.list_assets(limit=100)
-        
-        if not assets:
-            UI.print_warning("No assets found or failed to fetch.")
-            UI.pause()
+    def _print_cache_stats(self):
+        cache = self.client.cache
+        if not cache.enabled:
+            print(f"{Colors.DIM}  Cache: bypassed{Colors.RESET}\n")
             return
-        
-        headers = ["ID", "Asset Tag", "Name", "Model", "Status", "Location"]
-        rows = []
-        
-        for asset in assets:
-            rows.append([
-                asset.get('id', 'N/A'),
-                asset.get('asset_tag', 'N/A'),
-                asset.get('name', 'N/A'),
-                asset.get('model', {}).get('name', 'N/A') if asset.get('model') else 'N/A',
-                asset.get('status_label', {}).get('name', 'N/A') if asset.get('status_label') else 'N/A',
-                asset.get('location', {}).get('name', 'N/A') if asset.get('location') else 'N/A',
-            ])
-        
-        UI.print_table(headers, rows, f"📦 ASSETS (Total: {len(assets)})")
-        UI.print_success(f"Displayed {len(assets)} assets")
-        UI.pause()
+        stats = cache.stats()
+        mode = " (refresh)" if cache.refresh else ""
+        print(f"{Colors.DIM}  Cache{mode}: {stats['hits']} hits | {stats['misses']} misses | {stats['entries']} entries | {stats['bytes'] / 1024:.0f} KiB{Colors.RESET}\n")
+    
+    def show_assets(self):
+        self._browse('assets', "📦 ASSETS")
     
     def show_licenses(self):
-        UI.clear_screen()
-        UI.print_header()
-        licenses = self.client.list_licenses(limit=100)
-        
-        if not licenses:
-            UI.print_warning("No licenses found or failed to fetch.")
-            UI.pause()
-            return
-        
-        headers = ["ID", "Name", "Product Key", "Seats", "Available", "Category"]
-        rows = []
-        
-        for lic in licenses:
-            rows.append([
-                lic.get('id', 'N/A'),
-                lic.get('name', 'N/A'),
-                lic.get('product_key', 'N/A')[:20] + '...' if lic.get('product_key') and len(lic.get('product_key', '')) > 20 else lic.get('product_key', 'N/A'),
-                lic.get('seats', 0),
-                lic.get('free_seats_count', 0),
-                lic.get('category', {}).get('name', 'N/A') if lic.get('category') else 'N/A',
-            ])
-        
-        UI.print_table(headers, rows, f"🔑 LICENSES (Total: {len(licenses)})")
-        UI.print_success(f"Displayed {len(licenses)} licenses")
-        UI.pause()
+        self._browse('licenses', "🔑 LICENSES")
     
     def show_users(self):
-
-        UI.clear_screen()
-        UI.print_header()
-        users = self.client.list_users(limit=100)
-        
-        if not users:
-            UI.print_warning("No users found or failed to fetch.")
-            UI.pause()
-            return
-        
-        headers = ["ID", "Username", "First Name", "Last Name", "Email", "Assets"]
-        rows = []
-        
-        for user in users:
-            rows.append([
-                user.get('id', 'N/A'),
-                user.get('username', 'N/A'),
-                user.get('first_name', 'N/A'),
-                user.get('last_name', 'N/A'),
-                user.get('email', 'N/A'),
-                user.get('assets_count', 0),
-            ])
-        
-        UI.print_table(headers, rows, f"👥 USERS (Total: {len(users)})")
-        UI.print_success(f"Displayed {len(users)} users")
-        UI.pause()
+        self._browse('users', "👥 USERS")
     
     def show_categories(self):
-
-        UI.clear_screen()
-        UI.print_header()
-        categories = self.client.list_categories(limit=100)
-        
-        if not categories:
-            UI.print_warning("No categories found or failed to fetch.")
-            UI.pause()
-            return
-        
-        headers = ["ID", "Name", "Type", "Assets Count"]
-        rows = []
-        
-        for cat in categories:
-            rows.append([
-                cat.get('id', 'N/A'),
-                cat.get('name', 'N/A'),
-                cat.get('category_type', 'N/A'),
-                cat.get('assets_count', 0),
-            ])
-        
-        UI.print_table(headers, rows, f"🏷️  CATEGORIES (Total: {len(categories)})")
-        UI.print_success(f"Displayed {len(categories)} categories")
-        UI.pause()
+        self._show_resource('categories', "🏷️  CATEGORIES", self.client.iter_categories)
     
     def show_locations(self):
-
-        UI.clear_screen()
-        UI.print_header()
-        locations = self.client.list_locations(limit=100)
-        
-        if not locations:
-            UI.print_warning("No locations found or failed to fetch.")
-            UI.pause()
-            return
-        
-        headers = ["ID", "Name", "Address", "City", "Country", "Assets"]
-        rows = []
-        
-        for loc in locations:
-            rows.append([
-                loc.get('id', 'N/A'),
-                loc.get('name', 'N/A'),
-                loc.get('address', 'N/A'),
-                loc.get('city', 'N/A'),
-                loc.get('country', 'N/A'),
-                loc.get('assets_count', 0),
-            ])
-        
-        UI.print_table(headers, rows, f"🏢 LOCATIONS (Total: {len(locations)})")
-        UI.print_success(f"Displayed {len(locations)} locations")
-        UI.pause()
+        self._show_resource('locations', "🏢 LOCATIONS", self.client.iter_locations)
     
     def show_models(self):
-
+        self._show_resource('models', "🔧 MODELS", self.client.iter_models)
+    
+    def _show_resource(self, resource: str, title: str, fetch: Callable[..., Iterator[Dict]]):
         UI.clear_screen()
         UI.print_header()
-        models = self.client.list_models(limit=100)
-        
-        if not models:
-            UI.print_warning("No models found or failed to fetch.")
-            UI.pause()
-            return
+        UI.print_info(f"Fetching {resource}...")
         
-        headers = ["ID", "Name", "Model Number", "Manufacturer", "Category", "Assets"]
-        rows = []
+        # Pages keep loading in the background while the first screenful is shown
+        columns = LIST_COLUMNS[resource]
+        records = fetch(workers=FETCH_WORKERS, fields=view_fields(resource))
+        rows = ([pluck(record, path, 'N/A') for _, path in columns] for record in records)
+        shown = UI.print_table([header for header, _ in columns], rows, title, page_size=UI.page_rows())
+        # Stop background page fetches the user quit before reaching
+        records.close()
         
-        for model in models:
-            rows.append([
-                model.get('id', 'N/A'),
-                model.get('name', 'N/A'),
-                model.get('model_number', 'N/A'),
-                model.get('manufacturer', {}).get('name', 'N/A') if model.get('manufacturer') else 'N/A',
-                model.get('category', {}).get('name', 'N/A') if model.get('category') else 'N/A',
-                model.get('assets_count', 0),
-            ])
-        
-        UI.print_table(headers, rows, f"🔧 MODELS (Total: {len(models)})")
-        UI.print_success(f"Displayed {len(models)} models")
-        UI.pause()
+        if not shown:
+            UI.print_warning(f"No {resource} found or failed to fetch.")
+        else:
+            UI.print_success(f"Displayed {shown} {resource}")
+        if shown and resource in DETAIL_METHODS:
+            self._open_records(resource)
+        else:
+            UI.pause()
+    
+    def _open_records(self, resource: str):
+        # Lists only carry their columns; full records are fetched when opened, as one batch
+        while True:
+            answer = UI.get_input("Open records by ID (space-separated, Enter to return)")
+            ids = [int(value) for value in answer.replace(',', ' ').split() if value.isdigit()]
+            if not ids:
+                return
+            self._show_details(resource, ids)
+    
+    def _show_details(self, resource: str, ids: List[int]):
+        details = self.client.get_many(resource, ids)
+        for record_id in ids:
+            record = details.get(record_id)
+            if record:
+                UI.print_box(f"{resource[:-1].title()} #{record_id}", describe(record))
+    
+    def _browse(self, resource: str, title: str):
+        columns = LIST_COLUMNS[resource]
+        headers = [header for header, _ in columns]
+        browser = PageBrowser(self.client, resource, max(10, UI.page_rows() - 6), view_fields(resource))
+        commands = "Enter/n next | p prev | g N go to page | f TEXT filter | s COLUMN [desc] sort | o IDS open | q back"
+        index = 0
+        widths = None
+        message = ''
+        try:
+            while True:
+                started = time.perf_counter()
+                instant = browser.instant
+                records = browser.page(index)
+                elapsed = time.perf_counter() - started
+                index = browser.current
+                
+                rows = [[pluck(record, path, 'N/A') for _, path in columns] for record in records]
+                if widths is None and rows:
+                    # Sized on the first page and kept, so columns don't jump while paging
+                    widths = [max([len(header)] + [len(str(row[i])) for row in rows]) for i, header in enumerate(headers)]
+                
+                UI.clear_screen()
+                UI.print_header()
+                UI.print_table(headers, rows, title, widths=widths)
+                
+                first = index * browser.page_rows + 1 if records else 0
+                status = [f"Page {index + 1}/{browser.page_count}",
+                          f"rows {first}-{first + len(records) - 1 if records else 0} of {browser.total or 0}"]
+                if browser.search:
+                    status.append(f"filter '{browser.search}'")
+                if browser.sort:
+                    status.append(f"sort {browser.sort} {'desc' if browser.descending else 'asc'}")
+                status.append("in memory" if browser.instant > instant else f"loaded in {elapsed * 1000:.0f} ms")
+                status.append(f"{len(browser.pages)} pages held")
+                print(f"{Colors.DIM}  {' | '.join(status)}{Colors.RESET}")
+                if message:
+                    UI.print_warning(message)
+                    message = ''
+                
+                command = UI.get_input(commands).strip()
+                verb, _, argument = command.partition(' ')
+                verb = verb.lower()
+                argument = argument.strip()
+                
+                if verb in ('', 'n'):
+                    if index + 1 >= browser.page_count:
+                        message = "Already on the last page"
+                    index += 1
+                elif verb == 'p':
+                    if index == 0:
+                        message = "Already on the first page"
+                    index -= 1
+                elif verb == 'g' or verb.isdigit():
+                    number = argument if verb == 'g' else verb
+                    if number.isdigit():
+                        index = int(number) - 1
+                    else:
+                        message = "Usage: g PAGE"
+                elif verb == 'f':
+                    browser.set_filter(argument)
+                    index, widths = 0, None
+                elif verb == 's':
+                    name, _, order = argument.rpartition(' ') if argument.lower().endswith((' desc', ' asc')) else (argument, '', '')
+                    column = next((path for position, (header, path) in enumerate(columns, 1)
+                                   if name.lower() in (header.lower(), str(position))), None)
+                    if name and column is None:
+                        message = f"No column '{name}'; use a header or its number (1-{len(columns)})"
+                    else:
+                        # Snipe-IT sorts on the top-level field, e.g. 'model' for the model name
+                        browser.set_sort(column[0] if column else None, order.lower() == 'desc')
+                        index = 0
+                elif verb == 'o':
+                    ids = [int(value) for value in argument.replace(',', ' ').split() if value.isdigit()]
+                    if ids:
+                        self._show_details(resource, ids)
+                        UI.pause()
+                    else:
+                        message = "Usage: o ID [ID ...]"
+                elif verb == 'q':
+                    return
+                else:
+                    message = f"Unknown command '{command}'"
+        finally:
+            browser.close()
     
     def delete_asset(self):
 
@@ -615,26 +3670,134 @@ class SnipeITManager:
         
         UI.pause()
     
+    def bulk_delete(self):
+        UI.clear_screen()
+        UI.print_header()
+        UI.print_box("Bulk Delete", [
+            "Delete many assets, licenses or users in one run",
+            "IDs come from a file (one per line) or a search filter",
+            "Enter a checkpoint file path to resume an interrupted run",
+        ], Colors.BRIGHT_RED)
+        
+        source = UI.get_input("ID file, checkpoint (.json) or 'search:<term>'").strip()
+        if not source:
+            UI.print_warning("Nothing to delete.")
+            UI.pause()
+            return
+        
+        try:
+            if source.endswith('.json'):
+                deleter = BulkDeleter.resume(self.client, source)
+                ids = deleter.ids
+            else:
+                resource = UI.get_input("Resource (assets/licenses/users)").strip().lower()
+                if resource not in DELETE_METHODS:
+                    UI.print_error("Invalid resource!")
+                    UI.pause()
+                    return
+                deleter = BulkDeleter(self.client, resource)
+                if source.startswith('search:'):
+                    ids = [r['id'] for r in self.client.search(MONITOR_ENDPOINTS[resource], source[len('search:'):].strip()) if r.get('id')]
+                else:
+                    with open(source) as f:
+                        ids = read_ids(f)
+        except (OSError, ValueError, KeyError) as e:
+            UI.print_error(f"Could not read {source}: {e}")
+            UI.pause()
+            return
+        
+        plan = deleter.plan(ids)
+        if not plan['pending']:
+            UI.print_warning("Nothing left to delete.")
+            UI.pause()
+            return
+        
+        self._print_bulk_plan(plan)
+        if not UI.confirm(f"{Colors.BRIGHT_RED}Delete {plan['pending']} {plan['resource']}?{Colors.RESET}"):
+            UI.print_info("Deletion cancelled.")
+            UI.pause()
+            return
+        
+        progress = {'ok': 0, 'failed': 0}
+        progress_lock = threading.Lock()
+        
+        def on_result(record_id: int, ok: bool):
+            with progress_lock:
+                progress['ok' if ok else 'failed'] += 1
+                print(f"\r  Deleted {progress['ok']}/{plan['pending']} | Failed {progress['failed']}", end='', flush=True)
+        
+        try:
+            report = deleter.run(on_result)
+        except KeyboardInterrupt:
+            print()
+            UI.print_warning(f"Interrupted. Resume with checkpoint: {deleter.checkpoint_path}")
+            UI.pause()
+            return
+        
+        print("\n")
+        self._print_bulk_report(report)
+        UI.pause()
+    
+    def _print_bulk_plan(self, plan: Dict[str, Any]):
+        lines = [
+            f"Resource: {plan['resource']}",
+            f"To delete: {plan['pending']} (already done: {plan['already_done']}, not found: {plan['missing']})",
+            f"Checkpoint: {plan['checkpoint']}",
+        ]
+        UI.print_box("Deletion Plan", lines, Colors.BRIGHT_YELLOW)
+        if plan['sample']:
+            columns = LIST_COLUMNS[plan['resource']]
+            rows = [[pluck(record, path, 'N/A') for _, path in columns] for record in plan['sample']]
+            UI.print_table([header for header, _ in columns], rows, f"First {len(rows)} of {plan['pending']}")
+    
+    def _print_bulk_report(self, report: Dict[str, Any]):
+        color = Colors.BRIGHT_GREEN if not report['failed'] else Colors.BRIGHT_YELLOW
+        lines = [
+            f"Deleted: {report['deleted']} of {report['total']}",
+            f"Failed: {report['failed']}",
+            f"Time: {report['seconds']}s",
+        ]
+        if report['failed']:
+            lines.append(f"Failed IDs: {', '.join(list(report['failures'])[:20])}")
+            lines.append(f"Retry failures with checkpoint: {report['checkpoint']}")
+        UI.print_box("Bulk Delete Summary", lines, color)
+    
     def show_statistics(self):
         UI.clear_screen()
         UI.print_header()
         UI.print_info("Fetching comprehensive statistics...")
         
-        stats = self.client.get_statistics()
+        # The six totals and three full-inventory aggregation streams are independent, so run them at once
+        aggregator = StatsAggregator()
+        client = self.async_client or self.client
+        consume = aggregator.consume if self.async_client is None else aggregator.consume_async
+        calls = client.statistics_calls()
+        for resource, fetch in (('assets', client.iter_assets), ('licenses', client.iter_licenses),
+                                ('users', client.iter_users)):
+            calls[f"{resource.title()} rows"] = (
+                lambda resource=resource, fetch=fetch:
+                consume(resource, fetch(workers=FETCH_WORKERS, fields=STATS_FIELDS[resource]))
+            )
         
-        assets = self.client.list_assets(limit=500)
-        licenses = self.client.list_licenses(limit=500)
-        users = self.client.list_users(limit=500)
+        started = time.perf_counter()
+        stats, timings = client.fan_out(calls, workers=len(calls))
+        elapsed = time.perf_counter() - started
         
-        total_assets = stats.get('Assets', 0)
-        deployed_assets = sum(1 for a in (assets or []) if a.get('status_label', {}).get('status_meta') == 'deployed')
-        available_assets = sum(1 for a in (assets or []) if a.get('status_label', {}).get('status_meta') == 'deployable')
+        metrics = aggregator.metrics()
+        total_assets = aggregator.assets
+        deployed_assets = aggregator.deployed
+        available_assets = aggregator.deployable
+        deployed_pct = metrics['deployed_pct']
         
-        total_license_seats = sum(l.get('seats', 0) for l in (licenses or []))
-        used_license_seats = sum(l.get('seats', 0) - l.get('free_seats_count', 0) for l in (licenses or []))
+        total_license_seats = aggregator.seats
+        used_license_seats = aggregator.used_seats
+        used_pct = metrics['used_seats_pct']
         
-        active_users = sum(1 for u in (users or []) if u.get('activated'))
-        users_with_assets = sum(1 for u in (users or []) if u.get('assets_count', 0) > 0)
+        total_users = aggregator.users
+        active_users = aggregator.active_users
+        users_with_assets = aggregator.users_with_assets
+        active_pct = metrics['active_users_pct']
+        users_with_assets_pct = metrics['users_with_assets_pct']
         
         print(f"\n{Colors.BRIGHT_CYAN}{'═' * 80}{Colors.RESET}")
         print(f"{Colors.BRIGHT_CYAN}║{Colors.RESET} {Colors.BOLD}{Colors.BRIGHT_WHITE}{'📊 SNIPE-IT ADVANCED STATISTICS DASHBOARD 📊'.center(76)}{Colors.RESET} {Colors.BRIGHT_CYAN}║{Colors.RESET}")
@@ -646,9 +3809,8 @@ class SnipeITManager:
         
         print(f"  {Colors.BRIGHT_WHITE}Total Assets:{Colors.RESET} {Colors.BOLD}{Colors.BRIGHT_CYAN}{total_assets}{Colors.RESET}")
         
-        if assets:
-            deployed_pct = (deployed_assets / total_assets * 100) if total_assets > 0 else 0
-            available_pct = (available_assets / total_assets * 100) if total_assets > 0 else 0
+        if total_assets:
+            available_pct = metrics['deployable_pct']
             
             print(f"\n  {Colors.BRIGHT_YELLOW}├─ Deployed:{Colors.RESET} {deployed_assets} {Colors.DIM}({deployed_pct:.1f}%){Colors.RESET}")
             self._print_progress_bar(deployed_pct, 50, Colors.BRIGHT_GREEN)
@@ -663,11 +3825,10 @@ class SnipeITManager:
         print(f"{Colors.BRIGHT_BLUE}│{Colors.RESET} {Colors.BOLD}🔑 SOFTWARE LICENSES{Colors.RESET}{' ' * 56} {Colors.BRIGHT_BLUE}│{Colors.RESET}")
         print(f"{Colors.BRIGHT_BLUE}└{'─' * 78}┘{Colors.RESET}\n")
         
-        print(f"  {Colors.BRIGHT_WHITE}Total Licenses:{Colors.RESET} {Colors.BOLD}{Colors.BRIGHT_CYAN}{stats.get('Licenses', 0)}{Colors.RESET}")
+        print(f"  {Colors.BRIGHT_WHITE}Total Licenses:{Colors.RESET} {Colors.BOLD}{Colors.BRIGHT_CYAN}{aggregator.licenses}{Colors.RESET}")
         print(f"  {Colors.BRIGHT_WHITE}Total Seats:{Colors.RESET} {Colors.BOLD}{Colors.BRIGHT_CYAN}{total_license_seats}{Colors.RESET}")
         
-        if licenses and total_license_seats > 0:
-            used_pct = (used_license_seats / total_license_seats * 100) if total_license_seats > 0 else 0
+        if total_license_seats > 0:
             available_seats = total_license_seats - used_license_seats
             available_pct = 100 - used_pct
             
@@ -683,13 +3844,9 @@ class SnipeITManager:
         print(f"{Colors.BRIGHT_MAGENTA}│{Colors.RESET} {Colors.BOLD}👥 USER STATISTICS{Colors.RESET}{' ' * 58} {Colors.BRIGHT_MAGENTA}│{Colors.RESET}")
         print(f"{Colors.BRIGHT_MAGENTA}└{'─' * 78}┘{Colors.RESET}\n")
         
-        total_users = stats.get('Users', 0)
         print(f"  {Colors.BRIGHT_WHITE}Total Users:{Colors.RESET} {Colors.BOLD}{Colors.BRIGHT_CYAN}{total_users}{Colors.RESET}")
         
-        if users and total_users > 0:
-            active_pct = (active_users / total_users * 100) if total_users > 0 else 0
-            users_with_assets_pct = (users_with_assets / total_users * 100) if total_users > 0 else 0
-            
+        if total_users > 0:
             print(f"\n  {Colors.BRIGHT_GREEN}├─ Active Users:{Colors.RESET} {active_users} {Colors.DIM}({active_pct:.1f}%){Colors.RESET}")
             self._print_progress_bar(active_pct, 50, Colors.BRIGHT_GREEN)
             
@@ -713,6 +3870,21 @@ class SnipeITManager:
         
         print()
         
+        if total_assets:
+            print(f"{Colors.BRIGHT_GREEN}┌{'─' * 78}┐{Colors.RESET}")
+            print(f"{Colors.BRIGHT_GREEN}│{Colors.RESET} {Colors.BOLD}📈 ASSET BREAKDOWN{Colors.RESET}{' ' * 58} {Colors.BRIGHT_GREEN}│{Colors.RESET}")
+            print(f"{Colors.BRIGHT_GREEN}└{'─' * 78}┘{Colors.RESET}\n")
+            
+            for label, _ in STATS_GROUP_BY:
+                groups = aggregator.groups[label]
+                print(f"  {Colors.BRIGHT_WHITE}By {label}{Colors.RESET} {Colors.DIM}(top {min(STATS_TOP_GROUPS, len(groups))} of {len(groups)}){Colors.RESET}")
+                for name, count, in_use in aggregator.top_groups(label):
+                    share = aggregator.percent(count, total_assets)
+                    deployed = aggregator.percent(in_use, count)
+                    print(f"  {Colors.BRIGHT_CYAN}├─{Colors.RESET} {name[:38]:.<40} {Colors.BOLD}{count:>6}{Colors.RESET} "
+                          f"{Colors.DIM}({share:.1f}% of assets, {deployed:.0f}% deployed){Colors.RESET}")
+                print()
+        
         print(f"{Colors.BRIGHT_CYAN}{'═' * 80}{Colors.RESET}")
         print(f"{Colors.BRIGHT_CYAN}║{Colors.RESET} {Colors.BOLD}KEY METRICS SUMMARY{Colors.RESET}{' ' * 59} {Colors.BRIGHT_CYAN}║{Colors.RESET}")
         print(f"{Colors.BRIGHT_CYAN}{'═' * 80}{Colors.RESET}\n")
@@ -762,9 +3934,63 @@ class SnipeITManager:
         
         print(f"\n{Colors.BRIGHT_CYAN}{'═' * 80}{Colors.RESET}\n")
         
+        self._print_timings(timings, elapsed)
+        conn = client.connection_stats()
+        print(f"{Colors.DIM}  HTTP: {conn['requests']} requests ({conn['retries']} retries) | {conn['new_connections']} new connections | {conn['reused_connections']} reused{Colors.RESET}")
+        latency = [client.metrics.quantile(q) for q in (0.5, 0.95, 0.99)]
+        if latency[0] is not None:
+            print(f"{Colors.DIM}  Latency (session): p50 {latency[0] * 1000:.0f} ms | p95 {latency[1] * 1000:.0f} ms | p99 {latency[2] * 1000:.0f} ms{Colors.RESET}")
+        print(f"{Colors.DIM}  Rate limit: throttled {conn['throttled']} requests for {conn['throttle_wait']:.1f}s | circuit {conn['circuit']}{Colors.RESET}")
+        print(f"{Colors.DIM}  JSON ({conn['decoder']}): {conn['decoded_pages']} pages, {conn['decoded_mb']:.1f} MB | {conn['decode_ms_per_page']:.2f} ms/page avg, {conn['decode_ms_max']:.2f} ms max{Colors.RESET}\n")
+        
+        if self.history is not None:
+            values = aggregator.values()
+            values.update({f"{name.lower()}.total": stats[name] for name in ('Categories', 'Locations', 'Models')})
+            try:
+                self.history.record(values)
+            except sqlite3.Error as e:
+                UI.print_warning(f"Could not save statistics history: {e}")
+        
         UI.print_success("Advanced statistics generated successfully!")
         UI.pause()
     
+    def show_trends(self):
+        UI.clear_screen()
+        UI.print_header()
+        if self.history is None:
+            UI.print_warning("Statistics history is disabled.")
+            UI.pause()
+            return
+        
+        days_input = UI.get_input(f"Days of history (default: {TREND_DAYS})")
+        try:
+            days = max(1, int(days_input)) if days_input else TREND_DAYS
+        except ValueError:
+            days = TREND_DAYS
+        
+        # Read straight from the local store; no API calls
+        trends = self.history.trends(time.time() - days * 86400)
+        if not trends:
+            UI.print_warning("No statistics recorded yet. Open Show Statistics to record a snapshot.")
+            UI.pause()
+            return
+        
+        def number(value: float) -> str:
+            return f"{value:,.1f}" if value != int(value) else f"{int(value):,}"
+        
+        rows = ([trend['metric'], trend['sparkline'], number(trend['last']),
+                 f"{'+' if trend['delta'] > 0 else ''}{number(trend['delta'])}",
+                 number(trend['min']), number(trend['max'])] for trend in trends)
+        UI.print_table(['Metric', 'Trend', 'Latest', 'Δ', 'Min', 'Max'], rows,
+                       f"📈 TRENDS - last {days} days ({trends[0]['tier']} samples since {trends[0]['since']})")
+        UI.pause()
+    
+    def _print_timings(self, timings: Dict[str, float], elapsed: float):
+        print(f"{Colors.DIM}  Request timings (wall {elapsed * 1000:.0f} ms, sum {sum(timings.values()) * 1000:.0f} ms):{Colors.RESET}")
+        for name, seconds in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+            print(f"{Colors.DIM}    {name:.<30} {seconds * 1000:>8.0f} ms{Colors.RESET}")
+        print()
+    
     def _print_progress_bar(self, percentage: float, width: int = 50, color=Colors.BRIGHT_GREEN):
         filled = int(width * percentage / 100)
         empty = width - filled
@@ -785,50 +4011,43 @@ class SnipeITManager:
             UI.pause()
             return
         
+        use_index = UI.get_input("Search the local index instead of the server? (y/N)").lower() in ['y', 'yes']
+        search_view_fields = {resource: view_fields(resource) for resource in MONITOR_ENDPOINTS}
+        
         UI.print_info(f"Searching for '{search_term}'...")
         
-        results_found = False
-        assets = self.client.list_assets(limit=100)
-        if assets:
-            matching_assets = [
-                a for a in assets 
-                if search_term in str(a.get('name', '')).lower() 
-                or search_term in str(a.get('asset_tag', '')).lower()
-            ]
-            if matching_assets:
-                results_found = True
-                headers = ["ID", "Asset Tag", "Name", "Model"]
-                rows = [[a.get('id'), a.get('asset_tag'), a.get('name'), 
-                        a.get('model', {}).get('name', 'N/A')] for a in matching_assets]
-                UI.print_table(headers, rows, f"📦 MATCHING ASSETS ({len(matching_assets)})")
-        
-        licenses = self.client.list_licenses(limit=100)
-        if licenses:
-            matching_licenses = [
-                l for l in licenses 
-                if search_term in str(l.get('name', '')).lower()
-            ]
-            if matching_licenses:
-                results_found = True
-                headers = ["ID", "Name", "Seats"]
-                rows = [[l.get('id'), l.get('name'), l.get('seats')] for l in matching_licenses]
-                UI.print_table(headers, rows, f"🔑 MATCHING LICENSES ({len(matching_licenses)})")
-        
-        users = self.client.list_users(limit=100)
-        if users:
-            matching_users = [
-                u for u in users 
-                if search_term in str(u.get('username', '')).lower() 
-                or search_term in str(u.get('first_name', '')).lower()
-                or search_term in str(u.get('last_name', '')).lower()
-            ]
-            if matching_users:
-                results_found = True
-                headers = ["ID", "Username", "Name", "Email"]
-                rows = [[u.get('id'), u.get('username'), 
-                        f"{u.get('first_name', '')} {u.get('last_name', '')}", 
-                        u.get('email')] for u in matching_users]
-                UI.print_table(headers, rows, f"👥 MATCHING USERS ({len(matching_users)})")
+        if use_index:
+            if self.local_search is None:
+                UI.print_info("Building local index (first use mirrors the full inventory)...")
+                self.local_search = LocalSearch(self.client)
+            self.local_search.refresh()
+            started = time.perf_counter()
+            matches = self.local_search.search(search_term, limit=SEARCH_RESULT_LIMIT)
+            UI.print_info(f"Index answered in {(time.perf_counter() - started) * 1000:.1f} ms over {len(self.local_search.index)} records")
+        elif self.async_client is not None:
+            matches = self.async_client.run(
+                self.async_client.search_everything(search_term, SEARCH_RESULT_LIMIT, search_view_fields))
+        else:
+            matches = self.client.search_everything(search_term, SEARCH_RESULT_LIMIT, search_view_fields)
+        results_found = any(matches.values())
+        
+        if matches['assets']:
+            headers = ["ID", "Asset Tag", "Name", "Model"]
+            rows = [[a.get('id'), a.get('asset_tag'), a.get('name'), 
+                    a.get('model', {}).get('name', 'N/A')] for a in matches['assets']]
+            UI.print_table(headers, rows, f"📦 MATCHING ASSETS ({len(matches['assets'])})")
+        
+        if matches['licenses']:
+            headers = ["ID", "Name", "Seats"]
+            rows = [[l.get('id'), l.get('name'), l.get('seats')] for l in matches['licenses']]
+            UI.print_table(headers, rows, f"🔑 MATCHING LICENSES ({len(matches['licenses'])})")
+        
+        if matches['users']:
+            headers = ["ID", "Username", "Name", "Email"]
+            rows = [[u.get('id'), u.get('username'), 
+                    f"{u.get('first_name', '')} {u.get('last_name', '')}", 
+                    u.get('email')] for u in matches['users']]
+            UI.print_table(headers, rows, f"👥 MATCHING USERS ({len(matches['users'])})")
         
         if not results_found:
             UI.print_warning(f"No results found for '{search_term}'")
@@ -846,6 +4065,7 @@ class SnipeITManager:
         print(f"{Colors.BRIGHT_GREEN}└{'─' * 78}┘{Colors.RESET}\n")
         
         print(f"{Colors.BRIGHT_CYAN}ℹ Real-time monitoring will check for changes every 5 seconds{Colors.RESET}")
+        print(f"{Colors.BRIGHT_CYAN}ℹ Quiet resources are polled less often (up to every {POLL_MAX_INTERVAL}s) until they change again{Colors.RESET}")
         print(f"{Colors.BRIGHT_CYAN}ℹ Press Ctrl+C to stop monitoring and return to menu{Colors.RESET}\n")
         interval_input = UI.get_input("Refresh interval in seconds (default: 5, min: 3)")
         try:
@@ -853,103 +4073,32 @@ class SnipeITManager:
         except ValueError:
             refresh_interval = 5
         
+        incremental = UI.get_input("Use incremental sync (only fetch changed records)? (Y/n)").lower() not in ['n', 'no']
+        
         print(f"\n{Colors.BRIGHT_YELLOW}⚡ Starting real-time monitor with {refresh_interval}s refresh interval...{Colors.RESET}\n")
         time.sleep(1)
         print(f"{Colors.BRIGHT_CYAN}ℹ Establishing baseline data...{Colors.RESET}")
-        previous_stats = {
-            'assets': self.client.list_assets(limit=500, silent=True) or [],
-            'licenses': self.client.list_licenses(limit=500, silent=True) or [],
-            'users': self.client.list_users(limit=500, silent=True) or [],
-        }
-        
-        previous_counts = {
-            'assets': len(previous_stats['assets']),
-            'licenses': len(previous_stats['licenses']),
-            'users': len(previous_stats['users']),
-        }
+        monitor = ChangeMonitor(self.client, refresh_interval, incremental, event_log=self.event_log)
+        counts = monitor.start()
         
         print(f"{Colors.BRIGHT_GREEN}✓ Baseline established!{Colors.RESET}")
-        print(f"{Colors.DIM}  Assets: {previous_counts['assets']} | Licenses: {previous_counts['licenses']} | Users: {previous_counts['users']}{Colors.RESET}\n")
+        if self.event_log is not None:
+            print(f"{Colors.DIM}  Changes are logged to {self.event_log.path}{Colors.RESET}")
+        print(f"{Colors.DIM}  Assets: {counts['assets']} | Licenses: {counts['licenses']} | Users: {counts['users']}{Colors.RESET}\n")
         print(f"{Colors.BRIGHT_CYAN}{'═' * 80}{Colors.RESET}")
         print(f"{Colors.BRIGHT_CYAN}║{Colors.RESET} {Colors.BOLD}MONITORING ACTIVITY{Colors.RESET}{' ' * 59} {Colors.BRIGHT_CYAN}║{Colors.RESET}")
         print(f"{Colors.BRIGHT_CYAN}{'═' * 80}{Colors.RESET}\n")
         
+        started = time.monotonic()
         iteration = 0
         total_changes = 0
         
         try:
-            while True:
+            for changes in monitor.ticks():
                 iteration += 1
                 current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 
-                # Fetch current data silently
-                current_stats = {
-                    'assets': self.client.list_assets(limit=500, silent=True) or [],
-                    'licenses': self.client.list_licenses(limit=500, silent=True) or [],
-                    'users': self.client.list_users(limit=500, silent=True) or [],
-                }
-                
-                current_counts = {
-                    'assets': len(current_stats['assets']),
-                    'licenses': len(current_stats['licenses']),
-                    'users': len(current_stats['users']),
-                }
-                
-                changes_detected = False
-                
-                previous_asset_ids = {a.get('id') for a in previous_stats['assets'] if a.get('id')}
-                current_asset_ids = {a.get('id') for a in current_stats['assets'] if a.get('id')}
-                
-                new_assets = current_asset_ids - previous_asset_ids
-                deleted_assets = previous_asset_ids - current_asset_ids
-                
-                previous_license_ids = {l.get('id') for l in previous_stats['licenses'] if l.get('id')}
-                current_license_ids = {l.get('id') for l in current_stats['licenses'] if l.get('id')}
-                
-                new_licenses = current_license_ids - previous_license_ids
-                deleted_licenses = previous_license_ids - current_license_ids
-                
-                previous_user_ids = {u.get('id') for u in previous_stats['users'] if u.get('id')}
-                current_user_ids = {u.get('id') for u in current_stats['users'] if u.get('id')}
-                
-                new_users = current_user_ids - previous_user_ids
-                deleted_users = previous_user_ids - current_user_ids
-                
-                asset_changes = []
-                for current_asset in current_stats['assets']:
-                    asset_id = current_asset.get('id')
-                    if not asset_id:
-                        continue
-                        
-                    previous_asset = next((a for a in previous_stats['assets'] if a.get('id') == asset_id), None)
-                    
-                    if previous_asset:
-                        prev_status = previous_asset.get('status_label', {}).get('name', 'N/A') if isinstance(previous_asset.get('status_label'), dict) else 'N/A'
-                        curr_status = current_asset.get('status_label', {}).get('name', 'N/A') if isinstance(current_asset.get('status_label'), dict) else 'N/A'
-                        
-                        if prev_status != curr_status:
-                            asset_changes.append({
-                                'id': asset_id,
-                                'name': current_asset.get('name', 'N/A'),
-                                'type': 'status',
-                                'from': prev_status,
-                                'to': curr_status,
-                            })
-                        
-                        prev_assigned = previous_asset.get('assigned_to', {}).get('name') if isinstance(previous_asset.get('assigned_to'), dict) else None
-                        curr_assigned = current_asset.get('assigned_to', {}).get('name') if isinstance(current_asset.get('assigned_to'), dict) else None
-                        
-                        if prev_assigned != curr_assigned:
-                            asset_changes.append({
-                                'id': asset_id,
-                                'name': current_asset.get('name', 'N/A'),
-                                'type': 'assignment',
-                                'from': prev_assigned or 'Unassigned',
-                                'to': curr_assigned or 'Unassigned',
-                            })
-                
-                if new_assets or deleted_assets or new_licenses or deleted_licenses or new_users or deleted_users or asset_changes:
-                    changes_detected = True
+                if any(changes.values()):
                     total_changes += 1
                     
                     print(f"\r{' ' * 80}\r", end='')
@@ -958,86 +4107,113 @@ class SnipeITManager:
                     print(f"{Colors.BRIGHT_YELLOW}│{Colors.RESET} {Colors.BOLD}🔔 CHANGES DETECTED{Colors.RESET} - {current_time}{' ' * (78 - len(current_time) - 21)} {Colors.BRIGHT_YELLOW}│{Colors.RESET}")
                     print(f"{Colors.BRIGHT_YELLOW}└{'─' * 78}┘{Colors.RESET}\n")
                     
-                    if new_assets:
-                        print(f"{Colors.BRIGHT_GREEN}  ➕ NEW ASSETS ({len(new_assets)}):{Colors.RESET}")
-                        for asset_id in new_assets:
-                            asset = next((a for a in current_stats['assets'] if a.get('id') == asset_id), None)
-                            if asset:
-                                asset_tag = asset.get('asset_tag', 'N/A')
-                                asset_name = asset.get('name', 'N/A')
-                                model_name = asset.get('model', {}).get('name', 'N/A') if isinstance(asset.get('model'), dict) else 'N/A'
-                                print(f"     • ID: {asset_id} | Tag: {asset_tag} | Name: {asset_name} | Model: {model_name}")
-                        print()
-                    
-                    if deleted_assets:
-                        print(f"{Colors.BRIGHT_RED}  ➖ DELETED ASSETS ({len(deleted_assets)}):{Colors.RESET}")
-                        for asset_id in deleted_assets:
-                            asset = next((a for a in previous_stats['assets'] if a.get('id') == asset_id), None)
-                            if asset:
-                                print(f"     • ID: {asset_id} | Name: {asset.get('name', 'N/A')} | Tag: {asset.get('asset_tag', 'N/A')}")
-                        print()
-                    
-                    if asset_changes:
-                        print(f"{Colors.BRIGHT_CYAN}  🔄 ASSET CHANGES ({len(asset_changes)}):{Colors.RESET}")
-                        for change in asset_changes:
-                            if change.get('type') == 'assignment':
-                                print(f"     • {change['name']} (ID: {change['id']})")
-                                print(f"       Assignment: {change['from']} → {change['to']}")
-                            else:
-                                print(f"     • {change['name']} (ID: {change['id']})")
-                                print(f"       Status: {change['from']} → {change['to']}")
-                        print()
-                    
-                    if new_licenses:
-                        print(f"{Colors.BRIGHT_GREEN}  ➕ NEW LICENSES ({len(new_licenses)}):{Colors.RESET}")
-                        for license_id in new_licenses:
-                            license_data = next((l for l in current_stats['licenses'] if l.get('id') == license_id), None)
-                            if license_data:
-                                print(f"     • ID: {license_id} | Name: {license_data.get('name', 'N/A')} | Seats: {license_data.get('seats', 0)}")
-                        print()
-                    
-                    if deleted_licenses:
-                        print(f"{Colors.BRIGHT_RED}  ➖ DELETED LICENSES ({len(deleted_licenses)}):{Colors.RESET}")
-                        for license_id in deleted_licenses:
-                            license_data = next((l for l in previous_stats['licenses'] if l.get('id') == license_id), None)
-                            if license_data:
-                                print(f"     • ID: {license_id} | Name: {license_data.get('name', 'N/A')}")
-                        print()
-                    
-                    if new_users:
-                        print(f"{Colors.BRIGHT_GREEN}  ➕ NEW USERS ({len(new_users)}):{Colors.RESET}")
-                        for user_id in new_users:
-                            user = next((u for u in current_stats['users'] if u.get('id') == user_id), None)
-                            if user:
-                                print(f"     • ID: {user_id} | Username: {user.get('username', 'N/A')} | Name: {user.get('first_name', '')} {user.get('last_name', '')}")
-                        print()
-                    
-                    if deleted_users:
-                        print(f"{Colors.BRIGHT_RED}  ➖ DELETED USERS ({len(deleted_users)}):{Colors.RESET}")
-                        for user_id in deleted_users:
-                            user = next((u for u in previous_stats['users'] if u.get('id') == user_id), None)
-                            if user:
-                                print(f"     • ID: {user_id} | Username: {user.get('username', 'N/A')}")
-                        print()
+                    for name, change_set in changes.items():
+                        self._print_change_set(name, change_set)
+                    for name, error in monitor.errors.items():
+                        UI.print_warning(f"{name} poll failed, keeping last snapshot: {error}")
                     
                     print(f"{Colors.DIM}{'─' * 80}{Colors.RESET}\n")
+                elif monitor.errors:
+                    print(f"\r{' ' * 80}\r", end='')
+                    for name, error in monitor.errors.items():
+                        UI.print_warning(f"[{current_time}] {name} poll failed, keeping last snapshot: {error}")
                 else:
-                    status = f"[{current_time}] Scan #{iteration} - No changes | Assets: {current_counts['assets']} | Licenses: {current_counts['licenses']} | Users: {current_counts['users']} | Total events: {total_changes}"
+                    status = f"[{current_time}] Scan #{iteration} - No changes | Assets: {counts['assets']} | Licenses: {counts['licenses']} | Users: {counts['users']} | Total events: {total_changes}"
                     print(f"\r{Colors.DIM}{status[:80]}{Colors.RESET}", end='', flush=True)
                 
-                previous_stats = current_stats
-                previous_counts = current_counts
-                
-                time.sleep(refresh_interval)
-                
         except KeyboardInterrupt:
+            if self.event_log is not None:
+                self.event_log.flush()
+            elapsed = time.monotonic() - started
+            scheduler = monitor.scheduler
             print(f"\n\n{Colors.BRIGHT_YELLOW}⚠ Monitoring stopped by user{Colors.RESET}")
-            print(f"{Colors.BRIGHT_CYAN}ℹ Total scans performed: {iteration}{Colors.RESET}")
-            print(f"{Colors.BRIGHT_CYAN}ℹ Total monitoring time: {iteration * refresh_interval} seconds ({(iteration * refresh_interval) / 60:.1f} minutes){Colors.RESET}")
-            print(f"{Colors.BRIGHT_CYAN}ℹ Total change events detected: {total_changes}{Colors.RESET}\n")
+            print(f"{Colors.BRIGHT_CYAN}ℹ Total scans performed: {iteration} ({sum(scheduler.polls.values())} resource polls){Colors.RESET}")
+            print(f"{Colors.BRIGHT_CYAN}ℹ Total monitoring time: {elapsed:.0f} seconds ({elapsed / 60:.1f} minutes){Colors.RESET}")
+            print(f"{Colors.BRIGHT_CYAN}ℹ Total change events detected: {total_changes}{Colors.RESET}")
+            intervals = ' | '.join(f"{name}: {interval:.0f}s" for name, interval in scheduler.intervals.items())
+            print(f"{Colors.BRIGHT_CYAN}ℹ Current poll intervals: {intervals}{Colors.RESET}")
+            if incremental:
+                print(f"{Colors.BRIGHT_CYAN}ℹ Rows transferred: {monitor.rows_fetched} (deletion sweeps: {monitor.sweeps}){Colors.RESET}")
+            print()
+            UI.pause()
+    
+    def show_change_log(self):
+        UI.clear_screen()
+        UI.print_header()
+        if self.event_log is None:
+            UI.print_warning("The change log is disabled.")
+            UI.pause()
+            return
+        
+        UI.print_box("Change Log", [
+            "Events recorded by the real-time monitor",
+            "Leave a filter empty to skip it",
+        ], Colors.BRIGHT_YELLOW)
+        since = UI.get_input("Since (YYYY-MM-DD[THH:MM], default: last 7 days)")
+        until = UI.get_input("Until (YYYY-MM-DD[THH:MM])")
+        resource = UI.get_input("Resource (assets/licenses/users)").lower()
+        record_id = UI.get_input("Record ID")
+        user = UI.get_input("User (username or ID)")
+        
+        if not since:
+            since = datetime.fromtimestamp(time.time() - 7 * 86400).isoformat(timespec='seconds')
+        if resource and resource not in MONITOR_ENDPOINTS:
+            UI.print_error(f"Unknown resource: {resource}")
             UI.pause()
+            return
+        
+        events = self.event_log.query(since, until or None, resource or None,
+                                      int(record_id) if record_id.isdigit() else None, user or None)
+        rows = ([event.get('time'), event.get('resource'), event.get('event'), event.get('id'), event.get('name'),
+                 event.get('field') or '', '' if event.get('from') is None else event.get('from'),
+                 '' if event.get('to') is None else event.get('to')] for event in events)
+        shown = UI.print_table(['Time', 'Resource', 'Event', 'ID', 'Name', 'Field', 'From', 'To'], rows,
+                               "🧾 CHANGE LOG", page_size=UI.page_rows())
+        if not shown:
+            UI.print_warning("No matching events.")
+        UI.pause()
+    
+    def _print_change_set(self, resource: str, change_set: ChangeSet):
+        label = resource.upper()
+        singular = label.rstrip('S')
+        
+        def summary(record: Dict) -> str:
+            parts = [f"ID: {record.get('id')}"]
+            parts += [f"{name}: {pluck(record, path, 'N/A')}" for name, path in SUMMARY_FIELDS[resource]]
+            return ' | '.join(parts)
+        
+        if change_set.added:
+            print(f"{Colors.BRIGHT_GREEN}  ➕ NEW {label} ({len(change_set.added)}):{Colors.RESET}")
+            for record in change_set.added:
+                print(f"     • {summary(record)}")
+            print()
+        
+        if change_set.removed:
+            print(f"{Colors.BRIGHT_RED}  ➖ DELETED {label} ({len(change_set.removed)}):{Colors.RESET}")
+            for record in change_set.removed:
+                print(f"     • {summary(record)}")
+            print()
+        
+        if change_set.changed:
+            print(f"{Colors.BRIGHT_CYAN}  🔄 {singular} CHANGES ({len(change_set.changed)}):{Colors.RESET}")
+            for change in change_set.changed:
+                record = change['record']
+                name = record.get('name') or record.get('username') or 'N/A'
+                print(f"     • {name} (ID: {change['id']})")
+                for field, before, after in change['fields']:
+                    if field == 'Assignment':
+                        before, after = before or 'Unassigned', after or 'Unassigned'
+                    print(f"       {field}: {'N/A' if before is None else before} → {'N/A' if after is None else after}")
+            print()
     
     def exit_application(self):
+        if self.async_client is not None:
+            self.async_client.close()
+        self.client.close()
+        if self.history is not None:
+            self.history.close()
+        if self.event_log is not None:
+            self.event_log.close()
         UI.clear_screen()
         print(f"\n{Colors.BRIGHT_CYAN}╔════════════════════════════════════════════╗{Colors.RESET}")
         print(f"{Colors.BRIGHT_CYAN}║{Colors.RESET}     {Colors.BOLD}Thank you for using{Colors.RESET}               {Colors.BRIGHT_CYAN}║{Colors.RESET}")
@@ -1045,9 +4221,384 @@ class SnipeITManager:
         print(f"{Colors.BRIGHT_CYAN}╚════════════════════════════════════════════╝{Colors.RESET}\n")
         sys.exit(0)
 
+class RowWriter:
+    # Streams records to stdout as JSON Lines or CSV, without any table rendering
+    
+    def __init__(self, output_format: str, columns: Optional[List[Tuple[str, Tuple[str, ...]]]] = None, stream=None):
+        self.output_format = output_format
+        self.columns = columns
+        self.stream = stream or sys.stdout
+        self.csv_writer = None
+        self.count = 0
+    
+    def write(self, record: Dict):
+        if self.output_format == 'jsonl':
+            self.stream.write(json.dumps(record, default=str) + '\n')
+        else:
+            if self.csv_writer is None:
+                self.csv_writer = csv.writer(self.stream)
+                headers = [header for header, _ in self.columns] if self.columns else list(record)
+                self.csv_writer.writerow(headers)
+            if self.columns:
+                self.csv_writer.writerow([pluck(record, path, '') for _, path in self.columns])
+            else:
+                self.csv_writer.writerow(['' if value is None else value for value in record.values()])
+        self.count += 1
+    
+    def write_all(self, records: Iterable[Dict]) -> int:
+        for record in records:
+            self.write(record)
+        self.stream.flush()
+        return self.count
+
+
+BATCH_RESOURCES = {
+    'assets': 'iter_assets',
+    'licenses': 'iter_licenses',
+    'users': 'iter_users',
+    'categories': 'iter_categories',
+    'locations': 'iter_locations',
+    'models': 'iter_models',
+}
+
+
+def command_list(client: SnipeITClient, args: argparse.Namespace) -> int:
+    columns = LIST_COLUMNS[args.resource]
+    # CSV only shows the list columns, so only those need decoding; JSON Lines keeps whole records
+    fields = view_fields(args.resource) if args.format == 'csv' else None
+    # One pass over the collection: read the cache but do not fill it with every page
+    rows = client.iter_rows(args.resource, args.limit, args.page_size, workers=args.workers, fields=fields,
+                            store=False)
+    RowWriter(args.format, columns).write_all(rows)
+    return 0
+
+def command_stats(client: SnipeITClient, args: argparse.Namespace) -> int:
+    if args.use_async:
+        async_client = AsyncSnipeITClient.from_client(client)
+        try:
+            stats = async_client.run(async_client.get_statistics())
+        finally:
+            async_client.close()
+        client.last_timings = async_client.last_timings
+    else:
+        stats = client.get_statistics()
+    if not args.no_history:
+        # Totals only; the interactive dashboard also records the full-inventory metrics
+        history = MetricsHistory(args.metrics_db)
+        try:
+            history.record({f"{name.lower()}.total": total for name, total in stats.items()})
+        finally:
+            history.close()
+    RowWriter(args.format).write_all(
+        {'resource': name, 'total': total, 'ms': round(client.last_timings.get(name, 0) * 1000, 1)}
+        for name, total in stats.items()
+    )
+    return 0
+
+def command_trend(client: SnipeITClient, args: argparse.Namespace) -> int:
+    history = MetricsHistory(args.metrics_db)
+    try:
+        trends = history.trends(time.time() - args.days * 86400, args.metric)
+    finally:
+        history.close()
+    RowWriter(args.format).write_all(
+        {**trend, **{key: round(trend[key], 2) for key in ('first', 'last', 'delta', 'min', 'max')}}
+        for trend in trends
+    )
+    return 0
+
+def command_search(client: SnipeITClient, args: argparse.Namespace) -> int:
+    # The output has fixed columns, all of them within the list-view fields
+    fields = {resource: view_fields(resource) for resource in MONITOR_ENDPOINTS}
+    if args.local:
+        local_search = LocalSearch(client)
+        local_search.refresh()
+        matches = local_search.search(args.term, limit=args.limit)
+    elif args.use_async:
+        async_client = AsyncSnipeITClient.from_client(client)
+        try:
+            matches = async_client.run(async_client.search_everything(args.term, args.limit, fields))
+        finally:
+            async_client.close()
+    else:
+        matches = client.search_everything(args.term, args.limit, fields)
+    writer = RowWriter(args.format)
+    for resource, records in matches.items():
+        writer.write_all({'resource': resource, 'id': r.get('id'), 'name': r.get('name') or r.get('username'),
+                          'tag': r.get('asset_tag'), 'email': r.get('email')} for r in records)
+    return 0
+
+def command_monitor(client: SnipeITClient, args: argparse.Namespace) -> int:
+    event_log = None if args.no_event_log else EventLog(args.event_log)
+    monitor = ChangeMonitor(client, args.interval, incremental=not args.full, event_log=event_log)
+    monitor.start()
+    writer = RowWriter(args.format)
+    try:
+        for changes in monitor.ticks():
+            timestamp = datetime.now().isoformat(timespec='seconds')
+            for resource, change_set in changes.items():
+                writer.write_all(change_set.events(resource, timestamp))
+            for resource, error in monitor.errors.items():
+                UI.print_warning(f"{resource} poll failed: {error}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if event_log is not None:
+            event_log.close()
+    return 0
+
+def command_events(client: SnipeITClient, args: argparse.Namespace) -> int:
+    event_log = EventLog(args.event_log)
+    RowWriter(args.format).write_all(event_log.query(args.since, args.until, args.resource, args.id, args.user))
+    return 0
+
+def command_delete(client: SnipeITClient, args: argparse.Namespace) -> int:
+    if args.resume:
+        deleter = BulkDeleter.resume(client, args.resume, workers=args.workers, rate=args.rate)
+        ids = deleter.ids
+    else:
+        if not args.resource:
+            UI.print_error("A resource is required unless --resume is given")
+            return 2
+        ids = list(args.ids)
+        if args.ids_file:
+            with open(args.ids_file) as f:
+                ids += read_ids(f)
+        if args.stdin:
+            ids += read_ids(sys.stdin)
+        if args.filter:
+            ids += [r['id'] for r in client.search(MONITOR_ENDPOINTS[args.resource], args.filter) if r.get('id')]
+        deleter = BulkDeleter(client, args.resource, args.checkpoint, workers=args.workers, rate=args.rate)
+    
+    plan = deleter.plan(ids)
+    UI.print_info(f"Plan: delete {plan['pending']} {plan['resource']} ({plan['already_done']} already done, "
+                  f"{plan['missing']} not found), checkpoint {plan['checkpoint']}")
+    for record in plan['sample']:
+        UI.print_info("  " + ' | '.join(f"{header}: {pluck(record, path, 'N/A')}" for header, path in LIST_COLUMNS[plan['resource']][:4]))
+    
+    writer = RowWriter(args.format)
+    if args.dry_run:
+        writer.write_all(chain(
+            ({'resource': plan['resource'], 'id': record_id, 'action': 'delete'} for record_id in deleter.pending),
+            ({'resource': plan['resource'], 'id': record_id, 'action': 'missing'} for record_id in deleter.missing)))
+        return 0
+    if not plan['pending']:
+        return 0
+    
+    if not args.yes:
+        if not sys.stdin.isatty() or args.stdin:
+            UI.print_error("Refusing to delete without --yes in a non-interactive session")
+            return 2
+        if not UI.confirm(f"Delete {plan['pending']} {plan['resource']}?"):
+            UI.print_info("Deletion cancelled.")
+            return 1
+    
+    write_lock = threading.Lock()
+    
+    def on_result(record_id: int, ok: bool):
+        with write_lock:
+            writer.write({'resource': plan['resource'], 'id': record_id, 'deleted': ok})
+    
+    try:
+        report = deleter.run(on_result)
+    except KeyboardInterrupt:
+        UI.print_warning(f"Interrupted; resume with --resume {deleter.checkpoint_path}")
+        return 130
+    sys.stdout.flush()
+    UI.print_info(json.dumps(report))
+    return 1 if report['failed'] else 0
+
+
+def command_export(client: SnipeITClient, args: argparse.Namespace) -> int:
+    path = args.output
+    output_format = args.export_format
+    compress = args.gzip or path.endswith('.gz')
+    if output_format is None:
+        suffix = path[:-3] if path.endswith('.gz') else path
+        output_format = next((name for name in EXPORT_FORMATS if suffix.endswith('.' + name)), 'csv')
+    if path == '-' and args.resume:
+        UI.print_error("Cannot resume an export to stdout")
+        return 2
+    columns = [column.strip() for column in args.columns.split(',')] if args.columns else None
+    try:
+        exporter = InventoryExporter(client, args.resource, path, output_format, compress=compress, columns=columns,
+                                     page_size=args.page_size, workers=args.workers)
+        if args.resume:
+            exporter.resume()
+    except FileNotFoundError:
+        UI.print_error(f"No unfinished export at {path}")
+        return 2
+    except ValueError as e:
+        UI.print_error(str(e))
+        return 2
+    if exporter.rows:
+        UI.print_info(f"Resuming {args.resource} export after {exporter.rows} rows")
+    
+    def on_progress(rows: int):
+        UI.print_info(f"  {rows} rows written")
+    
+    try:
+        report = exporter.run(on_progress if path != '-' else None)
+    except (SnipeITError, KeyboardInterrupt, OSError) as e:
+        if exporter.progress_path:
+            UI.print_warning(f"Export stopped after {exporter.rows} rows; continue with --resume")
+        if isinstance(e, KeyboardInterrupt):
+            return 130
+        raise
+    if report['late_columns']:
+        UI.print_warning(f"Fields not in the header were left out: {', '.join(report['late_columns'][:10])}")
+    if report['coerced']:
+        UI.print_warning(f"{report['coerced']} values did not fit their Parquet column type and were written as null")
+    UI.print_info(json.dumps(report))
+    return 0
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Snipe-IT Lazy Cli - Asset Management Tool. "
+                                                 "Run without a command for the interactive menu.")
+    parser.add_argument('--url', default=SNIPEIT_API_URL, help="Snipe-IT API base URL (env: SNIPEIT_API_URL)")
+    parser.add_argument('--token', default=SNIPEIT_API_TOKEN, help="Snipe-IT API token (env: SNIPEIT_API_TOKEN)")
+    cache_mode = parser.add_mutually_exclusive_group()
+    cache_mode.add_argument('--no-cache', action='store_true', help="bypass the local response cache")
+    cache_mode.add_argument('--refresh', action='store_true', help="ignore cached responses but store fresh ones")
+    parser.add_argument('--cache-db', nargs='?', const=CACHE_DB_PATH, default=None, metavar='PATH',
+                        help=f"persist the cache in SQLite (default path: {CACHE_DB_PATH})")
+    parser.add_argument('--rate-limit', type=float, default=API_RATE_LIMIT, metavar='PER_MINUTE',
+                        help="client-side API request limit per minute, 0 to disable (env: SNIPEIT_RATE_LIMIT)")
+    parser.add_argument('--burst', type=int, default=API_RATE_BURST, help="requests allowed back to back under the limit")
+    parser.add_argument('--json-decoder', choices=('auto',) + JSONDecoder.BACKENDS, default=JSON_DECODER,
+                        help="JSON library for API responses (env: SNIPEIT_JSON_DECODER)")
+    parser.add_argument('--metrics-db', default=METRICS_DB_PATH, metavar='PATH',
+                        help=f"statistics history database (default: {METRICS_DB_PATH})")
+    parser.add_argument('--no-history', action='store_true', help="do not record statistics snapshots")
+    parser.add_argument('--event-log', default=EVENT_LOG_PATH, metavar='PATH',
+                        help=f"monitor change-event log (default: {EVENT_LOG_PATH})")
+    parser.add_argument('--no-event-log', action='store_true', help="do not persist monitor change events")
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help="run statistics and server search on the asyncio client (needs aiohttp)")
+    parser.add_argument('--metrics-out', metavar='PATH',
+                        help="on exit, write request metrics in Prometheus text format (e.g. for node_exporter)")
+    parser.add_argument('--metrics-json', action='store_true', help="on exit, print a JSON request-metrics summary to stderr")
+    parser.add_argument('--profile', metavar='DIR', help="run each command or menu action under cProfile, saving .prof files")
+    
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument('--format', choices=['jsonl', 'csv'], default='jsonl', help="output format (default: jsonl)")
+    
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    for resource in BATCH_RESOURCES:
+        resource_parser = commands.add_parser(resource, help=f"{resource} commands")
+        actions = resource_parser.add_subparsers(dest='action', metavar='action', required=True)
+        list_parser = actions.add_parser('list', parents=[output], help=f"stream every {resource[:-1]} record")
+        list_parser.add_argument('--limit', type=int, default=None, help="stop after this many rows")
+        list_parser.add_argument('--page-size', type=int, default=PAGE_SIZE)
+        list_parser.add_argument('--workers', type=int, default=FETCH_WORKERS, help="pages fetched in parallel")
+        list_parser.set_defaults(handler=command_list, resource=resource)
+    
+    stats_parser = commands.add_parser('stats', parents=[output], help="resource totals (recorded to the history)")
+    stats_parser.set_defaults(handler=command_stats)
+    
+    trend_parser = commands.add_parser('trend', parents=[output], help="recorded statistics trends, without API calls")
+    trend_parser.add_argument('--days', type=float, default=TREND_DAYS)
+    trend_parser.add_argument('--metric', action='append', help="only this metric (repeatable)")
+    trend_parser.set_defaults(handler=command_trend)
+    
+    search_parser = commands.add_parser('search', parents=[output], help="search assets, licenses and users")
+    search_parser.add_argument('term')
+    search_parser.add_argument('--limit', type=int, default=None, help="maximum matches per resource")
+    search_parser.add_argument('--local', action='store_true', help="mirror the inventory and query a local trigram index")
+    search_parser.set_defaults(handler=command_search)
+    
+    monitor_parser = commands.add_parser('monitor', parents=[output], help="stream change events until interrupted")
+    monitor_parser.add_argument('--interval', type=float, default=5)
+    monitor_parser.add_argument('--full', action='store_true', help="refetch snapshots instead of incremental sync")
+    monitor_parser.set_defaults(handler=command_monitor)
+    
+    events_parser = commands.add_parser('events', parents=[output], help="query the persisted change-event log")
+    events_parser.add_argument('--since', help="ISO time or prefix, e.g. 2024-05-01 or 2024-05-01T09:00")
+    events_parser.add_argument('--until', help="ISO time or prefix (inclusive)")
+    events_parser.add_argument('--resource', choices=list(MONITOR_ENDPOINTS))
+    events_parser.add_argument('--id', type=int, help="only events for this record ID")
+    events_parser.add_argument('--user', help="username or user ID: events on that user or assignments to/from them")
+    events_parser.set_defaults(handler=command_events)
+    
+    delete_parser = commands.add_parser('delete', parents=[output], help="delete records by ID, file, stdin or filter")
+    delete_parser.add_argument('resource', nargs='?', choices=list(DELETE_METHODS))
+    delete_parser.add_argument('ids', type=int, nargs='*')
+    delete_parser.add_argument('--ids-file', metavar='PATH', help="file with one ID per line")
+    delete_parser.add_argument('--stdin', action='store_true', help="read IDs from stdin")
+    delete_parser.add_argument('--filter', metavar='TERM', help="delete every record the server search matches")
+    delete_parser.add_argument('--dry-run', action='store_true', help="print the plan and the IDs without deleting")
+    delete_parser.add_argument('--yes', action='store_true', help="do not ask for confirmation")
+    delete_parser.add_argument('--workers', type=int, default=BULK_DELETE_WORKERS)
+    delete_parser.add_argument('--rate', type=float, default=BULK_DELETE_RATE, help="deletes per second")
+    delete_parser.add_argument('--checkpoint', metavar='PATH', help="where to record progress")
+    delete_parser.add_argument('--resume', metavar='CHECKPOINT', help="continue an interrupted run")
+    delete_parser.set_defaults(handler=command_delete)
+    
+    export_parser = commands.add_parser('export', help="stream a whole resource to CSV, JSON Lines or Parquet")
+    export_parser.add_argument('resource', choices=list(RESOURCE_ENDPOINTS))
+    export_parser.add_argument('--output', '-o', required=True, metavar='PATH',
+                               help="output file, '-' for stdout; a directory of part files for Parquet")
+    export_parser.add_argument('--format', dest='export_format', choices=EXPORT_FORMATS,
+                               help="default: from the file suffix, else csv")
+    export_parser.add_argument('--gzip', action='store_true', help="gzip the output (implied by a .gz suffix)")
+    export_parser.add_argument('--columns', metavar='A,B,...', help="only these flattened columns, e.g. id,name,model.name")
+    export_parser.add_argument('--resume', action='store_true', help="continue an interrupted export of the same PATH")
+    export_parser.add_argument('--page-size', type=int, default=PAGE_SIZE)
+    export_parser.add_argument('--workers', type=int, default=FETCH_WORKERS, help="pages fetched in parallel")
+    export_parser.set_defaults(handler=command_export)
+    
+    return parser.parse_args(argv)
+
+def build_client(args: argparse.Namespace) -> SnipeITClient:
+    cache = ResponseCache(db_path=args.cache_db)
+    cache.enabled = not args.no_cache
+    cache.refresh = args.refresh
+    try:
+        decoder = JSONDecoder(args.json_decoder)
+    except ValueError as e:
+        UI.print_warning(f"{e}; using the best available decoder")
+        decoder = JSONDecoder('auto')
+    return SnipeITClient(args.url, args.token, cache=cache, rate_limit=args.rate_limit, rate_burst=args.burst,
+                         decoder=decoder)
+
+def run_command(args: argparse.Namespace) -> int:
+    UI.message_stream = sys.stderr
+    if args.use_async and aiohttp is None:
+        UI.print_warning("--async needs aiohttp; using the threaded client")
+        args.use_async = False
+    client = build_client(args)
+    try:
+        with profiled(args.profile, args.command):
+            return args.handler(client, args)
+    except SnipeITError as e:
+        UI.print_error(f"API Error: {str(e)}")
+        return 1
+    except BrokenPipeError:
+        # Downstream closed the pipe (e.g. `| head`); stop quietly
+        sys.stderr.close()
+        return 0
+    finally:
+        client.close()
+        if not sys.stderr.closed:
+            export_metrics(client, args.metrics_out, args.metrics_json)
+
 def main():
+    args = parse_args()
+    if args.command:
+        sys.exit(run_command(args))
+    
+    client = None
     try:
-        manager = SnipeITManager()
+        history = None if args.no_history else MetricsHistory(args.metrics_db)
+        event_log = None if args.no_event_log else EventLog(args.event_log)
+        client = build_client(args)
+        async_client = None
+        if args.use_async:
+            if aiohttp is None:
+                UI.print_warning("--async needs aiohttp; using the threaded client")
+            else:
+                async_client = AsyncSnipeITClient.from_client(client)
+        manager = SnipeITManager(client, history, event_log, async_client, args.profile)
         manager.run()
     except KeyboardInterrupt:
         print(f"\n\n{Colors.BRIGHT_YELLOW}⚠ Application interrupted by user{Colors.RESET}")
@@ -1055,6 +4606,9 @@ def main():
     except Exception as e:
         print(f"\n{Colors.BRIGHT_RED}✗ Fatal Error: {str(e)}{Colors.RESET}")
         sys.exit(1)
+    finally:
+        if client is not None:
+            export_metrics(client, args.metrics_out, args.metrics_json)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,58 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+import mock_server
+import snipelzy
+
+
+@pytest.fixture
+def server():
+    # The benchmark stand-in API: 2000 assets, 400 users, 200 licenses, no latency
+    srv = mock_server.start(2000)
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def client(server):
+    client = snipelzy.SnipeITClient(server.url, 'test', cache=snipelzy.ResponseCache(), rate_limit=0)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(snipelzy, 'RETRY_BACKOFF', 0.001)
+    monkeypatch.setattr(snipelzy, 'RETRY_MAX_DELAY', 0.01)
+
+
+class FakeClock:
+    # Stands in for the time module: sleeping just moves the clock forward
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def perf_counter(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # Replaces the time module as snipelzy sees it
+    clock = FakeClock()
+    monkeypatch.setattr(snipelzy, 'time', clock)
+    return clock
@@ -0,0 +1,56 @@
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from snipelzy import AsyncSnipeITClient, ResponseCache
+
+
+@pytest.fixture
+def async_client(server):
+    client = AsyncSnipeITClient(server.url, 'test', cache=ResponseCache(), rate_limit=0)
+    yield client
+    client.close()
+
+
+def test_async_client_opens_no_requests_session(async_client):
+    assert not hasattr(async_client, 'session') and not hasattr(async_client, 'adapter')
+    assert async_client.connection_stats()['new_connections'] == 0
+
+
+def test_list_pages_concurrently_in_order(async_client):
+    rows = async_client.run(async_client.list_assets(limit=None, silent=True, page_size=150, workers=6, fresh=True))
+    assert [row['id'] for row in rows] == list(range(1, 2001))
+    assert len(async_client.run(async_client.list_users(limit=50, silent=True))) == 50
+    stats = async_client.connection_stats()
+    assert stats['requests'] == 15
+    assert stats['reused_connections'] > 0
+
+
+def test_get_and_get_many(async_client):
+    assert async_client.run(async_client.get_asset(12))['asset_tag'] == 'TAG-0000012'
+    assert async_client.run(async_client.get_asset(999999)) is None
+    details = async_client.run(async_client.get_many('users', [3, 1, 3, 999999]))
+    assert list(details) == [3, 1, 999999]
+    assert details[3]['id'] == 3 and details[999999] is None
+
+
+def test_delete_removes_the_record(async_client, server):
+    assert async_client.run(async_client.delete_asset(5)) is True
+    assert async_client.run(async_client.get_asset(5)) is None
+    assert async_client.run(async_client.delete_asset(5)) is False
+    assert async_client.run(async_client.get_statistics())['Assets'] == 1999
+
+
+def test_from_client_shares_the_sync_clients_state(client):
+    async_client = AsyncSnipeITClient.from_client(client)
+    try:
+        assert async_client.cache is client.cache and async_client.metrics is client.metrics
+        assert async_client.limiter is client.limiter and async_client.breaker is client.breaker
+        async_client.run(async_client.list_assets(limit=10, silent=True))
+        client.list_assets(limit=10, silent=True)
+        assert client.request_count == 0
+        assert client.cache.stats()['entries'] == 1
+    finally:
+        async_client.close()
+    # The shared cache stays open for the sync client
+    assert client.list_assets(limit=10, silent=True)
@@ -0,0 +1,90 @@
+import pytest
+
+from snipelzy import PageBrowser, ResponseCache, SnipeITClient
+
+
+@pytest.fixture
+def uncached(server):
+    # Without the response cache, a page that is not in the browser's window costs a request
+    cache = ResponseCache()
+    cache.enabled = False
+    client = SnipeITClient(server.url, 'test', cache=cache, rate_limit=0)
+    yield client
+    client.close()
+
+
+def browse(client, **options):
+    return PageBrowser(client, 'assets', 100, **options)
+
+
+def settle(browser):
+    with browser._lock:
+        pending = list(browser.pending.values())
+    for future in pending:
+        future.result()
+
+
+def ids(rows):
+    return [row['id'] for row in rows]
+
+
+def test_pages_step_forward_from_the_prefetched_window(uncached):
+    browser = browse(uncached)
+    try:
+        assert ids(browser.page(0)) == list(range(1, 101))
+        assert (browser.total, browser.page_count, browser.loads) == (2000, 20, 1)
+        for index in (1, 2, 3):
+            settle(browser)
+            assert ids(browser.page(index))[0] == index * 100 + 1
+        assert (browser.loads, browser.instant) == (1, 3)
+        # Out-of-range pages clamp to the listing
+        assert ids(browser.page(99))[-1] == 2000 and browser.current == 19
+        assert ids(browser.page(-1))[0] == 1 and browser.current == 0
+    finally:
+        browser.close()
+
+
+def test_going_back_reuses_pages_without_requests(uncached):
+    browser = browse(uncached)
+    try:
+        for index in range(6):
+            browser.page(index)
+            settle(browser)
+        sent = uncached.request_count
+        assert [ids(browser.page(index))[0] for index in (5, 4, 3, 2)] == [501, 401, 301, 201]
+        settle(browser)
+        assert uncached.request_count == sent
+    finally:
+        browser.close()
+
+
+def test_pages_outside_the_window_are_evicted_and_fetched_again(uncached):
+    browser = browse(uncached, window=4, prefetch=1)
+    try:
+        for index in range(10):
+            browser.page(index)
+            settle(browser)
+        # The window keeps the pages nearest the current one
+        assert sorted(browser.pages) == [7, 8, 9, 10]
+        loads = browser.loads
+        assert ids(browser.page(0))[0] == 1
+        assert browser.loads == loads + 1
+    finally:
+        browser.close()
+
+
+def test_a_filter_starts_a_new_server_side_listing(uncached):
+    browser = browse(uncached)
+    try:
+        browser.page(3)
+        settle(browser)
+        browser.set_filter('host-12')
+        assert browser.pages == {} and browser.total is None
+        rows = browser.page(0)
+        # host-12, host-120..129 and host-1200..1299
+        assert (browser.total, browser.page_count) == (111, 2)
+        assert ids(rows)[:3] == [12, 120, 121]
+        settle(browser)
+        assert len(browser.page(1)) == 11
+    finally:
+        browser.close()
@@ -0,0 +1,45 @@
+import pytest
+
+import snipelzy
+from snipelzy import BulkDeleter
+
+
+class Interrupted(Exception):
+    pass
+
+
+def test_plan_reports_missing_ids_and_leaves_them_out(client, tmp_path):
+    deleter = BulkDeleter(client, 'assets', str(tmp_path / 'checkpoint.json'), rate=1000)
+    plan = deleter.plan([1, 2, 999999, 3, 888888])
+    assert (plan['pending'], plan['missing']) == (3, 2)
+    assert [record['id'] for record in plan['sample']] == [1, 2, 3]
+    report = deleter.run()
+    assert (report['deleted'], report['failed'], report['missing']) == (3, 0, 2)
+
+
+def test_plan_walks_the_listing_for_large_batches(client, tmp_path):
+    ids = list(range(1, 41)) + list(range(500000, 500010))
+    plan = BulkDeleter(client, 'assets', str(tmp_path / 'checkpoint.json')).plan(ids)
+    assert (plan['pending'], plan['missing']) == (40, 10)
+    assert len(plan['sample']) == snipelzy.BULK_PLAN_SAMPLE
+
+
+def test_interrupted_delete_resumes_from_its_checkpoint(client, tmp_path):
+    checkpoint = str(tmp_path / 'checkpoint.json')
+    deleter = BulkDeleter(client, 'assets', checkpoint, workers=1, rate=1000)
+    deleter.plan(list(range(1, 61)))
+    calls = []
+
+    def on_result(record_id, ok):
+        calls.append(record_id)
+        if len(calls) == 20:
+            raise Interrupted
+
+    with pytest.raises(Interrupted):
+        deleter.run(on_result)
+    resumed = BulkDeleter.resume(client, checkpoint, rate=1000)
+    # The delete already in flight when the callback raised is checkpointed too
+    assert len(resumed.done) >= 20
+    assert resumed.plan([])['pending'] == 60 - len(resumed.done)
+    report = resumed.run()
+    assert (report['deleted'], report['failed'], report['remaining']) == (60, 0, 0)
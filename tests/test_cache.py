@@ -0,0 +1,42 @@
+import time
+
+import mock_server
+import snipelzy
+from snipelzy import ResponseCache
+
+
+def test_cache_entries_expire_after_their_ttl():
+    cache = ResponseCache(ttls={'hardware': 0.05})
+    cache.put('/hardware?limit=1', {'total': 1})
+    assert cache.get('/hardware?limit=1') == {'total': 1}
+    time.sleep(0.06)
+    assert cache.get('/hardware?limit=1') is None
+
+
+def test_cache_evicts_least_recently_used_entries():
+    payload = {'total': 1, 'rows': [{'id': 1, 'name': 'x' * 100}]}
+    size = ResponseCache.sizeof(payload)
+    cache = ResponseCache(max_bytes=size * 2)
+    cache.put('/hardware?a', payload)
+    cache.put('/hardware?b', payload)
+    cache.get('/hardware?a')
+    cache.put('/hardware?c', payload)
+    assert cache.get('/hardware?a') is not None
+    assert cache.get('/hardware?b') is None
+    assert cache.stats()['evictions'] == 1
+
+
+def test_cache_charges_decoded_size_not_body_size():
+    rows = [mock_server.make_asset(i, mock_server.random.Random(i)) for i in range(1, 101)]
+    payload = {'total': 100, 'rows': rows}
+    body = snipelzy.json.dumps(payload).encode()
+    assert ResponseCache.sizeof(payload) > 2 * len(body)
+
+
+def test_one_pass_reads_do_not_fill_the_cache(client):
+    assert sum(1 for _ in client._iter_rows('/hardware', workers=4, fresh=True)) == 2000
+    assert client.cache.stats()['entries'] == 0
+    assert sum(1 for _ in client._iter_rows('/hardware', workers=4, store=False)) == 2000
+    assert client.cache.stats()['entries'] == 0
+    client.list_assets(limit=10, silent=True)
+    assert client.cache.stats()['entries'] == 1
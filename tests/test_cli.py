@@ -0,0 +1,28 @@
+import csv
+import io
+import json
+
+import snipelzy
+from snipelzy import command_list, parse_args
+
+
+def test_iter_rows_takes_a_resource_name(client):
+    assert [row['id'] for row in client.iter_rows('users', limit=5)] == [1, 2, 3, 4, 5]
+    assert sum(1 for _ in client.iter_rows('categories', workers=4)) == 20
+    assert [row['id'] for row in client.iter_rows('assets', limit=3, start=10)] == [11, 12, 13]
+
+
+def test_list_streams_csv_columns(client, capsys):
+    assert command_list(client, parse_args(['assets', 'list', '--format', 'csv', '--limit', '250'])) == 0
+    rows = list(csv.reader(io.StringIO(capsys.readouterr().out)))
+    assert rows[0] == [header for header, _ in snipelzy.LIST_COLUMNS['assets']]
+    assert len(rows) == 251 and rows[1][0] == '1'
+    # A one-pass listing leaves nothing behind in the cache
+    assert client.cache.stats()['entries'] == 0
+
+
+def test_list_streams_whole_records_as_json_lines(client, capsys):
+    assert command_list(client, parse_args(['users', 'list', '--page-size', '100'])) == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record['id'] for record in records] == list(range(1, 401))
+    assert 'email' in records[0]
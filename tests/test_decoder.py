@@ -0,0 +1,56 @@
+import json
+import random
+
+import pytest
+
+import mock_server
+from snipelzy import JSONDecoder, RecordStore
+
+FIELDS = tuple(RecordStore.fetch_fields('assets')) + (('assigned_to', 'department', 'name'),)
+
+
+def installed():
+    backends = []
+    for name in JSONDecoder.BACKENDS:
+        try:
+            backends.append(JSONDecoder(name))
+        except ValueError:
+            pass
+    return backends
+
+
+def odd_rows():
+    rows = [mock_server.make_asset(i, random.Random(i)) for i in range(1, 4)]
+    del rows[0]['model']
+    rows[0]['assigned_to'] = None
+    rows[1]['location'] = [{'name': 'Site 1'}]
+    rows[1]['custom_fields'] = []
+    rows[2]['status_label'] = 'Deployed'
+    return rows
+
+
+@pytest.mark.parametrize('rows', [
+    [mock_server.make_asset(i, random.Random(i)) for i in range(1, 21)],
+    odd_rows(),
+], ids=['typical', 'odd-shapes'])
+def test_every_backend_projects_rows_the_same_way(rows):
+    content = json.dumps({'total': len(rows), 'rows': rows}).encode()
+    expected = JSONDecoder('json').decode(content, FIELDS)
+    for decoder in installed():
+        assert decoder.decode(content, FIELDS) == expected, decoder.backend
+        assert decoder.decode(content) == json.loads(content), decoder.backend
+
+
+def test_missing_parents_are_none_and_unexpected_shapes_are_kept():
+    content = json.dumps({'total': 3, 'rows': odd_rows()}).encode()
+    for decoder in installed():
+        first, second, third = decoder.decode(content, FIELDS)['rows']
+        assert first['model'] is None and first['assigned_to'] is None, decoder.backend
+        assert (second['location'], second['custom_fields']) == ([{'name': 'Site 1'}], []), decoder.backend
+        assert third['status_label'] == 'Deployed', decoder.backend
+
+
+def test_every_backend_rejects_a_body_that_is_not_json():
+    for decoder in installed():
+        with pytest.raises(ValueError):
+            decoder.decode(b'<html>502 Bad Gateway</html>', FIELDS)
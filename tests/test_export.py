@@ -0,0 +1,97 @@
+import csv
+import gzip
+import json
+
+import pytest
+
+import snipelzy
+from snipelzy import InventoryExporter
+
+
+class Interrupted(Exception):
+    pass
+
+
+def stop_after(count):
+    def on_progress(done, *_):
+        if done >= count:
+            raise Interrupted
+    return on_progress
+
+
+def test_paging_starts_at_an_offset_and_honours_the_limit(client):
+    ids = [row['id'] for row in client.iter_rows('assets', limit=700, page_size=200, workers=3, fresh=True,
+                                                 start=1000)]
+    assert ids == list(range(1001, 1701))
+
+
+def test_export_flattens_nested_fields(client, tmp_path):
+    path = str(tmp_path / 'assets.csv')
+    report = InventoryExporter(client, 'assets', path, 'csv').run()
+    with open(path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert report['rows'] == len(rows) == 2000
+    first = rows[0]
+    assert first['model.name'] and first['status_label.name'] and first['custom.RAM']
+    assert first['warranty_expires'] == '2027-01-01'
+    assert 'available_actions' not in first and 'assigned_to' not in first
+
+
+@pytest.mark.parametrize('name, output_format, compress', [
+    ('assets.csv.gz', 'csv', True),
+    ('assets.jsonl', 'jsonl', False),
+])
+def test_interrupted_export_resumes_without_gaps_or_duplicates(client, tmp_path, monkeypatch, name, output_format,
+                                                              compress):
+    monkeypatch.setattr(snipelzy, 'EXPORT_CHECKPOINT_ROWS', 300)
+    path = str(tmp_path / name)
+    with pytest.raises(Interrupted):
+        InventoryExporter(client, 'assets', path, output_format, compress=compress).run(stop_after(900))
+    # Rows written after the last checkpoint are cut off on resume
+    with open(path, 'ab') as f:
+        f.write(b'torn partial write')
+
+    exporter = InventoryExporter(client, 'assets', path, output_format, compress=compress)
+    exporter.resume()
+    report = exporter.run()
+    assert report['resumed_at'] == 900
+
+    with (gzip.open(path, 'rt', newline='') if compress else open(path, newline='')) as f:
+        if output_format == 'csv':
+            ids = [int(row['id']) for row in csv.DictReader(f)]
+        else:
+            ids = [json.loads(line)['id'] for line in f]
+    assert ids == list(range(1, 2001))
+
+
+def test_interrupted_parquet_export_redoes_only_the_unfinished_part(client, tmp_path, monkeypatch):
+    parquet = pytest.importorskip('pyarrow.parquet')
+    monkeypatch.setattr(snipelzy, 'EXPORT_CHECKPOINT_ROWS', 250)
+    monkeypatch.setattr(snipelzy, 'EXPORT_PARQUET_ROWS', 500)
+    path = tmp_path / 'assets.parquet'
+    with pytest.raises(Interrupted):
+        InventoryExporter(client, 'assets', str(path), 'parquet').run(stop_after(1000))
+    (path / 'part-00002.parquet.tmp').write_bytes(b'unfinished')
+
+    exporter = InventoryExporter(client, 'assets', str(path), 'parquet')
+    exporter.resume()
+    report = exporter.run()
+    assert (report['resumed_at'], report['parts']) == (1000, 4)
+    assert sorted(p.name for p in path.iterdir()) == [f"part-0000{i}.parquet" for i in range(4)]
+    assert parquet.read_table(str(path)).column('id').to_pylist() == list(range(1, 2001))
+
+
+def test_resume_after_deletions_beyond_the_overlap_loses_no_rows(client, server, tmp_path, monkeypatch):
+    monkeypatch.setattr(snipelzy, 'EXPORT_CHECKPOINT_ROWS', 300)
+    path = str(tmp_path / 'assets.jsonl')
+    with pytest.raises(Interrupted):
+        InventoryExporter(client, 'assets', path, 'jsonl').run(stop_after(900))
+    # 600 exported rows vanish: offset 900 - EXPORT_RESUME_OVERLAP now lands on id 1001
+    for record_id in range(1, 601):
+        server.inventory.delete('hardware', record_id)
+
+    exporter = InventoryExporter(client, 'assets', path, 'jsonl')
+    exporter.resume()
+    exporter.run()
+    with open(path) as f:
+        assert [json.loads(line)['id'] for line in f] == list(range(1, 2001))
@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+
+import pytest
+
+import snipelzy
+from snipelzy import MetricsHistory
+
+DAY = 86400
+# Midnight UTC, so every tier's buckets start here
+T0 = 19675 * DAY
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = MetricsHistory(str(tmp_path / 'metrics.db'))
+    yield history
+    history.close()
+
+
+def rows(history, tier):
+    return history.db.execute("SELECT bucket, value, count FROM samples WHERE tier = ? ORDER BY bucket",
+                              (tier,)).fetchall()
+
+
+def test_each_snapshot_is_rolled_up_into_every_tier(history):
+    for offset, value in ((0, 10), (10, 20), (3700, 60)):
+        history.record({'assets.total': value}, timestamp=T0 + offset)
+    assert rows(history, 'raw') == [(T0, 10.0, 1), (T0 + 10, 20.0, 1), (T0 + 3700, 60.0, 1)]
+    assert rows(history, 'hour') == [(T0, 15.0, 2), (T0 + 3600, 60.0, 1)]
+    assert rows(history, 'day') == [(T0, 30.0, 3)]
+
+
+def test_rows_past_a_tiers_retention_are_pruned_on_write(history):
+    history.record({'assets.total': 1}, timestamp=T0)
+    history.record({'assets.total': 2}, timestamp=T0 + 8 * DAY)
+    assert [bucket for bucket, _, _ in rows(history, 'raw')] == [T0 + 8 * DAY]
+    assert [bucket for bucket, _, _ in rows(history, 'hour')] == [T0, T0 + 8 * DAY]
+    history.record({'assets.total': 3}, timestamp=T0 + 91 * DAY)
+    assert [bucket for bucket, _, _ in rows(history, 'hour')] == [T0 + 8 * DAY, T0 + 91 * DAY]
+    assert len(rows(history, 'day')) == 3
+
+
+def test_trends_read_the_finest_tier_that_covers_the_range(history, monkeypatch):
+    now = T0 + 30 * DAY
+    monkeypatch.setattr(snipelzy, 'time', SimpleNamespace(time=lambda: now))
+    for day in range(31):
+        history.record({'assets.total': 100 + day, 'users.total': 5}, timestamp=T0 + day * DAY)
+    assert history.tier_for(now - 3600) == 'raw'
+    assert history.tier_for(now - 20 * DAY) == 'hour'
+    assert history.tier_for(now - 400 * DAY) == 'day'
+
+    [trend] = history.trends(now - 20 * DAY, ['assets.total'])
+    assert (trend['tier'], trend['points'], trend['first'], trend['last'], trend['delta']) == ('hour', 21, 110, 130, 20)
+    assert [trend['metric'] for trend in history.trends(now - DAY)] == ['assets.total', 'users.total']
+
+
+def test_history_survives_reopening(tmp_path):
+    path = str(tmp_path / 'metrics.db')
+    history = MetricsHistory(path)
+    history.record({'assets.total': 7}, timestamp=T0)
+    history.close()
+    history = MetricsHistory(path)
+    try:
+        assert history.series('assets.total', T0, 'day') == [(T0, 7.0)]
+    finally:
+        history.close()
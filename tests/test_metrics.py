@@ -0,0 +1,88 @@
+import os
+import pstats
+
+import pytest
+
+from snipelzy import RequestMetrics, profiled
+
+
+def observed() -> RequestMetrics:
+    metrics = RequestMetrics(buckets=(0.1, 0.2, 0.4))
+    for _ in range(10):
+        metrics.observe('GET', '/hardware?limit=500', 200, 0.05, 1000)
+        metrics.observe('GET', '/hardware/1', 200, 0.15, 100)
+    metrics.observe('GET', '/users', 'error', 1.0, 0)
+    metrics.retry('GET', '/users')
+    metrics.cache_lookup('/hardware?limit=500', True)
+    metrics.cache_lookup('/hardware?limit=500', False)
+    metrics.decoded('/hardware?limit=500', 0.002)
+    return metrics
+
+
+def test_quantiles_interpolate_within_buckets():
+    metrics = observed()
+    key = ('GET', 'hardware')
+    assert metrics.quantile(0.5, key) == pytest.approx(0.1)
+    assert metrics.quantile(0.75, key) == pytest.approx(0.15)
+    # Past the last bucket the estimate stops at its bound
+    assert metrics.quantile(0.99, ('GET', 'users')) == 0.4
+    assert metrics.quantile(0.5) == pytest.approx(0.1 * 10.5 / 10)
+    assert RequestMetrics().quantile(0.5) is None
+
+
+def test_summary_groups_counters_by_endpoint():
+    summary = observed().summary()
+    hardware = summary['endpoints']['GET hardware']
+    assert (hardware['requests'], hardware['statuses'], hardware['bytes']) == (20, {'200': 20}, 11000)
+    assert hardware['mean_ms'] == 100.0
+    assert (hardware['p50_ms'], hardware['retries']) == (100.0, 0)
+    users = summary['endpoints']['GET users']
+    assert (users['statuses'], users['retries']) == ({'error': 1}, 1)
+    assert summary['cache'] == {'hardware': {'hit': 1, 'miss': 1}}
+    assert summary['decode_ms'] == {'hardware': 2.0}
+
+
+def test_prometheus_exposition_has_cumulative_buckets():
+    lines = observed().prometheus().splitlines()
+    buckets = [line.rsplit(' ', 1) for line in lines
+               if line.startswith('snipelzy_request_duration_seconds_bucket{method="GET",endpoint="hardware"')]
+    assert [(label.split('le=')[1], int(value)) for label, value in buckets] == [
+        ('"0.1"}', 10), ('"0.2"}', 20), ('"0.4"}', 20), ('"+Inf"}', 20)]
+    assert 'snipelzy_request_duration_seconds_count{method="GET",endpoint="hardware"} 20' in lines
+    assert 'snipelzy_requests_total{method="GET",endpoint="users",status="error"} 1' in lines
+    assert 'snipelzy_retries_total{method="GET",endpoint="users"} 1' in lines
+    assert 'snipelzy_cache_lookups_total{endpoint="hardware",result="hit"} 1' in lines
+
+
+def test_write_prometheus_replaces_the_file_whole(tmp_path):
+    metrics = observed()
+    path = tmp_path / 'textfile' / 'snipelzy.prom'
+    metrics.write_prometheus(str(path))
+    assert path.read_text() == metrics.prometheus()
+    assert os.listdir(path.parent) == ['snipelzy.prom']
+
+
+def test_client_requests_are_recorded(client):
+    client.list_assets(limit=10, silent=True)
+    client.list_assets(limit=10, silent=True)
+    summary = client.metrics.summary()
+    assert summary['endpoints']['GET hardware']['statuses'] == {'200': 1}
+    assert summary['cache']['hardware'] == {'hit': 1, 'miss': 1}
+
+
+def test_profiled_writes_a_readable_stats_file(tmp_path, capsys):
+    with profiled(str(tmp_path), 'stats'):
+        sorted(range(1000), key=lambda value: -value)
+    [name] = os.listdir(tmp_path)
+    assert name.startswith('stats-') and name.endswith('.prof')
+    assert pstats.Stats(str(tmp_path / name)).total_calls > 0
+    assert name in capsys.readouterr().out
+
+
+def test_profiled_without_a_directory_does_nothing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with profiled(None, 'stats'):
+        pass
+    with profiled('', 'stats'):
+        pass
+    assert os.listdir(tmp_path) == []
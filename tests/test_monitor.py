@@ -0,0 +1,154 @@
+from datetime import datetime
+
+import requests
+
+import mock_server
+import snipelzy
+from snipelzy import ChangeMonitor, DiffEngine, EventLog, InventoryMirror, RecordStore
+
+ALICE = {'id': 7, 'username': 'alice', 'name': 'Alice Smith', 'type': 'user'}
+OTHER_ALICE = {'id': 9, 'username': 'asmith', 'name': 'Alice Smith', 'type': 'user'}
+BOB = {'id': 8, 'username': 'bob', 'name': 'Bob Jones', 'type': 'user'}
+
+
+def asset(record_id, assigned_to=None, status='Ready to Deploy', ram='8GB'):
+    return {
+        'id': record_id, 'name': f"host-{record_id}", 'asset_tag': f"TAG-{record_id}",
+        'status_label': {'name': status}, 'model': {'name': 'Model 1'}, 'location': {'name': 'Site 1'},
+        'assigned_to': assigned_to, 'custom_fields': {'RAM': {'field': '_snipeit_ram_1', 'value': ram}},
+    }
+
+
+def diff(old, new, resource='assets'):
+    engine = DiffEngine(resource)
+    return engine.diff(engine.snapshot(old), engine.snapshot(new))
+
+
+# DiffEngine
+
+def test_diff_reports_added_removed_and_changed_fields():
+    changes = diff([asset(1), asset(2)], [asset(2, status='Deployed', ram='16GB'), asset(3)])
+    assert [record['id'] for record in changes.added] == [3]
+    assert [record['id'] for record in changes.removed] == [1]
+    assert changes.changed[0]['fields'] == [('Status', 'Ready to Deploy', 'Deployed'), ('RAM', '8GB', '16GB')]
+
+
+def test_unchanged_records_are_not_reported():
+    assert not diff([asset(1, ALICE)], [asset(1, ALICE)])
+
+
+def test_reassignment_between_namesakes_is_a_change():
+    changes = diff([asset(1, ALICE)], [asset(1, OTHER_ALICE)])
+    assert changes.changed[0]['fields'] == [('Assignment', 'Alice Smith', 'Alice Smith')]
+
+
+# Event log
+
+def logged(tmp_path, *change_sets):
+    log = EventLog(str(tmp_path / 'events.jsonl'))
+    for resource, changes in change_sets:
+        log.write_all(changes.events(resource, '2026-10-17T10:00:00'))
+    return log
+
+
+def test_assignment_events_match_username_and_id_not_display_name(tmp_path):
+    log = logged(tmp_path, ('assets', diff([asset(1), asset(2, BOB)], [asset(1, ALICE), asset(2)])))
+    try:
+        assert [event['id'] for event in log.query(user='alice')] == [1]
+        assert [event['id'] for event in log.query(user='7')] == [1]
+        assert [event['id'] for event in log.query(user='BOB')] == [2]
+        assert list(log.query(user='alice smith')) == []
+    finally:
+        log.close()
+
+
+def test_user_events_match_the_same_way_with_and_without_compact_records(tmp_path):
+    user = {'id': 7, 'username': 'alice', 'name': 'Alice Smith', 'email': 'alice@example.com'}
+    for compact in (False, True):
+        record = RecordStore('users').project(user) if compact else user
+        log = logged(tmp_path / str(compact), ('users', diff([], [record], 'users')))
+        try:
+            assert [event['id'] for event in log.query(user='alice')] == [7]
+            assert [event['id'] for event in log.query(user='7')] == [7]
+        finally:
+            log.close()
+
+
+# ChangeMonitor
+
+def test_full_refresh_sees_changes_past_the_first_page(client, server):
+    monitor = ChangeMonitor(client, refresh_interval=0, incremental=False)
+    assert monitor.start()['assets'] == 2000
+    requests.post(f"{server.url}/_bench/touch/hardware/50").raise_for_status()
+    changes = monitor.poll('assets')
+    assert not changes.added and not changes.removed
+    # Touched records are spread over all 2000; a 500-row snapshot would only see the first quarter
+    assert any(change['id'] > 500 for change in changes.changed)
+
+
+# InventoryMirror
+
+class FrozenClock(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2026, 10, 17, 10, 0, 0)
+
+
+def touch(server, count):
+    # Returns the IDs touched, in the order the mock stamped them
+    requests.post(f"{server.url}/_bench/touch/hardware/{count}").raise_for_status()
+    return list(server.inventory.touched['hardware'])[-count:]
+
+
+def test_sync_returns_records_touched_since_the_watermark(client, server):
+    mirror = InventoryMirror(client, '/hardware')
+    assert mirror.load() == 2000
+    assert mirror.watermark == '2025-01-01 00:33:20'
+    touched = touch(server, 5)
+    previous, current = mirror.sync()
+    assert sorted(record['id'] for record in current) == sorted(touched)
+    assert sorted(record['id'] for record in previous) == sorted(touched)
+    assert mirror.watermark > '2025-01-01 00:33:20'
+    assert mirror.sync() == ([], [])
+
+
+def test_records_stamped_in_the_watermark_second_are_not_missed(client, server, monkeypatch):
+    monkeypatch.setattr(mock_server, 'datetime', FrozenClock)
+    mirror = InventoryMirror(client, '/hardware')
+    mirror.load()
+    touch(server, 3)
+    mirror.sync()
+    assert mirror.watermark == '2026-10-17 10:00:00'
+    # Same second as the watermark: only re-reading that second finds these
+    touched = touch(server, 3)
+    _, current = mirror.sync()
+    assert sorted(record['id'] for record in current) == sorted(touched)
+
+
+def test_unchanged_sync_fetches_a_single_small_page(client, server):
+    mirror = InventoryMirror(client, '/hardware')
+    mirror.load()
+    sent = client.request_count
+    assert mirror.sync() == ([], [])
+    assert client.request_count == sent + 1
+    assert mirror.sweeps == 0
+    assert mirror.rows_fetched == 2000 + snipelzy.SYNC_PAGE_SIZE
+
+
+def test_deletions_are_swept_when_the_total_drops(client, server):
+    mirror = InventoryMirror(client, '/hardware')
+    mirror.load()
+    for record_id in (5, 1500):
+        assert client._request('DELETE', f"/hardware/{record_id}")['status'] == 'success'
+    previous, current = mirror.sync()
+    assert (sorted(record['id'] for record in previous), current) == ([5, 1500], [])
+    assert mirror.sweeps == 1
+    assert 5 not in mirror.records and len(mirror.records) == 1998
+
+
+def test_sweep_also_runs_every_few_ticks(client):
+    mirror = InventoryMirror(client, '/hardware', sweep_every=3)
+    mirror.load()
+    for _ in range(3):
+        mirror.sync()
+    assert mirror.sweeps == 1
@@ -0,0 +1,29 @@
+import time
+from itertools import islice
+
+import mock_server
+from snipelzy import SnipeITClient
+
+
+def test_parallel_paging_returns_every_row_in_order(client):
+    ids = [row['id'] for row in client._iter_rows('/hardware', page_size=150, workers=6, fresh=True)]
+    assert ids == list(range(1, 2001))
+
+
+def test_closing_the_pager_early_does_not_wait_for_queued_pages():
+    server = mock_server.start(20000, latency=0.1)
+    client = SnipeITClient(server.url, 'test', rate_limit=0)
+    try:
+        rows = client._iter_rows('/hardware', page_size=500, workers=8, fresh=True)
+        list(islice(rows, 600))
+        started = time.monotonic()
+        rows.close()
+        assert time.monotonic() - started < 0.5
+        sent_at_close = client.request_count
+        time.sleep(0.3)
+        # Queued pages are cancelled; nothing new starts once the pager is closed
+        assert client.request_count == sent_at_close
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
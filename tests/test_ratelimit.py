@@ -0,0 +1,57 @@
+import snipelzy
+from snipelzy import SnipeITClient, SnipeITRateLimited, TokenBucket
+
+
+def test_burst_passes_then_calls_are_paced_at_the_rate(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    waits = [bucket.acquire() for _ in range(6)]
+    assert waits == [0, 0, 0, 0.5, 0.5, 0.5]
+    assert clock.sleeps == [0.5, 0.5, 0.5]
+
+
+def test_idle_time_refills_up_to_the_burst_only(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    for _ in range(3):
+        bucket.acquire()
+    clock.now += 100
+    assert [bucket.acquire() for _ in range(4)] == [0, 0, 0, 0.5]
+
+
+def test_reservations_queue_in_order(clock):
+    bucket = TokenBucket(rate=2, burst=1)
+    assert [bucket.reserve() for _ in range(4)] == [0, 0.5, 1.0, 1.5]
+    # Weights above the burst are capped so a heavy call can still run
+    assert TokenBucket(rate=2, burst=1).reserve(5) == 0
+
+
+def test_penalize_holds_every_caller_off(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    bucket.penalize(10)
+    assert bucket.reserve() == 10.5
+    clock.now += 5
+    assert bucket.reserve() == 6.0
+    # A shorter penalty never shortens one already in force
+    bucket.penalize(1)
+    assert bucket.reserve() == 6.5
+
+
+def test_penalty_after_an_idle_spell_is_not_absorbed_by_old_debt(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+    bucket.penalize(10)
+    clock.now += 100
+    bucket.penalize(2)
+    assert bucket.reserve() == 2.5
+
+
+def test_retry_after_from_a_429_pauses_the_shared_limiter(clock):
+    client = SnipeITClient('http://127.0.0.1:9', 'test', rate_limit=60, rate_burst=5)
+    try:
+        error = SnipeITRateLimited('Too Many Requests', 429, retry_after=30)
+        client._after_failure('GET', '/hardware', error, True, 1)
+        assert client._reserve('/users') == 31
+        clock.now += 31
+        client._after_failure('GET', '/hardware', SnipeITRateLimited('Too Many Requests', 429), True, 1)
+        assert client._reserve('/users') == snipelzy.RETRY_BACKOFF + 1
+        assert client.throttled_count == 2
+    finally:
+        client.close()
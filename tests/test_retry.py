@@ -0,0 +1,115 @@
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from snipelzy import CircuitBreaker, SnipeITCircuitOpen, SnipeITClient, SnipeITUnavailable
+
+
+# Retries
+
+def test_refused_delete_is_retried(fast_retries):
+    probe = socket.socket()
+    probe.bind(('127.0.0.1', 0))
+    port = probe.getsockname()[1]
+    probe.close()
+    client = SnipeITClient(f'http://127.0.0.1:{port}', 'test', rate_limit=0)
+    with pytest.raises(SnipeITUnavailable):
+        client._request('DELETE', '/hardware/1')
+    assert client.request_count == client.retries
+
+
+def test_delete_reset_after_sending_is_not_retried(fast_retries):
+    listener = socket.socket()
+    listener.bind(('127.0.0.1', 0))
+    listener.listen(16)
+
+    def reset_everything():
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            conn.recv(65536)
+            # Linger 0: close with RST once the request has arrived
+            conn.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, b'\x01\x00\x00\x00\x00\x00\x00\x00')
+            conn.close()
+
+    threading.Thread(target=reset_everything, daemon=True).start()
+    client = SnipeITClient(f'http://127.0.0.1:{listener.getsockname()[1]}', 'test', rate_limit=0)
+    try:
+        with pytest.raises(SnipeITUnavailable):
+            client._request('DELETE', '/hardware/1')
+        assert client.request_count == 1
+        client.request_count = 0
+        with pytest.raises(SnipeITUnavailable):
+            client._request('GET', '/hardware/1', use_cache=False)
+        assert client.request_count == client.retries
+    finally:
+        listener.close()
+
+
+# CircuitBreaker
+
+def tripped(reset_timeout: float = 0.05) -> CircuitBreaker:
+    breaker = CircuitBreaker(threshold=2, reset_timeout=reset_timeout)
+    breaker.record_failure()
+    breaker.record_failure()
+    return breaker
+
+
+def admitted(breaker: CircuitBreaker) -> bool:
+    try:
+        breaker.before_call()
+        return True
+    except SnipeITCircuitOpen:
+        return False
+
+
+def test_breaker_opens_after_threshold_failures():
+    breaker = CircuitBreaker(threshold=2, reset_timeout=10)
+    breaker.record_failure()
+    assert breaker.state == 'closed' and admitted(breaker)
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    assert not admitted(breaker)
+
+
+def test_half_open_breaker_admits_a_single_probe():
+    breaker = tripped()
+    time.sleep(0.06)
+    assert breaker.state == 'half-open'
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: admitted(breaker), range(8)))
+    assert results.count(True) == 1
+
+
+def test_successful_probe_closes_the_circuit():
+    breaker = tripped()
+    time.sleep(0.06)
+    assert admitted(breaker)
+    breaker.record_success()
+    assert breaker.state == 'closed'
+    assert admitted(breaker) and admitted(breaker)
+
+
+def test_failed_probe_reopens_the_circuit():
+    breaker = tripped()
+    time.sleep(0.06)
+    assert admitted(breaker)
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    assert not admitted(breaker)
+    time.sleep(0.06)
+    assert admitted(breaker)
+
+
+def test_unreported_probe_frees_its_slot_after_the_reset_timeout():
+    breaker = tripped()
+    time.sleep(0.06)
+    assert admitted(breaker)
+    assert not admitted(breaker)
+    time.sleep(0.06)
+    assert admitted(breaker)
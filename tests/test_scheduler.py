@@ -0,0 +1,58 @@
+import pytest
+
+from snipelzy import PollScheduler
+
+
+def scheduler(resources=('assets',), jitter=0.0):
+    return PollScheduler(list(resources), base_interval=5, max_interval=40, backoff=2, jitter=jitter)
+
+
+def test_quiet_resources_back_off_up_to_the_maximum(clock):
+    polls = scheduler()
+    delays = []
+    for _ in range(5):
+        polls.record('assets', changed=False)
+        delays.append(polls.next_due['assets'] - clock.now)
+    assert delays == [10, 20, 40, 40, 40]
+    assert polls.polls['assets'] == 5
+
+
+def test_a_change_snaps_back_to_the_base_interval(clock):
+    polls = scheduler()
+    for _ in range(3):
+        polls.record('assets', changed=False)
+    polls.record('assets', changed=True)
+    assert polls.intervals['assets'] == 5
+    assert polls.next_due['assets'] == clock.now + 5
+    polls.record('assets', changed=False)
+    assert polls.intervals['assets'] == 10
+
+
+def test_wait_sleeps_until_the_next_resource_is_due(clock):
+    polls = scheduler(('assets', 'licenses', 'users'))
+    started = clock.now
+    # The first round is staggered across the base interval
+    assert polls.wait() == ['assets']
+    polls.record('assets', changed=False)
+    assert polls.wait() == ['licenses']
+    assert clock.now - started == pytest.approx(5 / 3)
+    polls.record('licenses', changed=True)
+    assert polls.wait() == ['users']
+    polls.record('users', changed=False)
+    assert polls.wait() == ['licenses']
+    assert clock.now == pytest.approx(started + 5 / 3 + 5)
+
+
+def test_retry_after_outlasts_a_shorter_interval(clock):
+    polls = scheduler()
+    polls.record('assets', changed=True, retry_after=30)
+    assert polls.next_due['assets'] == clock.now + 30
+    polls.record('assets', changed=True, retry_after=1)
+    assert polls.next_due['assets'] == clock.now + 5
+
+
+def test_jitter_stays_within_its_band(clock):
+    polls = scheduler(jitter=0.1)
+    for _ in range(50):
+        polls.record('assets', changed=True)
+        assert 4.5 <= polls.next_due['assets'] - clock.now <= 5.5
@@ -0,0 +1,115 @@
+from datetime import datetime
+
+import pytest
+
+import mock_server
+from snipelzy import LocalSearch, SearchIndex
+
+
+def user(record_id, username, email='', first_name='', last_name=''):
+    return {'id': record_id, 'username': username, 'email': email, 'first_name': first_name, 'last_name': last_name}
+
+
+def indexed(*users):
+    index = SearchIndex()
+    for record in users:
+        index.add('users', record)
+    return index
+
+
+def found(index, term, **options):
+    return [record['id'] for record in index.search(term, **options)['users']]
+
+
+# SearchIndex
+
+def test_trigram_candidates_are_confirmed_by_substring():
+    # "abcxbcd" has both trigrams of "abcd" but not the string itself
+    index = indexed(user(1, 'abcxbcd'), user(2, 'zabcdz'), user(3, 'unrelated'))
+    assert found(index, 'abcd') == [2]
+    assert found(index, 'ABCD') == [2]
+    assert found(index, 'qqqq') == []
+
+
+class CountingTexts(list):
+    def __init__(self, texts):
+        super().__init__(texts)
+        self.read = []
+
+    def __getitem__(self, doc):
+        self.read.append(doc)
+        return super().__getitem__(doc)
+
+
+def test_only_documents_with_every_trigram_are_checked():
+    index = indexed(*(user(i, f"common{i}") for i in range(1, 200)), user(500, 'rare-common'))
+    index.texts = CountingTexts(index.texts)
+    assert found(index, 'rare-c') == [500]
+    assert index.texts.read == [199]
+
+
+@pytest.mark.parametrize('term, expected', [('', [1, 2, 3]), ('b', [1, 2]), ('BO', [1, 2]), ('ob', [2])])
+def test_queries_shorter_than_a_trigram_scan_every_document(term, expected):
+    index = indexed(user(1, 'bo'), user(2, 'bob'), user(3, 'carol'))
+    assert found(index, term) == expected
+
+
+def test_results_are_limited_per_resource():
+    index = indexed(*(user(i, f"user{i}") for i in range(1, 11)))
+    index.add('licenses', {'id': 1, 'name': 'user seat', 'product_key': ''})
+    results = index.search('user', limit=3)
+    assert [record['id'] for record in results['users']] == [1, 2, 3]
+    assert len(results['licenses']) == 1
+
+
+def test_updated_and_removed_records_stop_matching_their_old_text():
+    index = indexed(user(1, 'alice'), user(2, 'bob'), user(3, 'carol'), user(4, 'dave'))
+    index.update('users', [user(1, 'alicia')], [user(2, 'bob')])
+    assert found(index, 'alice') == []
+    assert found(index, 'alicia') == [1]
+    assert found(index, 'bob') == []
+    assert len(index) == 3
+
+
+def test_index_is_rebuilt_once_tombstones_pile_up():
+    index = indexed(*(user(i, f"user{i}") for i in range(1, 9)))
+    index.update('users', [user(1, 'renamed1')], [])
+    assert len(index.texts) == 9
+    index.update('users', [user(2, 'renamed2'), user(3, 'renamed3')], [])
+    # 3 superseded out of 11 passes the compaction ratio
+    assert len(index.texts) == len(index) == 8
+    assert found(index, 'renamed') == [1, 2, 3]
+    assert found(index, 'user') == [4, 5, 6, 7, 8]
+
+
+# LocalSearch
+
+def asset_ids(search, term):
+    return [record['id'] for record in search.search(term)['assets']]
+
+
+@pytest.mark.parametrize('compact', [True, False])
+def test_local_search_follows_the_mirror_after_a_sync(client, server, monkeypatch, compact):
+    make, text = mock_server.RESOURCES['hardware']
+
+    def renamed(record_id, rng):
+        record = make(record_id, rng)
+        if record_id == 13:
+            record['name'] = 'renamed-box'
+        return record
+
+    search = LocalSearch(client, compact=compact)
+    search.refresh()
+    assert asset_ids(search, 'tag-0000012') == [12]
+    assert asset_ids(search, 'renamed') == []
+
+    monkeypatch.setitem(mock_server.RESOURCES, 'hardware', (renamed, text))
+    with server.inventory.lock:
+        server.inventory.touched['hardware'][13] = (datetime.now(), 'Deployed', 0)
+    client._request('DELETE', '/hardware/12')
+    search.refresh()
+    assert asset_ids(search, 'tag-0000012') == []
+    assert asset_ids(search, 'renamed') == [13]
+    assert 13 not in asset_ids(search, 'host-13')
+    # 1999 assets, 200 licenses and 400 users
+    assert len(search.index) == 2599
@@ -0,0 +1,34 @@
+import pytest
+
+import snipelzy
+from snipelzy import StatsAggregator
+
+ODD_ASSETS = [
+    {'id': 1, 'status_label': None, 'category': None, 'location': {'name': 'HQ'}, 'model': {'name': 5}},
+    {'id': 2, 'status_label': {'status_meta': 'deployed'}, 'category': {'name': ''}, 'model': {'name': '5'}},
+    {'id': 3, 'status_label': {'status_meta': 'deployable'}, 'category': {'name': 'Laptops'},
+     'location': {'name': 'Büro Zürich'}, 'model': {}},
+]
+ODD_LICENSES = [{'id': 1, 'seats': '10', 'free_seats_count': None}, {'id': 2, 'seats': 'n/a', 'free_seats_count': 3}]
+
+
+def aggregated(client, vectorized):
+    stats = StatsAggregator(vectorized=vectorized)
+    for resource in ('assets', 'licenses', 'users'):
+        stats.consume(resource, client.iter_rows(resource, workers=4))
+    stats.consume('assets', ODD_ASSETS)
+    stats.consume('licenses', ODD_LICENSES)
+    return stats
+
+
+def test_numpy_and_pure_python_folds_agree(client, monkeypatch):
+    pytest.importorskip('numpy')
+    # Small batches, so per-batch results are merged many times over
+    monkeypatch.setattr(snipelzy, 'STATS_BATCH_ROWS', 128)
+    fast, plain = aggregated(client, True), aggregated(client, False)
+    assert (fast.vectorized, plain.vectorized) == (True, False)
+    assert fast.values() == plain.values()
+    assert fast.values()['assets.total'] == 2003
+    assert fast.groups == plain.groups
+    for label, _ in snipelzy.STATS_GROUP_BY:
+        assert fast.top_groups(label, None) == plain.top_groups(label, None)
@@ -0,0 +1,15 @@
+import contextlib
+import io
+import re
+
+from snipelzy import UI
+
+
+def test_table_border_matches_the_row_width():
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        UI.print_table(['ID', 'Name', 'Status'], [[1, 'alpha', 'Deployed'], [22, 'b', 'Pending']], 'Assets')
+    lines = [re.sub(r'\x1b\[[0-9;]*m', '', line) for line in out.getvalue().splitlines()]
+    framed = [line for line in lines if line and line[0] in '┏┃┣┗']
+    assert len(framed) == 6
+    assert len({len(line) for line in framed}) == 1